@@ -0,0 +1,198 @@
+# +---------------------------------------------------------------------------+
+#
+# Compiled Kernels for the Scalar Loops
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  Some loops cannot be vectorized because each pass needs the
+#               one before it, such as the sweeps of the cubic spline, the
+#               columns of LU elimination and the steps of an ODE solver.
+#               When Numba is installed those loops are compiled to machine
+#               code the first time they run, and the compiled code is cached
+#               on disk so later runs start with it.  Without Numba, or with
+#               the backend set to "python", the same functions run as plain
+#               Python and NumPy.
+#
+#               The backend is "numba" unless the M410_BACKEND environment
+#               variable or setBackend says "python".  Numba itself is only
+#               imported when a kernel is first needed.  "m410-benchmark
+#               backends" checks that both backends give the same results.
+#
+# +---------------------------------------------------------------------------+
+
+import os
+import sys
+
+
+
+# The backends setBackend accepts.
+BACKENDS = ("numba", "python")
+
+_backend = os.environ.get("M410_BACKEND", "numba")
+
+# Numba, once it has been looked for, False if it is not installed.
+_numba = None
+
+# The compiled version of each kernel, by the Python function.
+_compiled = {}
+
+
+
+#
+#   Set Backend
+#   Description:
+#       Picks the backend for every kernel from now on, "numba" or "python".
+#       "numba" quietly means "python" when Numba is not installed.
+#
+def setBackend(name):
+    global _backend
+
+    if name not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}")
+    _backend = name
+
+
+
+#
+#   Active Backend
+#   Description:
+#       The backend the kernels actually use, "numba" only when it was asked
+#       for and Numba is installed.
+#
+def activeBackend():
+    return "numba" if _backend == "numba" and _findNumba() else "python"
+
+
+
+#
+#   Find Numba
+#   Description:
+#       Numba, imported the first time it is asked for, or False.
+#
+def _findNumba():
+    global _numba
+
+    if _numba is None:
+        try:
+            import numba
+            _numba = numba
+        except ImportError:
+            _numba = False
+
+    return _numba
+
+
+
+#
+#   Compiled
+#   Description:
+#       The compiled version of function, or None when the backend is
+#       "python".  function must be written in the subset of Python and NumPy
+#       that Numba compiles, mostly loops over arrays.  It is compiled on its
+#       first call for each combination of argument types.
+#
+def compiled(function):
+    if _backend != "numba" or not _findNumba():
+        return None
+
+    if function not in _compiled:
+        _compiled[function] = _numba.njit(cache=True)(function)
+    return _compiled[function]
+
+
+
+#
+#   Accelerated
+#   Description:
+#       A decorator for a kernel that is its own fallback, a loop that runs
+#       either compiled or as plain Python with the same results.
+#
+def accelerated(function):
+    def kernel(*args):
+        return (compiled(function) or function)(*args)
+
+    kernel.python = function
+    kernel.__name__ = function.__name__
+    kernel.__doc__ = function.__doc__
+    return kernel
+
+
+
+#
+#   Is Compiled
+#   Description:
+#       Whether func was compiled by Numba, so a compiled kernel can call it.
+#       Never imports Numba, a compiled func means it is already imported.
+#
+def isCompiled(func):
+    numba = sys.modules.get("numba")
+    return numba is not None and isinstance(func, numba.core.dispatcher.Dispatcher)
+
+
+
+#
+#   Check Backends
+#   Description:
+#       Runs every kernel on both backends for a range of sizes and compares
+#       the results.  The spline, divided difference, LU and batched 3x3
+#       kernels do the same operations in the same order on both, so their
+#       results must be identical.  The Runge-Kutta kernel sums its stages
+#       in a loop where NumPy uses a dot product, so it may differ by
+#       rounding.
+#   Output:
+#       rows: One dictionary per kernel and size, with the largest difference
+#             and the time each backend took.
+#
+def checkBackends(sizes=(4, 32, 256)):
+    import time
+
+    import numpy as np
+
+    from .interpolation.CubicNatural import CubicNatural
+    from .interpolation.Interpolation import diff
+    from .linalg.MatrixOps import batchSolve, luFactor
+    from .ode.RungeKutta import TABLEAUX, explicitRungeKutta
+
+    if not _findNumba():
+        raise RuntimeError("Numba is not installed, so there is only one backend")
+
+    rng = np.random.default_rng(410)
+    numba = _findNumba()
+    decay = numba.njit(lambda x, y: np.cos(x) - y)
+
+    cases = []
+    for n in sizes:
+        x = np.cumsum(rng.uniform(0.1, 1, n))
+        y = rng.standard_normal(n)
+        matrix = rng.standard_normal((n, n))
+        batch = rng.standard_normal((n, 3, 3))
+        rhs = rng.standard_normal((n, 3))
+        cases += [
+            ("CubicNatural", n, lambda x=x, y=y: CubicNatural(x, y), 0),
+            ("diff", n, lambda x=x[:min(n, 32)], y=y[:min(n, 32)]: diff(x, y), 0),
+            ("luFactor", n, lambda matrix=matrix: luFactor(matrix)[0], 0),
+            ("batchSolve", n, lambda batch=batch, rhs=rhs: batchSolve(batch, rhs), 0),
+            ("explicitRungeKutta", n, lambda n=n: explicitRungeKutta(TABLEAUX["rk4"], decay, 0, np.ones(n), 0, 1, 1e-3)[1],
+             1e-12)
+        ]
+
+    previous = _backend
+    rows = []
+    try:
+        for name, n, run, tolerance in cases:
+            results = {}
+            seconds = {}
+            for backend in BACKENDS:
+                setBackend(backend)
+                run()
+                start = time.perf_counter()
+                results[backend] = np.array(run(), dtype=float)
+                seconds[backend] = time.perf_counter() - start
+
+            difference = float(np.max(np.abs(results["numba"] - results["python"]), initial=0))
+            scale = float(np.max(np.abs(results["python"]), initial=1))
+            rows.append({"kernel": name, "n": n, "difference": difference, "passed": difference <= tolerance * scale,
+                         "numbaSeconds": seconds["numba"], "pythonSeconds": seconds["python"]})
+    finally:
+        setBackend(previous)
+
+    return rows
+
@@ -0,0 +1,633 @@
+# +---------------------------------------------------------------------------+
+#
+# Result Cache
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  Remembers the results of the methods that are often run again
+#               with the same inputs, such as the spline fit of a data file or
+#               an initial value problem that every job solves.  Inside "with
+#               caching(...)" every memoized method hashes its arguments, and
+#               a call it has seen before returns the result it got then.
+#
+#               A cache has two tiers.  The most recently used results are
+#               kept in memory, and with a directory every result is also
+#               written there as .npy files that are memory-mapped when read,
+#               so other processes and later runs share it.  Each tier drops
+#               its least recently used results when it grows past its size.
+#               Entries are written to a temporary directory and renamed into
+#               place, so any number of processes can share one directory
+#               without locks.
+#
+#               The key is a hash of the method, its code and every argument,
+#               including functions such as f(x, y), which are hashed by
+#               their code, constants and the globals they use.  A call with
+#               an argument that cannot be hashed this way, or a result that
+#               is not arrays, numbers and strings, is simply not cached.
+#               The cache keeps read-only copies of the arrays in a result,
+#               and both the call that stores a result and every hit return
+#               those, so no caller can change what the next one gets and a
+#               result behaves the same whether or not it was cached.  A hit
+#               is recorded as a span of the method, marked with its tier,
+#               when an instrument is active.
+#
+#               With no cache active a memoized method pays for one lookup.
+#
+# +---------------------------------------------------------------------------+
+
+import collections
+import contextlib
+import contextvars
+import functools
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import types
+
+import numpy as np
+
+from .Instrumentation import startSpan, endSpan
+
+
+
+# The cache of the innermost "with caching(...)", or None.
+_active = contextvars.ContextVar("cache", default=None)
+
+# The counters kept for each memoized method.
+COUNTERS = ("memoryHits", "diskHits", "misses", "uncacheable")
+
+# Temporary directories older than this many seconds were left by a process
+# that stopped while writing, and are removed.
+STALE_SECONDS = 3600
+
+
+
+#
+#   Uncacheable
+#   Description:
+#       Raised while hashing an argument or storing a result that the cache
+#       cannot handle, so the call runs without it.
+#
+class _Uncacheable(Exception):
+    pass
+
+
+
+#
+#   Make Cache
+#   Description:
+#       A new cache, stored as a dictionary.
+#   Parameters:
+#       directory: Where the disk tier is kept, created if needed, or None
+#                  for a cache in memory only.
+#       memoryItems: The most results kept in memory.
+#       memoryBytes: The most bytes of arrays kept in memory.
+#       diskBytes: The most bytes of files kept in the directory.
+#   Output:
+#       cache: The cache, for caching.
+#
+def makeCache(directory=None, memoryItems=128, memoryBytes=256 * 2**20, diskBytes=2 * 2**30):
+    if memoryItems < 0 or memoryBytes < 0 or diskBytes < 0:
+        raise ValueError("Cache sizes cannot be negative")
+
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+
+    return {
+        "directory": directory,
+        "memoryItems": memoryItems,
+        "memoryBytes": memoryBytes,
+        "diskBytes": diskBytes,
+        "memory": collections.OrderedDict(),
+        "bytesInMemory": 0,
+        "stats": {},
+        "evictions": 0,
+        "diskEvictions": 0,
+        "lock": threading.Lock()
+    }
+
+
+
+#
+#   Caching
+#   Description:
+#       Makes cache the active one for the with block, in this thread or
+#       task.  Blocks can be nested, the innermost cache wins.
+#
+@contextlib.contextmanager
+def caching(cache):
+    token = _active.set(cache)
+    try:
+        yield cache
+    finally:
+        _active.reset(token)
+
+
+
+#
+#   Memoized
+#   Description:
+#       A decorator for a method whose result depends only on its arguments.
+#       Arguments are matched to the method's parameters first, so passing
+#       one by name or leaving out a default gives the same key.  A result
+#       that is cached is returned with read-only arrays, on the call that
+#       stores it as on every hit.
+#
+def memoized(function):
+    signature = inspect.signature(function)
+    version = None
+
+    @functools.wraps(function)
+    def method(*args, **kwargs):
+        nonlocal version
+        cache = _active.get()
+        if cache is None:
+            return function(*args, **kwargs)
+
+        if version is None:
+            version = _implementationHash(function)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        try:
+            key = cacheKey(version, bound.arguments)
+        except _Uncacheable:
+            _count(cache, function.__qualname__, "uncacheable")
+            return function(*args, **kwargs)
+
+        tier, result = _lookUp(cache, key)
+        if tier is not None:
+            _count(cache, function.__qualname__, tier)
+            endSpan(startSpan(function.__name__, cache=tier))
+            return result
+
+        result = function(*args, **kwargs)
+        try:
+            result = _store(cache, key, result)
+            _count(cache, function.__qualname__, "misses")
+        except _Uncacheable:
+            _count(cache, function.__qualname__, "uncacheable")
+        return result
+
+    return method
+
+
+
+#
+#   Cache Stats
+#   Description:
+#       The hits and misses of every memoized method that used cache.
+#   Output:
+#       stats: A dictionary of each method's counters by name, and "total"
+#              with the counters of all of them, its "hitRate", the
+#              "evictions" from memory and the "diskEvictions".
+#
+def cacheStats(cache):
+    with cache["lock"]:
+        stats = {name: dict(counters) for name, counters in cache["stats"].items()}
+
+        total = {counter: sum(counters[counter] for counters in stats.values()) for counter in COUNTERS}
+        lookups = total["memoryHits"] + total["diskHits"] + total["misses"]
+        total["hitRate"] = (total["memoryHits"] + total["diskHits"]) / lookups if lookups else 0.0
+        total["evictions"] = cache["evictions"]
+        total["diskEvictions"] = cache["diskEvictions"]
+        total["memoryItems"] = len(cache["memory"])
+        total["memoryBytes"] = cache["bytesInMemory"]
+
+    stats["total"] = total
+    return stats
+
+
+
+#
+#   Clear Cache
+#   Description:
+#       Forgets every result in memory and, when disk is True, removes the
+#       directory's entries too.  The counters are kept.
+#
+def clearCache(cache, disk=False):
+    with cache["lock"]:
+        cache["memory"].clear()
+        cache["bytesInMemory"] = 0
+
+    if disk and cache["directory"] is not None:
+        for name in os.listdir(cache["directory"]):
+            _removeEntry(cache["directory"], name)
+
+
+
+#
+#   Cache Key
+#   Description:
+#       The hash of a method's version and its arguments, the name of its
+#       entry in both tiers.
+#   Parameters:
+#       version: The hash of the method, from _implementationHash.
+#       arguments: The arguments by parameter name.
+#
+def cacheKey(version, arguments):
+    digest = hashlib.blake2b(version.encode(), digest_size=20)
+    _feed(digest, arguments, set())
+    return digest.hexdigest()
+
+
+
+#
+#   Implementation Hash
+#   Description:
+#       A hash of the package version, a method's code and the code of every
+#       function of the package it uses, directly or through other functions,
+#       such as the kernels of Acceleration.  A fix to any of them changes the
+#       key, so an entry written by an older version is never found.
+#
+def _implementationHash(function):
+    from . import __version__
+
+    digest = hashlib.blake2b(__version__.encode(), digest_size=20)
+    _feedImplementation(digest, function, set())
+    return digest.hexdigest()
+
+
+
+#
+#   Feed Implementation
+#   Description:
+#       Adds a function's code to digest, then the functions of the package
+#       and the numbers and strings named in it.  The wrappers of memoized and
+#       Acceleration.accelerated stand for the function they wrap.
+#
+def _feedImplementation(digest, function, seen):
+    function = getattr(function, "__wrapped__", None) or getattr(function, "python", None) or function
+    if not isinstance(function, types.FunctionType) or id(function) in seen:
+        return
+    seen.add(id(function))
+
+    digest.update(f"function:{function.__module__}.{function.__qualname__};".encode())
+    names = _feedCode(digest, function.__code__)
+
+    package = __name__.split(".")[0]
+    for name in sorted(names):
+        value = function.__globals__.get(name)
+        if isinstance(value, (bool, int, float, str)):
+            digest.update(f"global:{name};".encode())
+            _feed(digest, value, seen)
+        elif callable(value) and getattr(value, "__module__", "").split(".")[0] == package:
+            _feedImplementation(digest, value, seen)
+
+
+
+#
+#   Feed
+#   Description:
+#       Adds value to digest.  Every value starts with its type, so 1, 1.0,
+#       "1" and [1] all hash differently.  seen holds the functions already
+#       being hashed, so a function that calls itself ends.
+#
+def _feed(digest, value, seen):
+    if isinstance(value, (np.ndarray, np.generic)):
+        if value.dtype.hasobject:
+            raise _Uncacheable("object arrays cannot be hashed")
+        digest.update(f"array:{value.dtype.str}:{np.shape(value)};".encode())
+        digest.update(np.ascontiguousarray(value).data)
+
+    elif value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+
+    elif isinstance(value, (list, tuple)):
+        #A list of numbers is the same data as the array it makes.
+        array = np.asarray(value) if isinstance(value, list) and _isNumeric(value) else None
+        if array is not None:
+            _feed(digest, array, seen)
+        else:
+            digest.update(f"{type(value).__name__}:{len(value)};".encode())
+            for item in value:
+                _feed(digest, item, seen)
+
+    elif isinstance(value, dict):
+        digest.update(f"dict:{len(value)};".encode())
+        for key in sorted(value, key=repr):
+            _feed(digest, key, seen)
+            _feed(digest, value[key], seen)
+
+    elif isinstance(value, types.ModuleType):
+        digest.update(f"module:{value.__name__};".encode())
+
+    elif isinstance(value, (type, types.BuiltinFunctionType, np.ufunc)):
+        #Classes and built-in functions are known by their names.
+        name = value.__qualname__ if isinstance(value, type) else value.__name__
+        digest.update(f"builtin:{getattr(value, '__module__', None)}.{name};".encode())
+
+    elif hasattr(value, "py_func"):
+        #A function compiled by Numba is the same as its Python function.
+        _feed(digest, value.py_func, seen)
+
+    elif isinstance(value, functools.partial):
+        digest.update(b"partial;")
+        _feed(digest, (value.func, value.args, value.keywords), seen)
+
+    elif isinstance(value, types.FunctionType):
+        _feedFunction(digest, value, seen)
+
+    else:
+        raise _Uncacheable(f"{type(value).__name__} cannot be hashed")
+
+
+
+#
+#   Is Numeric
+#   Description:
+#       Whether a list holds only numbers, or lists of them, that NumPy turns
+#       into an ordinary array.
+#
+def _isNumeric(values):
+    try:
+        return np.asarray(values).dtype.kind in "biufc"
+    except ValueError:
+        return False
+
+
+
+#
+#   Feed Function
+#   Description:
+#       Adds a function to digest: its name, code, defaults, the values it
+#       closes over and the globals its code uses.  A global that cannot be
+#       hashed makes the function uncacheable, since the result may depend
+#       on it.
+#
+def _feedFunction(digest, function, seen):
+    digest.update(f"function:{function.__module__}.{function.__qualname__};".encode())
+    if id(function) in seen:
+        return
+    seen.add(id(function))
+
+    names = _feedCode(digest, function.__code__)
+    _feed(digest, (function.__defaults__, function.__kwdefaults__), seen)
+
+    for cell in function.__closure__ or ():
+        try:
+            _feed(digest, cell.cell_contents, seen)
+        except ValueError:
+            digest.update(b"empty;")
+
+    for name in sorted(names):
+        if name in function.__globals__:
+            digest.update(f"global:{name};".encode())
+            _feed(digest, function.__globals__[name], seen)
+
+
+
+#
+#   Feed Code
+#   Description:
+#       Adds a code object and the code objects nested in it to digest.
+#   Output:
+#       names: Every global or attribute name the code uses.
+#
+def _feedCode(digest, code):
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            names |= _feedCode(digest, constant)
+        else:
+            digest.update(f"{type(constant).__name__}:{constant!r};".encode())
+
+    return names
+
+
+
+#
+#   Count
+#   Description:
+#       Adds one to a method's counter.
+#
+def _count(cache, name, counter):
+    with cache["lock"]:
+        counters = cache["stats"].setdefault(name, dict.fromkeys(COUNTERS, 0))
+        counters[counter] += 1
+
+
+
+#
+#   Look Up
+#   Description:
+#       Finds a result in memory and then on disk.  A result found on disk is
+#       kept in memory too.
+#   Output:
+#       tier: "memoryHits", "diskHits" or None when the result is in neither.
+#       result: The result, or None.
+#
+def _lookUp(cache, key):
+    with cache["lock"]:
+        entry = cache["memory"].get(key)
+        if entry is not None:
+            cache["memory"].move_to_end(key)
+            return "memoryHits", _decode(*entry)
+
+    if cache["directory"] is None:
+        return None, None
+
+    path = os.path.join(cache["directory"], key)
+    try:
+        with open(os.path.join(path, "result.json")) as file:
+            tree = json.load(file)
+        arrays = [np.load(os.path.join(path, f"{i}.npy"), mmap_mode="r").view(np.ndarray)
+                  for i in range(tree["arrays"])]
+        os.utime(path)
+    except (OSError, ValueError):
+        #Not written yet, or removed by another process while being read.
+        return None, None
+
+    _remember(cache, key, tree["result"], arrays)
+    return "diskHits", _decode(tree["result"], arrays)
+
+
+
+#
+#   Store
+#   Description:
+#       Keeps a new result in memory and, with a directory, on disk.  Its
+#       arrays are copied and the copies made read-only.
+#   Output:
+#       result: The result as a hit would return it, with those copies.
+#
+def _store(cache, key, result):
+    arrays = []
+    tree = _encode(result, arrays)
+    for i, array in enumerate(arrays):
+        if isinstance(array, np.ndarray):
+            arrays[i] = array.copy()
+            arrays[i].flags.writeable = False
+
+    _remember(cache, key, tree, arrays)
+    if cache["directory"] is not None:
+        _write(cache, key, tree, arrays)
+        _evictFromDisk(cache)
+
+    return _decode(tree, arrays)
+
+
+
+#
+#   Remember
+#   Description:
+#       Puts a result in memory, dropping the least recently used results
+#       until both limits are met.
+#
+def _remember(cache, key, tree, arrays):
+    size = sum(array.nbytes for array in arrays)
+
+    with cache["lock"]:
+        if key in cache["memory"]:
+            cache["memory"].move_to_end(key)
+            return
+        if size > cache["memoryBytes"] or cache["memoryItems"] == 0:
+            return
+
+        cache["memory"][key] = (tree, arrays)
+        cache["bytesInMemory"] += size
+
+        while len(cache["memory"]) > cache["memoryItems"] or cache["bytesInMemory"] > cache["memoryBytes"]:
+            oldTree, oldArrays = cache["memory"].popitem(last=False)[1]
+            cache["bytesInMemory"] -= sum(array.nbytes for array in oldArrays)
+            cache["evictions"] += 1
+
+
+
+#
+#   Write
+#   Description:
+#       Writes an entry to a new temporary directory and renames it into
+#       place.  If another process wrote the same entry first, its copy is
+#       kept and this one removed.
+#
+def _write(cache, key, tree, arrays):
+    directory = cache["directory"]
+    path = os.path.join(directory, key)
+    if os.path.isdir(path):
+        return
+
+    temporary = tempfile.mkdtemp(prefix=".tmp-", dir=directory)
+    try:
+        for i, array in enumerate(arrays):
+            np.save(os.path.join(temporary, f"{i}.npy"), array)
+        with open(os.path.join(temporary, "result.json"), "w") as file:
+            json.dump({"arrays": len(arrays), "result": tree}, file)
+        os.rename(temporary, path)
+    except OSError:
+        shutil.rmtree(temporary, ignore_errors=True)
+
+
+
+#
+#   Evict From Disk
+#   Description:
+#       Removes the least recently used entries until the directory is within
+#       its size, and any temporary directory left by a stopped process.
+#
+def _evictFromDisk(cache):
+    directory = cache["directory"]
+    entries = []
+    total = 0
+
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        try:
+            if name.startswith(".tmp-"):
+                if time.time() - os.path.getmtime(path) > STALE_SECONDS:
+                    shutil.rmtree(path, ignore_errors=True)
+                continue
+            size = sum(entry.stat().st_size for entry in os.scandir(path))
+            entries.append((os.path.getmtime(path), size, name))
+            total += size
+        except OSError:
+            continue
+
+    for modified, size, name in sorted(entries):
+        if total <= cache["diskBytes"]:
+            break
+        if _removeEntry(directory, name):
+            with cache["lock"]:
+                cache["diskEvictions"] += 1
+        total -= size
+
+
+
+#
+#   Remove Entry
+#   Description:
+#       Renames an entry out of the way before removing it, so no process
+#       reads half of it.  Processes that already mapped its arrays keep them.
+#   Output:
+#       removed: False when another process removed it first.
+#
+def _removeEntry(directory, name):
+    path = os.path.join(directory, name)
+    if name.startswith(".tmp-"):
+        shutil.rmtree(path, ignore_errors=True)
+        return False
+
+    doomed = tempfile.mkdtemp(prefix=".tmp-", dir=directory)
+    try:
+        os.rename(path, os.path.join(doomed, name))
+        return True
+    except OSError:
+        return False
+    finally:
+        shutil.rmtree(doomed, ignore_errors=True)
+
+
+
+#
+#   Encode
+#   Description:
+#       The structure of a result as JSON, with its arrays appended to
+#       arrays and replaced by their index.  Numbers, strings and None are
+#       kept in the JSON, as are tuples, lists and dictionaries of them.
+#
+def _encode(value, arrays):
+    if isinstance(value, (np.ndarray, np.generic)):
+        if value.dtype.hasobject:
+            raise _Uncacheable("object arrays cannot be stored")
+        arrays.append(value)
+        return {"scalar" if isinstance(value, np.generic) else "array": len(arrays) - 1}
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"value": value}
+
+    if isinstance(value, (tuple, list)):
+        return {type(value).__name__: [_encode(item, arrays) for item in value]}
+
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        return {"dict": {key: _encode(item, arrays) for key, item in value.items()}}
+
+    raise _Uncacheable(f"{type(value).__name__} cannot be stored")
+
+
+
+#
+#   Decode
+#   Description:
+#       The result that _encode took apart.  The containers are new each
+#       time, and the arrays are the read-only arrays of the cache.
+#
+def _decode(tree, arrays):
+    kind, content = next(iter(tree.items()))
+
+    if kind == "value":
+        return content
+    if kind == "array":
+        return arrays[content]
+    if kind == "scalar":
+        return arrays[content][()]
+    if kind == "tuple":
+        return tuple(_decode(item, arrays) for item in content)
+    if kind == "list":
+        return [_decode(item, arrays) for item in content]
+    return {key: _decode(item, arrays) for key, item in content.items()}
@@ -0,0 +1,236 @@
+# +---------------------------------------------------------------------------+
+#
+# Instrumentation for the Iterative Methods
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  One way to watch any of the iterative methods run, without
+#               changing how they are called.  Inside "with instrumented(...)"
+#               every instrumented method records a span with its wall-clock
+#               time and counters (iterations, function evaluations, an
+#               estimate of the flops), calls a callback after each
+#               iteration, and traces a sample of its iterations.  Events are
+#               kept in memory, streamed to a JSON lines file, or written as
+#               a Chrome trace (chrome://tracing, Perfetto).
+#
+#               With no instrument active a method pays for one lookup when
+#               it starts and one "is None" test per iteration.
+#
+# +---------------------------------------------------------------------------+
+
+import contextlib
+import contextvars
+import json
+import os
+import threading
+import time
+
+
+
+# The instrument of the innermost "with instrumented(...)", or None.
+_active = contextvars.ContextVar("instrument", default=None)
+
+
+
+#
+#   Make Instrument
+#   Description:
+#       A new instrument, stored as a dictionary.  Every event is a Chrome
+#       trace event, so the same dictionaries are kept in memory, written to
+#       the JSON lines file and written by writeChromeTrace.
+#   Parameters:
+#       callback: Called as callback(name, iteration, values) after every
+#                 iteration of every method, or None.  values is a dictionary
+#                 such as {"x": ..., "error": ...}, and is not kept.
+#       sampleEvery: Only every sampleEvery-th iteration is traced, spans and
+#                    counters are always recorded.
+#       jsonLines: A file that events are appended to as they happen, one JSON
+#                  object per line, or None.
+#       keepEvents: Whether events are also kept in instrument["events"].
+#   Output:
+#       instrument: The instrument, for instrumented.  instrument["counters"]
+#                   holds the running totals of each method by name.
+#
+def makeInstrument(callback=None, sampleEvery=1, jsonLines=None, keepEvents=True):
+    return {
+        "callback": callback,
+        "sampleEvery": sampleEvery,
+        "events": [] if keepEvents else None,
+        "counters": {},
+        "jsonLines": jsonLines,
+        "file": None,
+        "lock": threading.Lock()
+    }
+
+
+
+#
+#   Instrumented
+#   Description:
+#       Makes instrument the active one for the with block, in this thread or
+#       task.  Blocks can be nested, the innermost instrument wins.  The JSON
+#       lines file is flushed when the block ends.
+#
+@contextlib.contextmanager
+def instrumented(instrument):
+    token = _active.set(instrument)
+    try:
+        yield instrument
+    finally:
+        _active.reset(token)
+        if instrument["file"] is not None:
+            instrument["file"].flush()
+
+
+
+#
+#   Close Instrument
+#   Description:
+#       Closes the JSON lines file, if one was opened.
+#
+def closeInstrument(instrument):
+    if instrument["file"] is not None:
+        instrument["file"].close()
+        instrument["file"] = None
+
+
+
+#
+#   Now
+#   Description:
+#       The time in microseconds, the unit of Chrome trace events.
+#
+def _now():
+    return time.perf_counter_ns() / 1000
+
+
+
+#
+#   Emit
+#   Description:
+#       Records one event in memory and in the JSON lines file.
+#
+def _emit(instrument, event):
+    event["pid"] = os.getpid()
+    event["tid"] = threading.get_ident()
+
+    with instrument["lock"]:
+        if instrument["events"] is not None:
+            instrument["events"].append(event)
+        if instrument["jsonLines"] is not None:
+            if instrument["file"] is None:
+                instrument["file"] = open(instrument["jsonLines"], "a")
+            instrument["file"].write(json.dumps(event, default=_plain) + "\n")
+
+
+
+#
+#   Plain Value
+#   Description:
+#       What json makes of NumPy values, a number or a list.
+#
+def _plain(value):
+    return value.tolist() if hasattr(value, "tolist") else str(value)
+
+
+
+#
+#   Start Span
+#   Description:
+#       What an instrumented method calls when it starts.
+#   Parameters:
+#       name: The method's name, which its counters are kept under.
+#       args: Anything worth recording about the call, such as the size.
+#   Output:
+#       span: None when no instrument is active, so the method can skip
+#             everything else with one test.
+#
+def startSpan(name, **args):
+    instrument = _active.get()
+    if instrument is None:
+        return None
+
+    return {"instrument": instrument, "name": name, "start": _now(), "args": args,
+            "counters": {"iterations": 0, "functionEvaluations": 0, "flops": 0}}
+
+
+
+#
+#   Record Iteration
+#   Description:
+#       What an instrumented method calls after each iteration, when its span
+#       is not None.
+#   Parameters:
+#       span: The result of startSpan.
+#       index: The iteration number.
+#       values: The iteration's values for the callback and the trace,
+#               preferably numbers.
+#       evaluations: The function evaluations the iteration used.
+#       flops: An estimate of the floating point operations it used.
+#
+def recordIteration(span, index, values, evaluations=0, flops=0):
+    counters = span["counters"]
+    counters["iterations"] += 1
+    counters["functionEvaluations"] += evaluations
+    counters["flops"] += flops
+
+    instrument = span["instrument"]
+    if instrument["callback"] is not None:
+        instrument["callback"](span["name"], index, values)
+
+    if index % instrument["sampleEvery"] == 0:
+        _emit(instrument, {"name": span["name"], "cat": "iteration", "ph": "i", "s": "t", "ts": _now(),
+                           "args": dict(values, iteration=index)})
+
+
+
+#
+#   End Span
+#   Description:
+#       What an instrumented method calls when it finishes.  Records the span
+#       with its counters and adds them to the instrument's totals.
+#   Parameters:
+#       span: The result of startSpan, or None.
+#       args: Anything worth recording about the result.
+#
+def endSpan(span, **args):
+    if span is None:
+        return
+
+    instrument = span["instrument"]
+    end = _now()
+
+    with instrument["lock"]:
+        totals = instrument["counters"].setdefault(span["name"], {"calls": 0, "seconds": 0.0})
+        totals["calls"] += 1
+        totals["seconds"] += (end - span["start"]) / 1e6
+        for counter, value in span["counters"].items():
+            totals[counter] = totals.get(counter, 0) + value
+
+    _emit(instrument, {"name": span["name"], "cat": "method", "ph": "X", "ts": span["start"],
+                       "dur": end - span["start"], "args": {**span["args"], **span["counters"], **args}})
+
+
+
+#
+#   Write Chrome Trace
+#   Description:
+#       Writes the events kept in memory as a Chrome trace-event file, which
+#       chrome://tracing and ui.perfetto.dev open.  Spans show as bars, nested
+#       when one method calls another, and traced iterations as marks.
+#
+def writeChromeTrace(instrument, fileName):
+    if instrument["events"] is None:
+        raise ValueError("The instrument was made with keepEvents=False")
+
+    with open(fileName, "w") as file:
+        json.dump({"traceEvents": instrument["events"], "displayTimeUnit": "ms"}, file, default=_plain)
+
+
+
+#
+#   Read JSON Lines
+#   Description:
+#       The events of a JSON lines file written by an instrument.
+#
+def readJSONLines(fileName):
+    with open(fileName) as file:
+        return [json.loads(line) for line in file if line.strip()]
@@ -0,0 +1,232 @@
+# +---------------------------------------------------------------------------+
+#
+# Report Writer for Solver and Integrator Results
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  Writes tables of results in bulk instead of one print per row.
+#               Every row is formatted by a single string operation and written
+#               with a single call, and the console only gets a summary.
+#
+# +---------------------------------------------------------------------------+
+
+import json
+import os
+import re
+
+import numpy as np
+
+
+
+# Large enough that a report is written in one system call.
+BUFFER_SIZE = 1 << 20
+
+# Tables with at most this many rows are printed in full by summarize.
+SUMMARY_ROWS = 10
+
+# The files reportTable has written, so two tables with the same title in one
+# run do not overwrite each other.
+_reported = set()
+
+
+
+#
+#   Table Columns
+#   Description:
+#       Turns a dictionary of columns into names and one 2-D array.  A 2-D
+#       column, such as a matrix, becomes one column per entry of its rows.
+#   Parameters:
+#       columns: A dictionary of column name to array, all the same length.
+#   Output:
+#       names: The column names.
+#       table: A float array with one column per name.
+#
+def tableColumns(columns):
+    names = []
+    parts = []
+
+    for name, values in columns.items():
+        values = np.asarray(values, dtype=float)
+        if values.ndim <= 1:
+            names.append(name)
+            parts.append(values.reshape(-1, 1))
+        else:
+            values = values.reshape(len(values), -1)
+            names += [f"{name}[{i}]" for i in range(values.shape[1])]
+            parts.append(values)
+
+    if len({len(part) for part in parts}) > 1:
+        raise ValueError("All columns must have the same length")
+
+    return names, np.hstack(parts) if parts else np.zeros((0, 0))
+
+
+
+#
+#   Format Rows
+#   Description:
+#       Formats the whole table with one % operation, which runs in C rather
+#       than once per row in Python.
+#   Parameters:
+#       table: A 2-D float array.
+#       rowFormat: The format of one row, one % field per column.
+#
+def _formatRows(table, rowFormat):
+    if table.size == 0:
+        return ""
+    return (rowFormat * len(table)) % tuple(table.ravel().tolist())
+
+
+
+#
+#   Write CSV
+#   Description:
+#       Writes the columns to a CSV file, with full precision so the values
+#       read back exactly.
+#
+def writeCSV(fileName, columns):
+    names, table = tableColumns(columns)
+    rowFormat = ",".join(["%.17g"] * len(names)) + "\n"
+
+    with open(fileName, "w", buffering=BUFFER_SIZE) as file:
+        file.write(",".join(names) + "\n" + _formatRows(table, rowFormat))
+
+
+
+#
+#   Write Fixed Width
+#   Description:
+#       Writes the columns as a fixed-width text table, like the tables the
+#       demos used to print row by row.
+#   Parameters:
+#       width: The width of every column.
+#       digits: The significant digits shown.
+#
+def writeFixedWidth(fileName, columns, width=22, digits=15):
+    names, table = tableColumns(columns)
+    header = "".join(f"{name:<{width}}" for name in names).rstrip()
+    rowFormat = f"%-{width}.{digits}g" * (len(names) - 1) + f"%.{digits}g\n"
+
+    with open(fileName, "w", buffering=BUFFER_SIZE) as file:
+        file.write(header + "\n" + _formatRows(table, rowFormat))
+
+
+
+#
+#   Write NPZ
+#   Description:
+#       Writes each column to a NumPy .npz archive, keeping its shape.
+#
+def writeNPZ(fileName, columns):
+    np.savez(fileName, **{name: np.asarray(values) for name, values in columns.items()})
+
+
+
+#
+#   Write Columnar
+#   Description:
+#       Writes a directory with one .npy file per column and a schema.json, so
+#       a single column can be memory-mapped without reading the others.
+#
+def writeColumnar(directory, columns):
+    os.makedirs(directory, exist_ok=True)
+    schema = []
+
+    for i, (name, values) in enumerate(columns.items()):
+        values = np.asarray(values)
+        fileName = f"{i:03d}.npy"
+        np.save(os.path.join(directory, fileName), values)
+        schema.append({"name": name, "file": fileName, "dtype": str(values.dtype), "shape": list(values.shape)})
+
+    with open(os.path.join(directory, "schema.json"), "w") as file:
+        json.dump({"rows": len(next(iter(columns.values()), [])), "columns": schema}, file, indent=2)
+
+
+
+# File extension to writer, a name with no extension is a columnar directory.
+WRITERS = {
+    ".csv": writeCSV,
+    ".txt": writeFixedWidth,
+    ".npz": writeNPZ,
+    "": writeColumnar
+}
+
+
+
+#
+#   Write Report
+#   Description:
+#       Writes the columns in the format given by the file name's extension,
+#       .csv, .txt, .npz, or no extension for a columnar directory.
+#
+def writeReport(fileName, columns):
+    extension = os.path.splitext(fileName)[1].lower()
+
+    if extension not in WRITERS:
+        raise ValueError(f"Unknown report format {extension}")
+
+    WRITERS[extension](fileName, columns)
+
+
+
+#
+#   Summarize
+#   Description:
+#       A short description of a table for the console.  Small tables are
+#       shown in full, larger ones as the first, last, smallest and largest
+#       value of each column.
+#   Parameters:
+#       title: The heading of the summary.
+#       columns: A dictionary of column name to array.
+#   Output:
+#       text: The summary, ready to print.
+#
+def summarize(title, columns):
+    names, table = tableColumns(columns)
+    rows = len(table)
+    lines = [f"{title} ({rows} rows)"]
+
+    if rows <= SUMMARY_ROWS:
+        lines.append("".join(f"{name:<22}" for name in names).rstrip())
+        lines.append(_formatRows(table, "%-22.15g" * (len(names) - 1) + "%.15g\n").rstrip("\n"))
+    elif rows:
+        lines.append(f"{'':<22}{'First':<22}{'Last':<22}{'Min':<22}{'Max':<22}".rstrip())
+        with np.errstate(invalid="ignore"):
+            stats = np.column_stack((table[0], table[-1], np.nanmin(table, axis=0), np.nanmax(table, axis=0)))
+        for name, row in zip(names, stats):
+            lines.append(f"{name:<22}" + "%-22.15g%-22.15g%-22.15g%.15g" % tuple(row))
+
+    return "\n".join(lines)
+
+
+
+#
+#   Report Table
+#   Description:
+#       What the demos use in place of a print loop.  Writes the full table
+#       to a file named after the title in directory and prints a summary.
+#       The minus sign of a negative number in the title is kept as "minus"
+#       in the name, so titles that differ only in a sign get their own file.
+#   Parameters:
+#       title: The heading, also used to name the file.
+#       columns: A dictionary of column name to array.
+#       directory: Where the report files go.
+#       extension: The format of the file, see writeReport.
+#   Output:
+#       fileName: The file that was written.
+#
+def reportTable(title, columns, directory="reports", extension=".csv"):
+    os.makedirs(directory, exist_ok=True)
+
+    slug = re.sub(r"(^|[^a-z0-9.])-(?=\.?\d)", r"\1minus", title.lower())
+    slug = re.sub(r"[^a-z0-9.]+", "-", slug).strip("-")
+    fileName = os.path.join(directory, slug + extension)
+    copy = 1
+    while fileName in _reported:
+        copy += 1
+        fileName = os.path.join(directory, f"{slug}-{copy}{extension}")
+    _reported.add(fileName)
+    writeReport(fileName, columns)
+
+    print(summarize(title, columns))
+    print(f"Full table written to {fileName}\n")
+
+    return fileName
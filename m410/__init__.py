@@ -0,0 +1,36 @@
+# =========================================
+# M 410
+#
+# Authors: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description:  The numerical methods of the four group projects as one
+#               package.  m410.roots has the root finders of Group Project
+#               1, m410.interpolation the Newton and spline interpolation of
+#               Group Project 2, m410.ode the initial value problem solvers
+#               of Group Project 3 and m410.linalg the matrix routines of
+#               Group Project 4.  The demos of each project are the
+#               m410-project1 to m410-project4 commands.
+#
+#               Nothing is imported until it is used, so
+#
+#                   from m410.interpolation import evalCubicSpline
+#
+#               loads the interpolation code and NumPy and nothing else.
+#
+#               To watch the iterative methods run, see Instrumentation.  To
+#               reuse the results of spline fits and solver runs, see Cache.
+# =========================================
+
+from ._lazy import lazyExports
+
+__version__ = "1.0.0"
+
+__getattr__, __dir__ = lazyExports(__name__, {
+    ".roots": None,
+    ".interpolation": None,
+    ".ode": None,
+    ".linalg": None,
+    ".ReportWriter": ["reportTable"],
+    ".Instrumentation": ["makeInstrument", "instrumented", "closeInstrument", "writeChromeTrace", "readJSONLines"],
+    ".Cache": ["makeCache", "caching", "memoized", "cacheStats", "clearCache"]
+})
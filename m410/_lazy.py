@@ -0,0 +1,52 @@
+# =========================================
+# M 410
+#
+# Authors: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description:  Lets a package name everything it offers without importing
+#               any of it.  Each name is imported the first time it is used,
+#               so importing m410 or one of its subpackages costs almost
+#               nothing and NumPy, process pools and the like are only
+#               loaded by the code that needs them.
+# =========================================
+
+import importlib
+
+# ------------------
+# lazyExports
+# Description:
+#   The module-level __getattr__ and __dir__ for a package.  exports maps
+#   each submodule, relative to the package, to the names it provides, and
+#   a submodule listed with None is provided itself.  A name is imported on
+#   first use and then kept in the package like an ordinary import.  Every
+#   name also goes in the package's __all__, so "from package import *"
+#   imports them all.
+# Output:
+#   getAttribute: The package's __getattr__.
+#   listNames: The package's __dir__.
+# ------------------
+def lazyExports(package, exports):
+    names = {}
+    for module, provided in exports.items():
+        if provided is None:
+            names[module.lstrip(".")] = (module, None)
+        else:
+            names.update((name, (module, name)) for name in provided)
+
+    namespace = importlib.import_module(package).__dict__
+    namespace["__all__"] = list(names)
+
+    def getAttribute(name):
+        if name not in names:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module, attribute = names[name]
+        value = importlib.import_module(module, package)
+        if attribute is not None:
+            value = getattr(value, attribute)
+        namespace[name] = value
+        return value
+
+    def listNames():
+        return sorted(set(namespace) | set(names))
+
+    return getAttribute, listNames
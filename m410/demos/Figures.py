@@ -0,0 +1,273 @@
+# +---------------------------------------------------------------------------+
+#
+# Figure Rendering for the Demos
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  Lets a demo draw its figures with the usual pyplot calls
+#               without waiting on them.  A FigureRecorder stands in for
+#               matplotlib.pyplot and only records the calls, so every figure
+#               is plain data that renderFigures can send to worker processes.
+#               Each worker draws its figures on the Agg backend, with no
+#               display, and writes them straight to files named after their
+#               titles.
+#
+#               The hash of every figure's calls and data is stored next to
+#               the files, and a figure whose hash has not changed since the
+#               last run is not drawn again.  A figure with an argument that
+#               cannot be hashed has no hash and is always drawn.
+#
+# +---------------------------------------------------------------------------+
+
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from ..Cache import cacheKey, _Uncacheable
+
+
+
+# Where the demos write their figures, in the current directory.
+FIGURE_DIRECTORY = "figures"
+
+# The file in the figure directory that holds the hash of every figure.
+HASH_FILE = ".figures.json"
+
+# Resolution of the written figures.
+DPI = 100
+
+
+
+#
+#   Figure Recorder
+#   Description:
+#       Records pyplot calls.  figure() and subplots() start a new figure as
+#       they do in pyplot, and every other call, such as plot, scatter, title
+#       or legend, is recorded against the current figure.  subplots returns
+#       stand-ins for the figure and its axes that record their calls too.
+#
+class FigureRecorder:
+    def __init__(self):
+        self.figures = []
+
+    def figure(self, **kwargs):
+        self.figures.append({"kwargs": kwargs, "subplots": None, "calls": []})
+
+    def subplots(self, nrows=1, ncols=1, **kwargs):
+        self.figure()
+        figure = self.figures[-1]
+        figure["subplots"] = (nrows, ncols, kwargs)
+
+        axes = [[_Recorded(figure, "axes", row * ncols + column) for column in range(ncols)] for row in range(nrows)]
+        if nrows == 1 and ncols == 1:
+            axes = axes[0][0]
+        elif nrows == 1 or ncols == 1:
+            axes = [ax for row in axes for ax in row]
+
+        return _Recorded(figure, "figure"), axes
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if not self.figures:
+            self.figure()
+        return getattr(_Recorded(self.figures[-1], "pyplot"), name)
+
+
+
+#
+#   Recorded
+#   Description:
+#       A figure or axes of a FigureRecorder, every method call on it is
+#       recorded.
+#
+class _Recorded:
+    def __init__(self, figure, target, index=None):
+        self._figure = figure
+        self._target = target
+        self._index = index
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def record(*args, **kwargs):
+            self._figure["calls"].append((self._target, self._index, name, args, kwargs))
+
+        return record
+
+
+
+#
+#   Figure Name
+#   Description:
+#       The file name of a figure, from its title or, for subplots, its
+#       suptitle.  Characters that cannot be in a file name become "-".
+#
+def figureName(figure, number):
+    title = None
+    for target, index, name, args, kwargs in figure["calls"]:
+        if args and (name == "suptitle" or (target == "pyplot" and name == "title")):
+            title = str(args[0])
+            if name == "suptitle":
+                break
+
+    return re.sub(r'[\\/:*?"<>|]', "-", title) if title else f"Figure {number}"
+
+
+
+#
+#   Draw
+#   Description:
+#       Replays a recorded figure on a matplotlib Figure.  Calls made on
+#       pyplot go to the current axes, with the name of the Axes method that
+#       pyplot uses, so title becomes set_title and ylim set_ylim.
+#
+def _draw(fig, figure):
+    axes = []
+    if figure["subplots"] is not None:
+        nrows, ncols, kwargs = figure["subplots"]
+        axes = list(fig.subplots(nrows, ncols, squeeze=False, **kwargs).ravel())
+
+    for target, index, name, args, kwargs in figure["calls"]:
+        if target == "axes":
+            method = getattr(axes[index], name)
+        elif target == "figure":
+            method = getattr(fig, name)
+        else:
+            ax = fig.gca()
+            method = getattr(ax, "set_" + name, None) or getattr(ax, name)
+        method(*args, **kwargs)
+
+
+
+#
+#   Render Figure
+#   Description:
+#       Draws one figure on the Agg backend and writes it.  It is written to a
+#       temporary file first, so a figure is never left half written.  Uses
+#       the Figure class directly, not pyplot, so nothing is ever shown.
+#
+def _renderFigure(figure, fileName, dpi):
+    from matplotlib.figure import Figure
+
+    fig = Figure(**figure["kwargs"])
+    _draw(fig, figure)
+
+    fileType = os.path.splitext(fileName)[1][1:]
+    fig.savefig(fileName + ".tmp", dpi=dpi, format=fileType)
+    os.replace(fileName + ".tmp", fileName)
+
+
+
+#
+#   Render Figures
+#   Description:
+#       Writes every figure that changed since the last run, in parallel when
+#       there are several.  A figure is redrawn when its calls or data, the
+#       matplotlib version, the dpi or the file type are different, when
+#       its file is missing, or when one of its arguments cannot be hashed.
+#   Parameters:
+#       figures: The figures of a FigureRecorder.
+#       directory: Where the files are written, created if needed.
+#       fileType: The extension of the files, any format matplotlib writes.
+#       dpi: The resolution of the files.
+#       workers: The number of processes to use, 1 draws everything here.
+#   Output:
+#       written: The names of the files that were drawn.
+#       unchanged: The names of the files that were already up to date.
+#
+def renderFigures(figures, directory=FIGURE_DIRECTORY, fileType="png", dpi=DPI, workers=None):
+    import matplotlib
+
+    os.makedirs(directory, exist_ok=True)
+    hashFile = os.path.join(directory, HASH_FILE)
+    try:
+        with open(hashFile) as file:
+            hashes = json.load(file)
+    except (OSError, ValueError):
+        hashes = {}
+
+    version = f"{matplotlib.__version__} {dpi} {fileType}"
+    names = []
+    stale = []
+
+    for number, figure in enumerate(figures, start=1):
+        title = figureName(figure, number)
+        name = f"{title}.{fileType}"
+        copy = 1
+        while name in names:
+            copy += 1
+            name = f"{title} {copy}.{fileType}"
+        names.append(name)
+
+        try:
+            key = cacheKey(version, figure)
+        except _Uncacheable:
+            key = None
+        if key is None or hashes.get(name) != key or not os.path.exists(os.path.join(directory, name)):
+            stale.append((figure, name, key))
+
+    paths = [os.path.join(directory, name) for figure, name, key in stale]
+    if workers != 1 and len(stale) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count(), len(stale))) as pool:
+            list(pool.map(_renderFigure, [figure for figure, name, key in stale], paths, [dpi] * len(stale)))
+    else:
+        for (figure, name, key), path in zip(stale, paths):
+            _renderFigure(figure, path, dpi)
+
+    #Several demos can share the directory, so every other hash is kept.
+    for figure, name, key in stale:
+        if key is None:
+            hashes.pop(name, None)
+        else:
+            hashes[name] = key
+    with open(hashFile + ".tmp", "w") as file:
+        json.dump(hashes, file, indent=1)
+    os.replace(hashFile + ".tmp", hashFile)
+
+    written = [name for figure, name, key in stale]
+    return written, [name for name in names if name not in written]
+
+
+
+#
+#   Show Figures
+#   Description:
+#       Draws every figure with pyplot and shows them in windows, the way the
+#       demos used to.
+#
+def showFigures(figures):
+    import matplotlib.pyplot as plt
+
+    for figure in figures:
+        _draw(plt.figure(**figure["kwargs"]), figure)
+
+    plt.show()
+
+
+
+#
+#   Add Figure Arguments
+#   Description:
+#       The command line options of a demo with figures.
+#
+def addFigureArguments(parser):
+    parser.add_argument("--figures", default=FIGURE_DIRECTORY, help="where the figures are written")
+    parser.add_argument("--show", action="store_true", help="show the figures instead of writing them")
+    parser.add_argument("--workers", type=int, default=None, help="processes drawing the figures")
+
+
+
+#
+#   Finish Figures
+#   Description:
+#       What a demo does with its figures at the end, shows them or writes
+#       the ones that changed and prints how many there were.
+#
+def finishFigures(figures, arguments):
+    if arguments.show:
+        showFigures(figures)
+        return
+
+    written, unchanged = renderFigures(figures, arguments.figures, workers=arguments.workers)
+    print(f"\nFigures: {len(written)} written, {len(unchanged)} unchanged in {arguments.figures}")
@@ -0,0 +1,10 @@
+# =========================================
+# M 410
+#
+# Authors: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description:  The demos of the four group projects, each a main function
+#               installed as the m410-project1 to m410-project4 commands.
+#               They need matplotlib, which the library itself does not.
+#               Their figures are drawn by Figures.
+# =========================================
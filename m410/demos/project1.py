@@ -0,0 +1,153 @@
+# +--------------------------------------------------------------------------+
+# 
+# Group Project #1 for Numerical Computing S23
+#
+# Team Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description: Runs the root finders in m410.roots on the questions of the
+# project, writing each method's steps to the reports directory and printing
+# its answer.  Installed as the m410-project1 command.
+#
+# +--------------------------------------------------------------------------+
+
+import math
+
+from ..ReportWriter import reportTable
+from ..roots.rootFinder import newton, secant, falsePosition, fixedPointIteration
+
+
+
+# Report Newton's Method
+# Params:
+#   question: the question the run answers, to tell its report apart
+#   fn, der, initialGuess: the arguments of newton
+# Description:
+#   Runs Newton's method, writes its steps to a report and prints the root
+def reportNewton(question, fn, der, initialGuess):
+    root, history = newton(fn, der, initialGuess)
+    reportTable(f"Question {question}, Newton's Method, Initial Guess {initialGuess}", history)
+    
+    if root is None:
+        print("Max iterations reached, no root found\n")
+    else:
+        print(f"Root {root}\n")
+
+
+
+# Report Secant Method
+# Params:
+#   question: the question the run answers, to tell its report apart
+#   fn, xl, xu: the arguments of secant
+# Description:
+#   Runs the secant method, writes its steps to a report and prints the root
+def reportSecant(question, fn, xl, xu):
+    root, history = secant(fn, xl, xu)
+    reportTable(f"Question {question}, Secant Method, Initial Range [{xl}, {xu}]", history)
+    print(f"Root: {root}\n")
+
+
+
+# Report False Position Method
+# Params:
+#   question: the question the run answers, to tell its report apart
+#   fn, xl, xu: the arguments of falsePosition
+# Description:
+#   Runs the method of false position, writes its steps to a report and
+#   prints the root
+def reportFalsePosition(question, fn, xl, xu):
+    root, history = falsePosition(fn, xl, xu)
+    reportTable(f"Question {question}, Method of False Position, Initial Range [{xl}, {xu}]", history)
+    print(f"Root: {root}\n")
+
+
+
+# Report Fixed-Point Iteration
+# Params:
+#   question: the question the run answers, to tell its report apart
+#   fn, initialGuess, iterationCount: the arguments of fixedPointIteration
+# Description:
+#   Runs fixed point iteration, writes its steps to a report and prints the
+#   final fixed point
+def reportFixedPoint(question, fn, initialGuess, iterationCount):
+    point, history = fixedPointIteration(fn, initialGuess, iterationCount)
+    reportTable(f"Question {question}, Fixed Point Iteration, Initial Guess {initialGuess}", history)
+    print(f"Final Fixed Point: {point}\n")
+
+
+
+# Group Project 1
+# Description:
+#   Answers questions 1 to 3 of the project
+def main():
+    
+    # Question 1 --------------------------------------------------------------
+    # The given functions a, b, c, and d.
+    g1 = lambda x: x ** 3 - 6 * (x ** 2) + 10 * x - 4
+    g2 = lambda x: x ** 3 - 2.4 * x + 2.4
+    g3 = lambda x: x ** 3 - 2.9 * x + 2.9
+    g4 = lambda x: x ** 3 - 3 * x + 3
+    
+    # Printing the outputs for each function n' stuff.
+    print("Question 1.a -----------------------------------------------------")
+    reportFixedPoint("1.a", g1, 1.1, 50) #Output: 1.0059526030562829
+    
+    print("Question 1.b -----------------------------------------------------")
+    reportFixedPoint("1.b", g2, 1.1, 50) #Output: 1.000000000008191
+    
+    print("Question 1.c -----------------------------------------------------")
+    reportFixedPoint("1.c", g3, 1.1, 50) #Output: 1.0
+    
+    print("Question 1.d -----------------------------------------------------")
+    reportFixedPoint("1.d", g4, 1.1, 50) #Output: 1.0
+
+
+
+    # Question 2 --------------------------------------------------------------
+    q2a = lambda x: 2 * x ** 4 + 24 * x ** 3 + 61 * x ** 2 - 16 * x + 1
+    q2aDer = lambda x: 8 * x ** 3 + 72 * x ** 2 + 122 * x - 16
+    
+    q2b = lambda x: x ** 3 + 94 * x ** 2 - 389 * x + 294
+    q2bDer = lambda x: 3 * x ** 2 + 188 * x - 389
+    
+    q2c = lambda x: 0.5 + 0.25 * x ** 2 - x * math.sin(x) - 0.5 * math.cos(2 * x)
+    q2cDer = lambda x: 0.5 * x + math.sin(2 * x) - x * math.cos(x) - math.sin(x)
+    
+    print("Question 2.a -----------------------------------------------------")
+    reportNewton("2.a", q2a, q2aDer, 0.0)
+    reportNewton("2.a", q2a, q2aDer, 0.2)
+    
+    print("Question 2.b -----------------------------------------------------")
+    reportNewton("2.b", q2b, q2bDer, 2)
+    reportNewton("2.b", q2b, q2bDer, 2.2)
+    reportNewton("2.b", q2b, q2bDer, 1.8)
+    reportNewton("2.b", q2b, q2bDer, 1)
+    reportNewton("2.b", q2b, q2bDer, 3)
+    reportNewton("2.b", q2b, q2bDer, 0)
+    reportNewton("2.b", q2b, q2bDer, 4)
+    
+    print("Question 2.c -----------------------------------------------------")
+    reportNewton("2.c", q2c, q2cDer, 0.5 * math.pi)
+    reportNewton("2.c", q2c, q2cDer, 5 * math.pi)
+    
+    
+    
+    # Question 3 --------------------------------------------------------------
+    q3 = lambda x: 230 * x ** 4 + 18 * x ** 3 + 9 * x ** 2 - 221 * x - 6
+    q3Der = lambda x: 920 * x ** 3 + 54 * x ** 2 + 18 * x - 221
+    
+    print("Question 3.a -----------------------------------------------------")
+    reportNewton("3.a", q3, q3Der, -0.5)
+    reportNewton("3.a", q3, q3Der, 0.5)
+    
+    print("Question 3.b -----------------------------------------------------")
+    reportSecant("3.b", q3, -1, 0)
+    reportSecant("3.b", q3, 0, 1)
+    
+    print("Question 3.c -----------------------------------------------------")
+    reportFalsePosition("3.c", q3, -1, 0)
+    reportFalsePosition("3.c", q3, 0, 1)
+
+
+
+if __name__ == "__main__":
+    main()
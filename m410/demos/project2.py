@@ -6,83 +6,20 @@
 #
 # Description:  Uses Newton's interpolation method and the cubic spline 
 #               interpoloation methods to create and plot interploating 
-#               functions.
+#               functions.  The figures are written to the figures directory
+#               by Figures.renderFigures.
 #
 # +--------------------------------------------------------------------------+
 
-from CubicNatural import CubicNatural
-
-# Must install using pip install <module name>
-import numpy as np
-import matplotlib.pyplot as plt
-
+import argparse
+import os
 from math import cos, pi
 
+import numpy as np
 
-
-# Netwon's Divided Difference
-# Params:
-#   x: list, x part of coordinates
-#   y: list, y part of coordinates
-# Return:
-#   list, coefficients in the form [a0, a1, ... an]
-# Description:
-#   Uses Netwon's interpolation method to find the divided differences
-def diff(x, y):
-
-    if len(x) != len(y):
-        raise ValueError("Inputs x and y must have the same length")
-    
-    n = len(y)
-    coef = np.zeros([n, n])
-    
-    # The first column is y
-    coef[:, 0] = y
-    
-    for j in range(1, n):
-        for i in range(n - j):
-            coef[i][j] = (coef[i + 1][j - 1] - coef[i][j - 1]) / (x[i + j] - x[i])
-    
-    # First row contains all coefficients we need
-    return coef[0]
-
-
-
-# Netwon's Polynomial Interpolation Function
-# Params:
-#   x: list, x part of coordinates
-#   y: list, y part of coordinates
-# Return:
-#   function pointer, the interpolating function
-# Description:
-#   Uses Netwon's interpolation method to create an interpolating function
-def newtonPolynomialFunc(xVals, yVals):
-
-    coef = diff(xVals, yVals)
-    
-    func = f"lambda x: {coef[0]}"
-    part = ""
-    
-    for i in range(1, len(coef)):
-        func += f" + {coef[i]}"
-        part += f" * (x - {xVals[i - 1]})"
-        func += part
-    
-    return eval(func)
-
-
-
-# Newton's Interpolation
-# Params:
-#   x: list, x part of coordinates
-#   y: list, y part of coordinates
-# Return:
-#   float, the value estimated at pointToEval
-# Description:
-#   Uses Netwon's interpolation method to estimate the value at pointToEval
-def newton(x, y, pointToEval):
-    
-    return newtonPolynomialFunc(x, y)(pointToEval)
+from ..interpolation.CubicNatural import CubicNatural
+from ..interpolation.Interpolation import newtonPolynomialFunc, evalCubicSpline
+from .Figures import FigureRecorder, addFigureArguments, finishFigures
 
 
 
@@ -127,31 +64,21 @@ def writeSplineCoef(spline, fileName):
 
 
 
-# Evaluate Using Cubic Spline
+# Group Project 2
 # Params:
-#   pointToEval: float, the point to evaluate
-#   x:, float list, the coordinate of the x points
-#   coef: 2D float list, the return value of CubicNatural function
-# Return:
-#   float, the interpolated  value of pointToEval
+#   args: list of strings, the command line, sys.argv when not given
 # Description:
-#   Locates the correct range of pointToEval and then evaluates it using the 
-#   proper x value and coef terms
-def evalCubicSpline(pointToEval, x, coef):
-    if pointToEval < x[0] or pointToEval > x[-1]:
-        raise ValueError("Point to evaluate out of range")
-    
-    # As long as points are in order, it is easy to find which range they are in
-    for i in range(len(x) - 1):
-        if pointToEval < x[i + 1]:
-            break
-            
-    return coef[0][i] + coef[1][i] * (pointToEval - x[i]) + \
-        coef[2][i] * (pointToEval - x[i]) ** 2 + coef[3][i] * (pointToEval - x[i]) ** 3
-
+#   Answers questions 2 and 4 of the project and writes or shows the figures
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Group Project 2, Newton and cubic spline interpolation")
+    parser.add_argument("directory", nargs="?", default=".", help="where the data files are")
+    addFigureArguments(parser)
+    arguments = parser.parse_args(args)
+    directory = arguments.directory
 
-
-if __name__ == "__main__":
+    # Records the figures, drawn at the end with matplotlib
+    plt = FigureRecorder()
+    
     # Question 2    
     # Our function that will be approximated
     q2Func = lambda x: 1 / (1 + 25 * x ** 2)
@@ -203,7 +130,7 @@ if __name__ == "__main__":
     
     
     # Question 3
-    camelDataX, camelDataY = readCSV("camel data.csv")
+    camelDataX, camelDataY = readCSV(os.path.join(directory, "camel data.csv"))
     camelSpline = CubicNatural(camelDataX, camelDataY)
     camelRange = np.linspace(camelDataX[0], camelDataX[-1], 300)
     
@@ -217,7 +144,7 @@ if __name__ == "__main__":
     
     # Question 4
     # Cat Stretching
-    catDataX, catDataY = readCSV("cat data.csv")
+    catDataX, catDataY = readCSV(os.path.join(directory, "cat data.csv"))
     catSpline = CubicNatural(catDataX, catDataY)
     catRange = np.linspace(catDataX[0], catDataX[-1], 300)
     
@@ -228,7 +155,7 @@ if __name__ == "__main__":
     plt.title("Q4, Cat")
     
     # Cool Shadow on a motorcycle
-    shadowDataX, shadowDataY = readCSV("shadow data.csv")
+    shadowDataX, shadowDataY = readCSV(os.path.join(directory, "shadow data.csv"))
     shadowSpline = CubicNatural(shadowDataX, shadowDataY)
     shadowRange = np.linspace(shadowDataX[0], shadowDataX[-1], 300)
     
@@ -239,7 +166,7 @@ if __name__ == "__main__":
     plt.title("Q4, Shadow the Hedgehog")
     
     # An impressive tree
-    treeDataX, treeDataY = readCSV("tree data.csv")
+    treeDataX, treeDataY = readCSV(os.path.join(directory, "tree data.csv"))
     treeSpline = CubicNatural(treeDataX, treeDataY)
     treeRange = np.linspace(treeDataX[0], treeDataX[-1], 300)
     
@@ -250,7 +177,7 @@ if __name__ == "__main__":
     plt.title("Q4, Tree")
     
     # Some imtimating felines
-    jojoDataX, jojoDataY = readCSV("jojo cats data.csv")
+    jojoDataX, jojoDataY = readCSV(os.path.join(directory, "jojo cats data.csv"))
     jojoSpline = CubicNatural(jojoDataX, jojoDataY)
     jojoRange = np.linspace(jojoDataX[0], jojoDataX[-1], 300)
     
@@ -261,11 +188,16 @@ if __name__ == "__main__":
     plt.title("Q4, JoJo Cats")
     
     # Save the splines to a file so their values can be viewed
-    writeSplineCoef(camelSpline, "camel spline.csv")
-    writeSplineCoef(catSpline, "cat spline.csv")
-    writeSplineCoef(shadowSpline, "shadow spline.csv")
-    writeSplineCoef(treeSpline, "tree spline.csv")
-    writeSplineCoef(jojoSpline, "jojo cats spline.csv")
+    writeSplineCoef(camelSpline, os.path.join(directory, "camel spline.csv"))
+    writeSplineCoef(catSpline, os.path.join(directory, "cat spline.csv"))
+    writeSplineCoef(shadowSpline, os.path.join(directory, "shadow spline.csv"))
+    writeSplineCoef(treeSpline, os.path.join(directory, "tree spline.csv"))
+    writeSplineCoef(jojoSpline, os.path.join(directory, "jojo cats spline.csv"))
     
-    # Shows all figures
-    plt.show()
\ No newline at end of file
+    # Writes the figures that changed, or shows all of them
+    finishFigures(plt.figures, arguments)
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,439 @@
+# +---------------------------------------------------------------------------+
+#
+# Group Project #3 Methods for First-Order ODEs
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  Uses iterative formulas to estimate answers to initial value problems.
+#               Runs Euler's Method, Midpoint Method, and Runge-Kutta Method from
+#               m410.ode on the questions of the project.  Installed as the
+#               m410-project3 command.  The figures are written to the figures
+#               directory by Figures.renderFigures.
+#
+# +---------------------------------------------------------------------------+
+
+import argparse
+import math
+
+import numpy as np
+
+from ..ReportWriter import reportTable
+from ..ode.ConvergenceStudy import convergenceStudy, reportStudy
+from ..ode.Events import makeEvent
+from ..ode.Methods import eulers, improvedEulers, midpoint, rungeKutta, taylors
+from ..ode.Multistep import adamsBashforthMoulton
+from ..ode.TaylorSeries import taylorSeries
+from .Figures import FigureRecorder, addFigureArguments, finishFigures
+
+
+
+#
+#   Group Project 3
+#   Description:
+#       Answers the questions of the project, writing the tables to the
+#       reports directory and writing or showing the figures.
+#   Parameters:
+#       args: The command line, sys.argv when not given.
+#
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Group Project 3, methods for first-order ODEs")
+    addFigureArguments(parser)
+    arguments = parser.parse_args(args)
+
+    #Records the figures, drawn at the end with matplotlib.
+    plt = FigureRecorder()
+
+    # Question 1 --------------------------------------------------------------
+
+    q1ivp = lambda x, y: y + 2 * x - x ** 2
+    q1exact = lambda x: x ** 2 + math.e ** x
+    
+    q1x0 = 0
+    q1y0 = 1
+    q1start = 0
+    q1end = 2
+    q1h = 0.05
+    
+    q1xExact = np.linspace(q1start, q1end, 100)
+    q1yExact = [q1exact(x) for x in q1xExact]
+    
+    
+    
+    #Euler's
+    q1xEuler, q1yEuler, q1EulerError = eulers(q1ivp, q1x0, q1y0, q1start, q1end, q1h, q1exact)
+    
+    plt.figure()
+    plt.plot(q1xEuler, q1yEuler)
+    plt.plot(q1xExact, q1yExact)
+    plt.plot(q1xEuler, q1EulerError)
+    plt.legend(["Approximation", "Exact", "Error"])
+    plt.title("Q1 Euler's Method, h = 0.05")
+    
+    reportTable("Q1 Euler's Error, h = 0.05", {"x": q1xEuler, "error": q1EulerError})
+        
+        
+    q1xEuler, q1yEuler, q1EulerError = eulers(q1ivp, q1x0, q1y0, q1start, q1end, .001, q1exact)
+    
+    plt.figure()
+    plt.plot(q1xEuler, q1yEuler)
+    plt.plot(q1xExact, q1yExact)
+    plt.plot(q1xEuler, q1EulerError)
+    plt.legend(["Approximation", "Exact", "Error"])
+    plt.title("Q1 Euler's Method, h = 0.001")
+    
+    reportTable("Q1 Euler's Error, h = 0.001", {"x": q1xEuler, "error": q1EulerError})
+    
+    
+    
+    #Midpoint
+    q1xMidpoint, q1yMidpoint, q1MidpointError = midpoint(q1ivp, q1x0, q1y0, q1start, q1end, q1h, q1exact)
+    
+    plt.figure()
+    plt.plot(q1xMidpoint, q1yMidpoint)
+    plt.plot(q1xExact, q1yExact)
+    plt.plot(q1xMidpoint, q1MidpointError)
+    plt.legend(["Approximation", "Exact", "Error"])
+    plt.title("Q1 Midpoint Method")
+    
+    reportTable("Q1 Midpoint's Error", {"x": q1xMidpoint, "error": q1MidpointError})
+    
+    
+    #Runge-Kutta, the dense output gives a smooth curve without shrinking h
+    q1xRunge, q1yRunge, q1RungeError, q1RungeInterp = rungeKutta(q1ivp, q1x0, q1y0, q1start, q1end, q1h, q1exact, dense=True)
+    
+    plt.figure()
+    plt.plot(q1xExact, q1RungeInterp(q1xExact))
+    plt.plot(q1xExact, q1yExact)
+    plt.plot(q1xMidpoint, q1RungeError)
+    plt.legend(["Approximation", "Exact", "Error"])
+    plt.title("Q1 Runge-Kutta Method")
+    
+    reportTable("Q1 Runge-Kutta's Error", {"x": q1xRunge, "error": q1RungeError})
+    
+    
+    
+    # Question 2 --------------------------------------------------------------
+
+    q2ivp = lambda x, y: -y + x + 1
+    q2ivpDerX = lambda x, y: 1
+    q2ivpDerY = lambda x, y: -1
+    q2exact = lambda x: x + 1 / math.e ** x
+    
+    q2x0 = -2
+    q2y0 = -2 + math.e ** 2
+    q2start = -2
+    q2end = 3
+    
+    q2xExact = np.linspace(q2start, q2end, 100)
+    q2yExact = [q2exact(x) for x in q2xExact]
+    
+    
+    
+    # h = 0.2, 0.1 and 0.05
+    q2hValues = [0.2, 0.1, 0.05]
+    
+    for q2h in q2hValues:
+        q2xTaylor, q2yTaylor, q2TalyorError = taylors(q2ivp, q2ivpDerX, q2ivpDerY, q2x0, q2y0, q2start, q2end, q2h, q2exact)
+        
+        plt.figure()
+        plt.plot(q2xTaylor, q2yTaylor)
+        plt.plot(q2xExact, q2yExact)
+        plt.plot(q2xTaylor, q2TalyorError)
+        plt.legend(["Approximation", "Exact", "Error"])
+        plt.title(f"Q2 Taylor's Method, h = {q2h}")
+        
+        reportTable(f"Q2 Taylors's Error, h = {q2h}", {"x": q2xTaylor, "error": q2TalyorError})
+    
+    q2Study, q2Order = convergenceStudy(taylors, q2ivp, q2x0, q2y0, q2start, q2end, q2hValues, q2exact, (q2ivpDerX, q2ivpDerY))
+    
+    reportStudy("Q2 Taylor's Convergence Study", q2Study, q2Order)
+    
+    # Same problem with the multistep method, about half the evaluations of Runge-Kutta
+    q2Study, q2Order = convergenceStudy(adamsBashforthMoulton, q2ivp, q2x0, q2y0, q2start, q2end, q2hValues, q2exact)
+    
+    reportStudy("Q2 Adams-Bashforth-Moulton (4th Order) Convergence Study", q2Study, q2Order)
+    
+    q2Study, q2Order = convergenceStudy(rungeKutta, q2ivp, q2x0, q2y0, q2start, q2end, q2hValues, q2exact)
+    
+    reportStudy("Q2 Runge-Kutta Convergence Study", q2Study, q2Order)
+    
+    # A high order Taylor series method picks its own, much larger, steps
+    q2xSeries, q2ySeries, q2SeriesError = taylorSeries(q2ivp, q2x0, q2y0, q2start, q2end, 1.0, q2exact, tol=1e-12)
+    
+    print(f"\nQ2 Taylor Series Method, tol = 1e-12: {len(q2xSeries) - 1} steps, max error {max(q2SeriesError[1:])}")
+    
+    
+    
+    # Question 3 --------------------------------------------------------------
+    
+    q3ivp = lambda x, y: y ** 2
+    q3exact = lambda x: 1 / (1 - x)
+    
+    q3x0 = 0
+    q3y0 = 1
+    q3start = 0
+    q3end = 2
+    q3h = 0.25
+    
+    q3xExact = np.linspace(q3start, q3end, 100)
+    q3yExact = [q3exact(x) for x in q3xExact]
+    
+    q3xRunge, q3yRunge, q3yRungeError = rungeKutta(q3ivp, q3x0, q3y0, q3start, q3end, q3h, q3exact)
+    
+    plt.figure()
+    plt.plot(q3xRunge, q3yRunge)
+    plt.plot(q3xExact, q3yExact)
+    plt.plot(q3xRunge, q3yRungeError)
+    plt.legend(["Approximation", "Exact", "Error"])
+    plt.title("Q3 Runge-Kutta Method")
+    
+    plt.figure()
+    plt.plot(q3xRunge, q3yRunge)
+    plt.plot(q3xExact, q3yExact)
+    plt.plot(q3xRunge, q3yRungeError)
+    plt.legend(["Approximation", "Exact", "Error"])
+    plt.title("Q3 Runge-Kutta Method, Adjusted Scale")
+    plt.ylim(-5, 50)
+    
+    # A terminal event stops at y = 50 instead of stepping past the asymptote
+    q3Stop = makeEvent(lambda x, y: y - 50, terminal=True)
+    q3xEvent, q3yEvent, q3EventError, q3EventLog = rungeKutta(q3ivp, q3x0, q3y0, q3start, q3end, 0.01, q3exact, events=[q3Stop])
+    
+    print(f"\nQ3 Runge-Kutta stopped by {q3EventLog['status']} at x = {q3xEvent[-1]}, y = {q3yEvent[-1]}")
+    
+    
+    
+    # Extras ------------------------------------------------------------------
+    
+    # Extra 1:
+    print ("\nExtra IVP 1:")
+    ext1ivp = lambda x, y: 4 * math.sin(x) - 3 * y
+    ext1exact = lambda x: (2/5) * (math.e ** (-3*x) + 3 * math.sin(x) - math.cos(x))
+
+    ext1x0 = 0
+    ext1y0 = 0
+    ext1start = 0
+    ext1end = 4
+    ext1h = 0.25
+
+    ext1xExact = np.linspace(ext1start, ext1end, 100)
+    ext1yExact = [ext1exact(x) for x in ext1xExact]
+
+    ext1Eulerx, ext1Eulery, ext1EulerError = eulers(ext1ivp, ext1x0, ext1y0, ext1start, ext1end, ext1h, ext1exact)
+
+    plt.figure()
+    plt.plot(ext1Eulerx, ext1Eulery)
+    plt.plot(ext1xExact, ext1yExact)
+    plt.plot(ext1Eulerx, ext1EulerError)
+    plt.legend(["Approximation", "Exact", "Error"])
+    plt.title("Extra Question 1 (Euler's With Trigonometry)")
+    plt.ylim(-1, 4)
+
+
+
+    # Extra 2:
+    print ("\nExtra IVP 1:")
+    ext2ivp = lambda x, y: (y - math.log(x)) / x
+    ext2exact = lambda x: math.log(x) + 1
+
+    ext2x0 = 1
+    ext2y0 = 1
+    ext2start = 1
+    ext2end = 5
+    ext2h = 0.25
+
+    ext2xExact = np.linspace(ext2start, ext2end, 100)
+    ext2yExact = [ext2exact(x) for x in ext2xExact]
+
+    ext2Eulerx, ext2Eulery, ext2EulerError = eulers(ext2ivp, ext2x0, ext2y0, ext2start, ext2end, ext2h, ext2exact)
+
+    plt.figure()
+    plt.plot(ext2Eulerx, ext2Eulery)
+    plt.plot(ext2xExact, ext2yExact)
+    plt.plot(ext2Eulerx, ext2EulerError)
+    plt.legend(["Approximation", "Exact", "Error"])
+    plt.title("Extra Question 2 (Euler's With Logarithm Stuff)")
+    plt.ylim(-1, 4)
+    
+    
+    
+    # Extra 3 HW 6 Question 2 
+    
+    hw6Q2ivp = lambda x, y: 1 + y / x
+    hw6Q2Exact = lambda x: x * math.log(x) + 2 * x
+    
+    hw6Q2x0 = 1
+    hw6Q2y0 = 2
+    hw6Q2start = 1
+    hw6Q2end = 2
+    
+    hw6Q2h1 = 0.25
+    hw6Q2h2 = 0.5
+    
+    hw6Q2xExact = np.linspace(hw6Q2start, hw6Q2end, 100)
+    hw6Q2yExact = [hw6Q2Exact(x) for x in hw6Q2xExact]
+    
+    hw6Q2xMidpoint1, hw6Q2yMidpoint1, hw6Q2xMidpointError1 = midpoint(hw6Q2ivp, hw6Q2x0, hw6Q2y0, hw6Q2start, hw6Q2end, hw6Q2h1, hw6Q2Exact)
+    hw6Q2xMidpoint2, hw6Q2yMidpoint2, hw6Q2xMidpointError2 = midpoint(hw6Q2ivp, hw6Q2x0, hw6Q2y0, hw6Q2start, hw6Q2end, hw6Q2h2, hw6Q2Exact)
+    
+    plt.figure()
+    plt.plot(hw6Q2xMidpoint1, hw6Q2yMidpoint1)
+    plt.plot(hw6Q2xExact, hw6Q2yExact)
+    plt.plot(hw6Q2xMidpoint1, hw6Q2xMidpointError1)
+    plt.legend(["Approximation", "Exact", "Error"])
+    plt.title("Extra Question 3, HW 6 Q2, Midpoint Method, h = 0.25")
+    
+    reportTable("HW 6 Q2, Midpoint Error, h = 0.25", {"x": hw6Q2xMidpoint1, "error": hw6Q2xMidpointError1})
+    
+    plt.figure()
+    plt.plot(hw6Q2xMidpoint2, hw6Q2yMidpoint2)
+    plt.plot(hw6Q2xExact, hw6Q2yExact)
+    plt.plot(hw6Q2xMidpoint2, hw6Q2xMidpointError2)
+    plt.legend(["Approximation", "Exact", "Error"])
+    plt.title("Extra Question 3, HW 6 Q2, Midpoint Method, h = 0.5")
+    
+    reportTable("HW 6 Q2, Midpoint Error, h = 0.5", {"x": hw6Q2xMidpoint2, "error": hw6Q2xMidpointError2})
+    
+    hw6Q2Study, hw6Q2Order = convergenceStudy(midpoint, hw6Q2ivp, hw6Q2x0, hw6Q2y0, hw6Q2start, hw6Q2end, [hw6Q2h2, hw6Q2h1], hw6Q2Exact)
+    
+    reportStudy("HW 6 Q2, Midpoint Convergence Study", hw6Q2Study, hw6Q2Order)
+    
+    
+    
+    # Extra 4, HW 6 Question 3
+    hw6Q3ivp = lambda x, y: x * math.e ** (3 * x) - 2 * y
+    hw6Q3Exact = lambda x: 1 / 5 * x * math.e ** (3 * x) - 1 / 25 * math.e ** (3 * x) + 1 / 25 * math.e ** (-2 * x)
+        
+    hw6Q3x0 = 0
+    hw6Q3y0 = 0
+    hw6Q3start = 0
+    hw6Q3end = 2
+    hw6Q3h = 0.25
+    
+    hw6Q3xExact = np.linspace(hw6Q3start, hw6Q3end, 100)
+    hw6Q3yExact = [hw6Q3Exact(x) for x in hw6Q3xExact]
+
+    hw6Q3xEuler, hw6Q3yEuler, hw6Q3EulerError = eulers(hw6Q3ivp, hw6Q3x0, hw6Q3y0, hw6Q3start, hw6Q3end, hw6Q3h, hw6Q3Exact)
+    hw6Q3xImprovedEuler, hw6Q3yImprovedEuler, hw6Q3ImprovedEulerError = improvedEulers(hw6Q3ivp, hw6Q3x0, hw6Q3y0, hw6Q3start, hw6Q3end, hw6Q3h, hw6Q3Exact)
+
+    plt.figure()
+    plt.plot(hw6Q3xEuler, hw6Q3yEuler)
+    plt.plot(hw6Q3xExact, hw6Q3yExact)
+    plt.plot(hw6Q3xEuler, hw6Q3EulerError)
+    plt.legend(["Approximation", "Exact", "Error"])
+    plt.title("Extra Question 4, HW 6 Q3, Euler's Method")
+    
+    plt.figure()
+    plt.plot(hw6Q3xImprovedEuler, hw6Q3yImprovedEuler)
+    plt.plot(hw6Q3xExact, hw6Q3yExact)
+    plt.plot(hw6Q3xImprovedEuler, hw6Q3ImprovedEulerError)
+    plt.legend(["Approximation", "Exact", "Error"])
+    plt.title("Extra Question 4, HW 6 Q3, Improved Euler's Method")
+    
+    reportTable("Homework 6, Question 3", {
+        "xi": hw6Q3xEuler,
+        "Euler yi": hw6Q3yEuler,
+        "Euler Error": hw6Q3EulerError,
+        "Improved Euler yi": hw6Q3yImprovedEuler,
+        "Improved Euler Error": hw6Q3ImprovedEulerError,
+        "Exact": [hw6Q3Exact(x) for x in hw6Q3xEuler]
+    }, extension=".txt")
+    
+    
+    
+    # Extra 5
+    ext5ivp = lambda x, y: 2 * x / (y + x ** (2 * y))
+    ext5exact = lambda x: 2 * x ** 5 / (-2 * x ** 4 + 1)
+    
+    ext5x0 = 0
+    ext5y0 = -2
+    ext5start = 0
+    ext5end = 3
+    ext5h = 0.05
+
+    ext5xExact = np.linspace(ext5start, ext5end, 100)
+    ext5yExact = [ext5exact(x) for x in ext5xExact]
+
+    ext5xEuler, ext5yEuler, ext5EulerError = eulers(ext5ivp, ext5x0, ext5y0, ext5start, ext5end, ext5h, ext5exact)
+    
+    plt.figure()
+    plt.plot(ext5xEuler, ext5yEuler)
+    plt.plot(ext5xExact, ext5yExact)
+    plt.plot(ext5xEuler, ext5EulerError)
+    plt.legend(["Approximation", "Exact", "Error"])
+    plt.title("Extra Question 5, IVP with Asymptote")
+    
+    reportTable("Q1 Euler's Error", {"x": ext5xEuler, "error": ext5EulerError})
+
+
+
+    # Extra 6, comparison
+    ext6ivp = lambda x, y: -y + x + 1
+    ext6ivpDerX = lambda x, y: 1
+    ext6ivpDerY = lambda x, y: -1
+    ext6exact = lambda x: x + 1 / math.e ** x
+    
+    ext6x0 = -2
+    ext6y0 = -2 + math.e ** 2
+    ext6start = -2
+    ext6end = 3
+    ext6h = 0.25
+    
+    ext6xExact = np.linspace(ext6start, ext6end, 100)
+    ext6yExact = [ext6exact(x) for x in ext6xExact]
+    
+    
+    
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2)
+    fig.suptitle("Q2 Comparison, h = 0.25")
+    fig.legend(["Approximation", "Exact", "Error"])
+    fig.tight_layout()
+    
+    ext6x, ext6y, ext6Error = eulers(ext6ivp, ext6x0, ext6y0, ext6start, ext6end, ext6h, ext6exact)
+    
+    ax1.plot(ext6x, ext6y)
+    ax1.plot(ext6xExact, ext6yExact)
+    ax1.plot(ext6x, ext6Error)
+    ax1.set_title("Euler's")
+    
+    reportTable("Q2 Euler's Error", {"x": ext6x, "error": ext6Error})
+    
+    
+    
+    ext6x, ext6y, ext6Error = midpoint(ext6ivp, ext6x0, ext6y0, ext6start, ext6end, ext6h, ext6exact)
+    
+    ax2.plot(ext6x, ext6y)
+    ax2.plot(ext6xExact, ext6yExact)
+    ax2.plot(ext6x, ext6Error)
+    ax2.set_title("Midpoint")
+    
+    reportTable("Q2 Midpoint Error", {"x": ext6x, "error": ext6Error})
+    
+    
+    
+    ext6x, ext6y, ext6Error = rungeKutta(ext6ivp, ext6x0, ext6y0, ext6start, ext6end, ext6h, ext6exact)
+    
+    ax3.plot(ext6x, ext6y)
+    ax3.plot(ext6xExact, ext6yExact)
+    ax3.plot(ext6x, ext6Error)
+    ax3.set_title("Runge-Kutta")
+    
+    reportTable("Q2 Runge-Kutta's Error", {"x": ext6x, "error": ext6Error})
+    
+    
+    
+    ext6x, ext6y, ext6Error = taylors(ext6ivp, ext6ivpDerX, ext6ivpDerY, ext6x0, ext6y0, ext6start, ext6end, ext6h, ext6exact)
+    
+    ax4.plot(ext6x, ext6y)
+    ax4.plot(ext6xExact, ext6yExact)
+    ax4.plot(ext6x, ext6Error)
+    ax4.set_title("Taylor's")
+    
+    reportTable("Q2 Taylors's Error", {"x": ext6x, "error": ext6Error})
+
+
+
+    finishFigures(plt.figures, arguments)
+
+
+
+if __name__ == "__main__":
+    main()
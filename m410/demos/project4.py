@@ -0,0 +1,243 @@
+# =========================================
+# M 410
+# Group Project 4
+# 
+# Authors: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description:  Demonstrates the affect of rounding error on the solution
+#               of a augmented matrix by rounding fractions to different 
+#               precisions.  Linear and quadratic least squares fits are also
+#               explored.  Installed as the m410-project4 command.  The
+#               figures are written to the figures directory by
+#               Figures.renderFigures.
+# =========================================
+
+import argparse
+from fractions import Fraction
+
+import numpy
+
+from ..ReportWriter import reportTable
+from ..linalg.LeastSquares import makeFit, addSamples, fitCoefficients
+from ..linalg.MatrixOps import luFactor, luSolve, conditionNumber, refinedSolve, exactSolve, conjugateGradient, \
+                               jacobiPreconditioner, invertMatrix, illConditionedValue
+from .Figures import FigureRecorder, addFigureArguments, finishFigures
+
+# ------------------
+# main
+# Description:
+#   Works through problems 1 to 3, writing the tables to the reports
+#   directory and writing or showing the figures.  args is the command
+#   line, sys.argv when not given.
+# ------------------
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Group Project 4, rounding error and least squares")
+    addFigureArguments(parser)
+    arguments = parser.parse_args(args)
+
+    # Records the figures, drawn at the end with matplotlib
+    plt = FigureRecorder()
+
+    # ------------------
+    # Problem 1a
+    # Description:
+    #   Does row reduction on the augmented matrix [A I] to solve for inverse(A).
+    # ------------------
+
+    A1 = numpy.array([
+        [1, 1/2, 1/3],
+        [1/2, 1/3, 1/4],
+        [1/3, 1/4, 1/5]
+    ])
+
+    b = numpy.array([
+        [1],
+        [2],
+        [2],
+    ])
+
+    print("A1 =")
+    print(A1)
+
+    invA1 = invertMatrix(A1)
+
+    print("Inverse(A1) =")
+    print(invA1)
+
+    #Solving with the LU factors gives Inverse(A1) x b without using the inverse,
+    #and a condition number estimate for almost nothing.
+    xA1, condA1 = luSolve(luFactor(A1), b, condition=True)
+
+    print("IllConditionedValue(A1) =")
+    print(illConditionedValue(A1))
+    print()
+
+
+
+    # ------------------
+    # Problem 1b
+    # Description:
+    #   Does row reduction on the augmented matrix [A I] to solve for inverse(A).
+    #   Shows how rouding errors can have a large impact on the result.
+    # ------------------
+
+    A2 = numpy.array([
+        [1, 0.5, 0.33],
+        [0.5, 0.33, 0.25],
+        [0.33, 0.25, 0.2]
+    ])
+
+    print("A2 =")
+    print(A2)
+
+    invA2 = invertMatrix(A2)
+
+    print("Inverse(A2) =")
+    print(invA2)
+
+    #Solving with the LU factors gives Inverse(A2) x b without using the inverse,
+    #and a condition number estimate for almost nothing.
+    xA2, condA2 = luSolve(luFactor(A2), b, condition=True)
+
+    print("IllConditionedValue(A2) =")
+    print(illConditionedValue(A2))
+    print()
+
+
+
+    # ------------------
+    # Problem 1b
+    # Description:
+    #   Does row reduction on the augmented matrix [A I] to solve for inverse(A).
+    #   Rouding error is not as severe so we can compare with 1a and 1b.
+    # ------------------
+
+    A3 = numpy.array([
+        [1, 0.5, 0.333],
+        [0.5, 0.333, 0.25],
+        [0.333, 0.25, 0.2]
+    ])
+
+    print("A3 =")
+    print(A3)
+
+    invA3 = invertMatrix(A3)
+
+    print("Inverse(A3) =")
+    print(invA3)
+
+    #Solving with the LU factors gives Inverse(A3) x b without using the inverse,
+    #and a condition number estimate for almost nothing.
+    xA3, condA3 = luSolve(luFactor(A3), b, condition=True)
+
+    print("IllConditionedValue(A3) =")
+    print(illConditionedValue(A3))
+    print()
+
+    reportTable("Problem 1, A x = b Solved with the LU Factors", {"A1": xA1.ravel(), "A2": xA2.ravel(), "A3": xA3.ravel()})
+
+    #A1 with exact fractions, solved exactly, shows how far each rounding moved the answer.
+    A1Exact = [[Fraction(1, i + j + 1) for j in range(3)] for i in range(3)]
+    xExact = exactSolve(A1Exact, [1, 2, 2]).astype(float)
+
+    reportTable("Problem 1, Error Against the Exact Solution", {
+        "Exact": xExact, 
+        "A1 Error": abs(xA1.ravel() - xExact), 
+        "A2 Error": abs(xA2.ravel() - xExact), 
+        "A3 Error": abs(xA3.ravel() - xExact)
+    })
+
+    #A1 is symmetric positive definite, so conjugate gradient applies, needing only A1 x.
+    xCG, residuals = conjugateGradient(A1, b.ravel(), tol=1e-14, preconditioner=jacobiPreconditioner(A1))
+    reportTable("Problem 1, Conjugate Gradient on A1", {"Iteration": range(len(residuals)), "Residual": residuals})
+
+    #Rows are A1, A2 and A3.
+    reportTable("Problem 1, Condition Numbers", {
+        "1-Norm Estimate": [condA1, condA2, condA3],
+        "2-Norm": [conditionNumber(A) for A in (A1, A2, A3)],
+        "IllConditionedValue": [illConditionedValue(A) for A in (A1, A2, A3)]
+    })
+
+    #Factoring in float32 and refining in float64 still reaches full accuracy.
+    refined = [refinedSolve(A, b.ravel(), "double-double") for A in (A1, A2, A3)]
+    reportTable("Problem 1, Mixed-Precision Refinement", {
+        "Steps": [report["steps"] for x, report in refined],
+        "Backward Error": [report["backwardError"] for x, report in refined],
+        "Max Change From LU": [abs(x - xA.ravel()).max() for (x, report), xA in zip(refined, (xA1, xA2, xA3))]
+    })
+
+
+
+    # ------------------
+    # Problem 2
+    # Description:
+    #   Finding the least squares fit of test scores.
+    # ------------------
+
+    testScores = numpy.array([5, 8, 10, 12, 14, 18, 22, 24])
+    grades = numpy.array([0, 1.3, 2, 1.7, 2.3, 3, 4, 3.3])
+
+    lineFit = makeFit(1)
+    addSamples(lineFit, testScores, grades)
+    lineCoeff = fitCoefficients(lineFit)
+
+    # y = mx + b
+    lineFunc = lambda x: lineCoeff[0] + lineCoeff[1] * x
+    lineX = numpy.linspace(testScores[0], testScores[-1], 10)
+    lineY = [lineFunc(x) for x in lineX]
+
+    print("y = a + b * x")
+    print("a =", lineCoeff[0])
+    print("b =", lineCoeff[1])
+
+    plt.scatter(testScores, grades)
+    plt.plot(lineX, lineY)
+    plt.title("Q2 Test Scores vs. Grades, Linear Least-Squares Fit")
+
+    # x = (y - b) / m
+    scoreForB = (3.0 - lineCoeff[0]) / lineCoeff[1]
+
+    print("A test score of about", scoreForB, "predicts a B for this course.\n")
+
+    reportTable("Problem 2, Linear Least-Squares Fit", 
+                {"Test Score": testScores, "Grade": grades, "Fit": lineFunc(testScores), 
+                 "Residual": grades - lineFunc(testScores)})
+
+
+
+    # ------------------
+    # Problem 3
+    # Description:
+    #   Quadratic least-square fit
+    # ------------------
+
+    dataX = numpy.array([2.3, 3.0, 5.8, 6.4, 7.2])
+    dataY = numpy.array([-3.1, 0.2, 1.5, 0, -2.3])
+
+    quadFit = makeFit(2)
+    addSamples(quadFit, dataX, dataY)
+    quadCoeff = fitCoefficients(quadFit)
+
+    quadFunc = lambda x: quadCoeff[0] + quadCoeff[1] * x + quadCoeff[2] * x ** 2
+    quadX = numpy.linspace(dataX[0], dataX[-1], 50)
+    quadY = [quadFunc(x) for x in quadX]
+
+    print("y = a + b * x + c * x ^ 2")
+    print("a =", quadCoeff[0])
+    print("b =", quadCoeff[1])
+    print("c =", quadCoeff[2])
+    print()
+
+    reportTable("Problem 3, Quadratic Least-Squares Fit", 
+                {"x": dataX, "y": dataY, "Fit": quadFunc(dataX), "Residual": dataY - quadFunc(dataX)})
+
+    plt.figure()
+    plt.scatter(dataX, dataY)
+    plt.plot(quadX, quadY)
+    plt.title("Q3 Quadratic Least-Squares Fit")
+
+    finishFigures(plt.figures, arguments)
+
+
+if __name__ == "__main__":
+    main()
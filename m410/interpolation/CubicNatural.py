@@ -1,5 +1,8 @@
 import numpy as np
 
+from ..Acceleration import accelerated
+from ..Cache import memoized
+
 # The code is written by Drs.Yaning Liu and Giray Ökten
 # Input: Points(x(1),y(1)),(x(2),y(3)),...spline must interpolate.
 # Output: coefficents of each piece of the piecewise cubic spline
@@ -9,16 +12,28 @@ import numpy as np
 #
 # Modified by Brandon Mitchell
 # Changed x.size to len(x) so normal lists are supported as input
+# Moved the loops into _naturalSpline so they can be compiled
+# Memoized so the same data is only fitted once while a cache is active
 
+@memoized
 def CubicNatural(x, y):
+    x = np.asarray(x, dtype=float)
+    a = np.array(y, dtype=float)
+    b, c, d = _naturalSpline(x, a)
+    m = len(x) # m is the number of data points
+    a = a[0:m-1]
+    c = c[0:m-1]
+    return a, b, c, d
+
+# The forward sweep and back substitution, each step needing the one before,
+# so they are a kernel that runs compiled when Numba is installed.
+@accelerated
+def _naturalSpline(x, a):
     m = len(x) # m is the number of data points
     n = m - 1
-    a = np.zeros(m)
     b = np.zeros(n)
     c = np.zeros(m)
     d = np.zeros(n)
-    for i in range(m):
-        a[i] = y[i]
     h = np.zeros(n)
     for i in range(n):
         h[i] = x[i+1] - x[i]
@@ -39,10 +54,8 @@ def CubicNatural(x, y):
     s[m-1] = 1
     z[m-1] = 0
     c[m-1] = 0
-    for i in np.flip(np.arange(n)):
+    for i in range(n - 1, -1, -1):
         c[i] = z[i]-t[i]*c[i+1]
         b[i] = (a[i+1]-a[i])/h[i]-h[i]*(c[i+1]+2*c[i])/3
         d[i] = (c[i+1]-c[i])/(3*h[i])
-    a = a[0:m-1]
-    c = c[0:m-1]
-    return a, b, c, d
\ No newline at end of file
+    return b, c, d
@@ -0,0 +1,121 @@
+# +--------------------------------------------------------------------------+
+# 
+# Group Project #2 for Numerical Computing S23
+#
+# Team Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description:  Newton's divided difference interpolation and evaluation of
+#               the cubic splines made by CubicNatural.
+#
+# +--------------------------------------------------------------------------+
+
+import numpy as np
+
+from ..Acceleration import accelerated
+from ..Cache import memoized
+
+
+
+# Netwon's Divided Difference
+# Params:
+#   x: list, x part of coordinates
+#   y: list, y part of coordinates
+# Return:
+#   list, coefficients in the form [a0, a1, ... an]
+# Description:
+#   Uses Netwon's interpolation method to find the divided differences
+@memoized
+def diff(x, y):
+
+    if len(x) != len(y):
+        raise ValueError("Inputs x and y must have the same length")
+    
+    return _dividedDifferences(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+
+
+
+# Divided Difference Table
+# Params:
+#   x: array, x part of coordinates
+#   y: array, y part of coordinates
+# Return:
+#   array, the first row of the table
+# Description:
+#   The loops of diff, each column needing the one before, compiled when
+#   Numba is installed
+@accelerated
+def _dividedDifferences(x, y):
+    n = len(y)
+    coef = np.zeros((n, n))
+    
+    # The first column is y
+    coef[:, 0] = y
+    
+    for j in range(1, n):
+        for i in range(n - j):
+            coef[i, j] = (coef[i + 1, j - 1] - coef[i, j - 1]) / (x[i + j] - x[i])
+    
+    # First row contains all coefficients we need
+    return coef[0].copy()
+
+
+
+# Netwon's Polynomial Interpolation Function
+# Params:
+#   x: list, x part of coordinates
+#   y: list, y part of coordinates
+# Return:
+#   function pointer, the interpolating function
+# Description:
+#   Uses Netwon's interpolation method to create an interpolating function
+def newtonPolynomialFunc(xVals, yVals):
+
+    coef = diff(xVals, yVals)
+    
+    func = f"lambda x: {coef[0]}"
+    part = ""
+    
+    for i in range(1, len(coef)):
+        func += f" + {coef[i]}"
+        part += f" * (x - {xVals[i - 1]})"
+        func += part
+    
+    return eval(func)
+
+
+
+# Newton's Interpolation
+# Params:
+#   x: list, x part of coordinates
+#   y: list, y part of coordinates
+# Return:
+#   float, the value estimated at pointToEval
+# Description:
+#   Uses Netwon's interpolation method to estimate the value at pointToEval
+def newton(x, y, pointToEval):
+    
+    return newtonPolynomialFunc(x, y)(pointToEval)
+
+
+
+# Evaluate Using Cubic Spline
+# Params:
+#   pointToEval: float, the point to evaluate
+#   x:, float list, the coordinate of the x points
+#   coef: 2D float list, the return value of CubicNatural function
+# Return:
+#   float, the interpolated  value of pointToEval
+# Description:
+#   Locates the correct range of pointToEval and then evaluates it using the 
+#   proper x value and coef terms
+def evalCubicSpline(pointToEval, x, coef):
+    if pointToEval < x[0] or pointToEval > x[-1]:
+        raise ValueError("Point to evaluate out of range")
+    
+    # As long as points are in order, it is easy to find which range they are in
+    for i in range(len(x) - 1):
+        if pointToEval < x[i + 1]:
+            break
+            
+    return coef[0][i] + coef[1][i] * (pointToEval - x[i]) + \
+        coef[2][i] * (pointToEval - x[i]) ** 2 + coef[3][i] * (pointToEval - x[i]) ** 3
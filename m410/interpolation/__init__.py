@@ -0,0 +1,16 @@
+# =========================================
+# M 410
+# Group Project 2
+#
+# Authors: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description:  Newton's divided difference interpolation and natural cubic
+#               splines.
+# =========================================
+
+from .._lazy import lazyExports
+
+__getattr__, __dir__ = lazyExports(__name__, {
+    ".CubicNatural": ["CubicNatural"],
+    ".Interpolation": ["diff", "newtonPolynomialFunc", "newton", "evalCubicSpline"]
+})
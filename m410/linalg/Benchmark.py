@@ -0,0 +1,329 @@
+# =========================================
+# M 410
+# Group Project 4
+# 
+# Authors: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description:  Benchmarks for MatrixOps.  "gflops" times the blocked LU
+#               factorization and inversion for growing sizes and reports
+#               the rate in GFLOP/s.  "suite" runs the MatrixOps routines
+#               and numpy.linalg on families of test matrices, records time
+#               and accuracy in a JSON history file, and exits with status
+#               1 if anything got slower or less accurate than before.
+#               "backends" runs the compiled kernels with Numba and as plain
+#               Python and exits with status 1 if their results differ.
+#
+#                   m410-benchmark gflops [--block-size 64] [n ...]
+#                   m410-benchmark suite [--quick] [--history file]
+#                   m410-benchmark backends [n ...]
+# =========================================
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy
+
+from ..Acceleration import checkBackends
+from ..ReportWriter import reportTable
+from .MatrixOps import BLOCK_SIZE, luFactor, luSolve, invertMatrix, illConditionedValue
+
+# ------------------
+# callTimes
+# Description:
+#   The time of each of repeats calls of func, in seconds.
+# ------------------
+def callTimes(func, repeats):
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+# ------------------
+# bestTime
+# Description:
+#   The fastest of repeats calls of func, in seconds.
+# ------------------
+def bestTime(func, repeats):
+    return min(callTimes(func, repeats))
+
+# ------------------
+# benchmarkLU
+# Description:
+#   Times luFactor and invertMatrix on random n x n matrices.  The rates use
+#   the usual operation counts, 2/3 n^3 for the factorization and 2 n^3 for
+#   the inverse, so they can be compared with other libraries.
+# ------------------
+def benchmarkLU(sizes, blockSize=BLOCK_SIZE, repeats=3):
+    rng = numpy.random.default_rng(0)
+    results = {"n": [], "Factor Seconds": [], "Factor GFLOP/s": [], "Inverse Seconds": [], "Inverse GFLOP/s": []}
+
+    for n in sizes:
+        matrix = rng.standard_normal((n, n))
+        factorTime = bestTime(lambda: luFactor(matrix, blockSize), repeats)
+        inverseTime = bestTime(lambda: invertMatrix(matrix, blockSize), repeats)
+
+        results["n"].append(n)
+        results["Factor Seconds"].append(factorTime)
+        results["Factor GFLOP/s"].append(2 / 3 * n ** 3 / factorTime / 1e9)
+        results["Inverse Seconds"].append(inverseTime)
+        results["Inverse GFLOP/s"].append(2 * n ** 3 / inverseTime / 1e9)
+
+    return results
+
+# The test matrix families and the sizes the suite runs them at.
+FAMILIES = ["random", "hilbert", "diagonallyDominant", "nearSingular"]
+SIZES = [3, 4, 16, 64, 256, 1024, 4096]
+QUICK_SIZES = [3, 4, 16, 64, 256]
+
+# A run fails if a routine's median time is this many times its median in
+# the history, or its forward or backward error this many times larger
+# than the median.
+TIME_FACTOR = 1.5
+ERROR_FACTOR = 10
+
+# Only this many of the latest runs on the same machine and NumPy version
+# are compared with, so old runs and other hosts do not set the baseline.
+HISTORY_WINDOW = 5
+
+# Times are only compared once the history has this many runs of a routine,
+# one run is not enough to know how much its time varies.
+MIN_HISTORY = 3
+
+# Median times under this many seconds are too noisy to call a regression.
+MIN_TIME = 0.02
+
+# Errors up to this many multiples of n * machine epsilon are accepted
+# whatever the history says, so an error of 0 in the history does not make
+# the next rounding error a regression.
+BACKWARD_LIMIT = 100
+
+# ------------------
+# makeMatrix
+# Description:
+#   An n x n test matrix from one of FAMILIES.  Hilbert matrices are the
+#   classic ill-conditioned case of Problem 1, and nearSingular matrices
+#   have one singular value of 1e-12 times the others.
+# ------------------
+def makeMatrix(family, n, rng):
+    if family == "random":
+        return rng.standard_normal((n, n))
+    if family == "hilbert":
+        return 1 / (numpy.arange(n)[:, None] + numpy.arange(n) + 1)
+    if family == "diagonallyDominant":
+        matrix = rng.uniform(-1, 1, (n, n))
+        return matrix + numpy.diag(abs(matrix).sum(axis=1) + 1)
+    if family == "nearSingular":
+        u = numpy.linalg.qr(rng.standard_normal((n, n)))[0]
+        v = numpy.linalg.qr(rng.standard_normal((n, n)))[0]
+        singular = numpy.ones(n)
+        singular[-1] = 1e-12
+        return (u * singular) @ v.T
+    raise ValueError(f"Unknown matrix family {family}")
+
+# ------------------
+# accuracy
+# Description:
+#   The forward error ||x - xTrue|| / ||xTrue||, the normwise backward
+#   error ||b - A x|| / (||A|| ||x|| + ||b||) and the residual norm
+#   ||b - A x||, all in the infinity norm.
+# ------------------
+def accuracy(matrix, x, xTrue, b):
+    norm = lambda v: abs(v).max() if numpy.size(v) else 0.0
+    residual = norm(b - matrix @ x)
+    return {
+        "forwardError": float(norm(x - xTrue) / norm(xTrue)),
+        "backwardError": float(residual / (abs(matrix).sum(axis=1).max() * norm(x) + norm(b))),
+        "residual": float(residual)
+    }
+
+# ------------------
+# runSuite
+# Description:
+#   Times every routine on every family and size and measures its
+#   accuracy on A x = b with a known x.  Solves compare luFactor/luSolve
+#   with numpy.linalg.solve, inverses compare invertMatrix with
+#   numpy.linalg.inv (applied to b), and illConditionedValue is timed next
+#   to numpy.linalg.det for reference.
+# Output:
+#   results: A list of dictionaries, one per family, size and routine.
+# ------------------
+def runSuite(families=FAMILIES, sizes=SIZES, repeats=3):
+    rng = numpy.random.default_rng(0)
+    results = []
+
+    for family in families:
+        for n in sizes:
+            matrix = makeMatrix(family, n, rng)
+            xTrue = numpy.ones(n)
+            b = matrix @ xTrue
+            repeatsHere = repeats if n <= 1024 else 1
+
+            routines = {
+                "MatrixOps.luSolve": lambda: luSolve(luFactor(matrix), b),
+                "numpy.linalg.solve": lambda: numpy.linalg.solve(matrix, b),
+                "MatrixOps.invertMatrix": lambda: invertMatrix(matrix) @ b,
+                "numpy.linalg.inv": lambda: numpy.linalg.inv(matrix) @ b
+            }
+
+            for name, routine in routines.items():
+                x = routine()
+                times = callTimes(routine, repeatsHere)
+                results.append(dict(family=family, n=n, routine=name, seconds=min(times),
+                                    medianSeconds=float(numpy.median(times)), **accuracy(matrix, x, xTrue, b)))
+
+            #The determinant of a large Hilbert matrix underflows, which is part of the point.
+            with numpy.errstate(all="ignore"):
+                for name, routine in (("MatrixOps.illConditionedValue", lambda: illConditionedValue(matrix)),
+                                      ("numpy.linalg.det", lambda: numpy.linalg.det(matrix))):
+                    times = callTimes(routine, repeatsHere)
+                    results.append(dict(family=family, n=n, routine=name, seconds=min(times),
+                                        medianSeconds=float(numpy.median(times))))
+
+    return results
+
+# ------------------
+# findRegressions
+# Description:
+#   Compares results with the median of the last HISTORY_WINDOW runs in
+#   history made on the same machine with the same NumPy version, for the
+#   same family, size and routine.  A median time over both TIME_FACTOR
+#   times the history's median and MIN_TIME is a regression, once there
+#   are MIN_HISTORY runs to compare with.  A forward or backward error over
+#   both ERROR_FACTOR times the median and the BACKWARD_LIMIT floor is a
+#   regression after a single run, the suite's matrices are always the same.
+# Output:
+#   messages: One line per regression, empty if there are none.
+# ------------------
+def findRegressions(history, results, machine=None, numpyVersion=None):
+    machine = platform.platform() if machine is None else machine
+    numpyVersion = numpy.__version__ if numpyVersion is None else numpyVersion
+    runs = [run for run in history if run.get("machine") == machine and run.get("numpy") == numpyVersion]
+
+    values = {}
+    for run in runs[-HISTORY_WINDOW:]:
+        for result in run["results"]:
+            key = (result["family"], result["n"], result["routine"])
+            previous = values.setdefault(key, {})
+            for field in ("medianSeconds", "forwardError", "backwardError"):
+                if field in result:
+                    previous.setdefault(field, []).append(result[field])
+
+    messages = []
+    for result in results:
+        key = (result["family"], result["n"], result["routine"])
+        if key not in values:
+            continue
+        name = f"{result['routine']} on {result['family']} n={result['n']}"
+        previous = values[key]
+
+        seconds, pastSeconds = result["medianSeconds"], previous.get("medianSeconds", [])
+        if len(pastSeconds) >= MIN_HISTORY:
+            median = float(numpy.median(pastSeconds))
+            if seconds > max(TIME_FACTOR * median, MIN_TIME):
+                messages.append(f"{name}: {seconds:.3g} s, median was {median:.3g} s")
+
+        floor = BACKWARD_LIMIT * result["n"] * numpy.finfo(float).eps
+        for field, label in (("forwardError", "forward error"), ("backwardError", "backward error")):
+            if field in result and field in previous:
+                median = float(numpy.median(previous[field]))
+                if result[field] > max(ERROR_FACTOR * median, floor):
+                    messages.append(f"{name}: {label} {result[field]:.3g}, median was {median:.3g}")
+
+    return messages
+
+# ------------------
+# runRegressionSuite
+# Description:
+#   Runs the suite, checks it against the history in historyFile, then
+#   adds this run to the history.  A run with regressions is recorded too,
+#   so the history shows when they started.
+# ------------------
+def runRegressionSuite(historyFile, sizes=SIZES):
+    history = []
+    if os.path.exists(historyFile):
+        with open(historyFile) as file:
+            history = json.load(file)
+
+    results = runSuite(sizes=sizes)
+    regressions = findRegressions(history, results)
+
+    history.append({
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": platform.platform(),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "regressions": regressions,
+        "results": results
+    })
+    with open(historyFile + ".tmp", "w") as file:
+        json.dump(history, file, indent=1)
+    os.replace(historyFile + ".tmp", historyFile)
+
+    return results, regressions
+
+# ------------------
+# main
+# Description:
+#   The m410-benchmark command, see the top of this file.
+# ------------------
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks for MatrixOps")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gflops = commands.add_parser("gflops", help="GFLOP/s of the blocked LU against n")
+    gflops.add_argument("--block-size", type=int, default=BLOCK_SIZE)
+    gflops.add_argument("sizes", type=int, nargs="*", default=[250, 500, 1000, 2000, 4000])
+
+    suite = commands.add_parser("suite", help="time and accuracy against the history")
+    suite.add_argument("--history", default="benchmarkHistory.json")
+    suite.add_argument("--quick", action="store_true", help=f"only sizes {QUICK_SIZES}")
+
+    backends = commands.add_parser("backends", help="the compiled kernels against plain Python")
+    backends.add_argument("sizes", type=int, nargs="*", default=[4, 32, 256])
+
+    arguments = parser.parse_args()
+
+    if arguments.command == "gflops":
+        reportTable(f"Blocked LU, Block Size {arguments.block_size}", benchmarkLU(arguments.sizes, arguments.block_size))
+    elif arguments.command == "backends":
+        rows = checkBackends(arguments.sizes)
+        for kernel in dict.fromkeys(row["kernel"] for row in rows):
+            kernelRows = [row for row in rows if row["kernel"] == kernel]
+            reportTable(f"{kernel} on Both Backends", {
+                field: [row[field] for row in kernelRows]
+                for field in ("n", "difference", "numbaSeconds", "pythonSeconds", "passed")})
+
+        failed = [f"{row['kernel']} n={row['n']}" for row in rows if not row["passed"]]
+        if failed:
+            print("The backends differ for", ", ".join(failed))
+            sys.exit(1)
+        print("Both backends give the same results")
+    else:
+        results, regressions = runRegressionSuite(arguments.history, QUICK_SIZES if arguments.quick else SIZES)
+
+        #Report columns are numbers, so each family is shown by its index.
+        print("Families:", ", ".join(f"{i} {family}" for i, family in enumerate(FAMILIES)))
+        for routine in sorted({result["routine"] for result in results}):
+            rows = [result for result in results if result["routine"] == routine]
+            columns = {"family": [FAMILIES.index(row["family"]) for row in rows], "n": [row["n"] for row in rows],
+                       "Seconds": [row["seconds"] for row in rows],
+                       "Median Seconds": [row["medianSeconds"] for row in rows]}
+            if "backwardError" in rows[0]:
+                for field in ("forwardError", "backwardError", "residual"):
+                    columns[field] = [row[field] for row in rows]
+            reportTable(routine, columns)
+
+        if regressions:
+            print("Regressions against the history in", arguments.history)
+            print("\n".join(regressions))
+            sys.exit(1)
+        print("No regressions against the history in", arguments.history)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+# =========================================
+# M 410
+# Group Project 4
+#
+# Authors: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description:  Online least-squares fitting.  Instead of keeping the data,
+#               a fit keeps the triangular factor R of the QR factorization
+#               of [design matrix | y], which is O(p^2) for p basis functions
+#               no matter how many samples went in.  Samples can be added,
+#               removed, forgotten exponentially or kept in a sliding window,
+#               and fits made on different workers can be merged.
+# =========================================
+
+from collections import deque
+
+import numpy
+
+# ------------------
+# makeFit
+# Description:
+#   An empty fit, stored as a dictionary.  basis is the degree of a
+#   polynomial fit, or a function taking an array of x values and returning
+#   one row of basis function values per x.  forgetting below 1 weights
+#   every older sample down by that factor each time a sample is added.
+#   window keeps only the last window samples, which means keeping those
+#   samples so they can be removed again.
+# ------------------
+def makeFit(basis, forgetting=1.0, window=None):
+    if window is not None and forgetting != 1.0:
+        raise ValueError("A fit can use a window or forgetting, not both")
+
+    size = basis + 1 if isinstance(basis, int) else len(numpy.atleast_2d(basis(numpy.zeros(1)))[0])
+
+    return {
+        "basis": basis,
+        "R": numpy.zeros((size + 1, size + 1)),
+        "count": 0,
+        "forgetting": forgetting,
+        "window": None if window is None else deque(maxlen=window)
+    }
+
+# ------------------
+# _rows
+# Description:
+#   The rows [basis functions of x, y] that the samples add to the fit.
+# ------------------
+def _rows(fit, x, y):
+    x = numpy.atleast_1d(numpy.asarray(x, dtype=float))
+    y = numpy.atleast_1d(numpy.asarray(y, dtype=float))
+
+    if isinstance(fit["basis"], int):
+        design = x[:, None] ** numpy.arange(fit["basis"] + 1)
+    else:
+        design = numpy.atleast_2d(fit["basis"](x)).reshape(len(x), -1)
+
+    return numpy.column_stack((design, y))
+
+# ------------------
+# _triangularize
+# Description:
+#   The R factor of the QR factorization of rows, with a positive diagonal
+#   so downdating can rely on it.  This is how samples are folded in: the R
+#   of [R; new rows] describes the old and new samples together.
+# ------------------
+def _triangularize(rows):
+    size = rows.shape[1]
+    R = numpy.linalg.qr(rows, mode="r")[:size]
+    R = numpy.vstack((R, numpy.zeros((size - len(R), size))))
+
+    signs = numpy.where(numpy.diag(R) < 0, -1.0, 1.0)
+    return R * signs[:, None]
+
+# ------------------
+# addSamples
+# Description:
+#   Adds one sample or an array of samples to the fit, in O(m p^2) for m
+#   samples.  With forgetting the samples count as added one after another.
+# ------------------
+def addSamples(fit, x, y):
+    rows = _rows(fit, x, y)
+    count = len(rows)
+
+    if fit["window"] is not None:
+        window = fit["window"]
+        leaving = [window[i] for i in range(min(max(0, len(window) + count - window.maxlen), len(window)))]
+        window.extend(rows[-window.maxlen:])
+        rows = rows[-window.maxlen:]
+
+        if len(leaving) * 2 > len(window):
+            #Most of the window is new, so start again from what is in it.
+            fit["R"] = _triangularize(numpy.array(window))
+            fit["count"] = len(window)
+            return
+
+        #Samples pushed out of the window come back out of R.
+        if leaving:
+            _downdate(fit, leaving)
+
+    #Older samples have been forgotten a little more each step.
+    weights = fit["forgetting"] ** (numpy.arange(len(rows))[::-1] / 2)
+    R = fit["R"] * fit["forgetting"] ** (len(rows) / 2)
+
+    fit["R"] = _triangularize(numpy.vstack((R, rows * weights[:, None])))
+    fit["count"] += len(rows)
+
+# ------------------
+# _downdate
+# Description:
+#   Takes rows out of R, so that R^T R loses v v^T for each row v, with the
+#   hyperbolic rotations of the Cholesky downdate, O(p^2) per row.  The fit
+#   is left as it was if a row cannot be removed.
+# ------------------
+def _downdate(fit, rows):
+    R = fit["R"].copy()
+    size = len(R)
+
+    for v in numpy.array(rows, dtype=float):
+        for k in range(size):
+            square = R[k, k] ** 2 - v[k] ** 2
+            if square < 0 and k < size - 1:
+                raise ValueError("Cannot remove a sample the fit does not contain")
+
+            #The last entry is the residual, which may reach zero.
+            r = max(square, 0.0) ** 0.5
+            if R[k, k] == 0:
+                continue
+            c = r / R[k, k]
+            s = v[k] / R[k, k]
+            R[k, k] = r
+            if c == 0:
+                continue
+            R[k, k+1:] = (R[k, k+1:] - s * v[k+1:]) / c
+            v[k+1:] = c * v[k+1:] - s * R[k, k+1:]
+
+    fit["R"] = R
+    fit["count"] -= len(rows)
+
+# ------------------
+# removeSamples
+# Description:
+#   Takes samples that were added back out of the fit.
+# ------------------
+def removeSamples(fit, x, y):
+    if fit["forgetting"] != 1.0:
+        raise ValueError("Samples cannot be removed once they have been forgotten")
+    if fit["window"] is not None:
+        raise ValueError("A window fit removes its own samples")
+
+    _downdate(fit, _rows(fit, x, y))
+
+# ------------------
+# mergeFits
+# Description:
+#   One fit for all the samples of several fits, such as partial fits made
+#   by different workers on different parts of the data.  Only the R
+#   factors are combined, in O(k p^3) for k fits.
+# ------------------
+def mergeFits(*fits):
+    if any(fit["window"] is not None for fit in fits):
+        raise ValueError("Window fits cannot be merged")
+
+    merged = makeFit(fits[0]["basis"], fits[0]["forgetting"])
+    merged["R"] = _triangularize(numpy.vstack([fit["R"] for fit in fits]))
+    merged["count"] = sum(fit["count"] for fit in fits)
+    return merged
+
+# ------------------
+# fitCoefficients
+# Description:
+#   The least-squares coefficients of the basis functions, from R c = Q^T y.
+#   With fewer samples than coefficients the smallest-norm fit is returned.
+# ------------------
+def fitCoefficients(fit):
+    R = fit["R"]
+    size = len(R) - 1
+    return numpy.linalg.lstsq(R[:size, :size], R[:size, size], rcond=None)[0]
+
+# ------------------
+# fitResidual
+# Description:
+#   The sum of the squared residuals of the fit, which is the last diagonal
+#   entry of R squared.
+# ------------------
+def fitResidual(fit):
+    return fit["R"][-1, -1] ** 2
+
+# ------------------
+# evaluateFit
+# Description:
+#   The fitted function at x, a float or an array.
+# ------------------
+def evaluateFit(fit, x):
+    values = _rows(fit, x, numpy.zeros(numpy.size(x)))[:, :-1] @ fitCoefficients(fit)
+    return values if numpy.ndim(x) else values[0]
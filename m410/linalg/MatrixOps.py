@@ -0,0 +1,1280 @@
+import functools
+import math
+from fractions import Fraction
+
+import numpy
+
+from ..Acceleration import compiled
+from ..Instrumentation import startSpan, recordIteration, endSpan
+
+# Columns per panel of the blocked factorization.  Larger blocks put more of
+# the work in matrix-matrix products, smaller ones keep each panel in cache.
+BLOCK_SIZE = 64
+
+# ------------------
+# luFactor
+# Description:
+#   LU factorization with partial pivoting, P A = L U.  L (unit diagonal, not
+#   stored) and U are packed into one array, and perm lists the row of A that
+#   ended up in each row, so P A is matrix[perm].  The 1-norm of A is kept
+#   too, for conditionEstimate.  Factor once and pass the result to luSolve
+#   for every right-hand side.  dtype=numpy.float32 factors in single
+#   precision, and luSolve then solves in single precision too.
+#
+#   The factorization is blocked and right-looking.  Each panel of blockSize
+#   columns is factored on its own, then the rest of the matrix is updated
+#   with one matrix-matrix product, which NumPy hands to multithreaded BLAS.
+# ------------------
+def luFactor(matrix, blockSize=BLOCK_SIZE, dtype=float):
+    lu = numpy.array(matrix, dtype=dtype)
+    size = lu.shape[0]
+    perm = numpy.arange(size)
+
+    if lu.shape != (size, size):
+        raise ValueError("Matrix must be square")
+
+    norm = abs(lu).sum(axis=0).max() if size else 0.0
+    span = startSpan("luFactor", size=size, blockSize=blockSize, dtype=lu.dtype.name)
+    kernel = compiled(_factorPanel) if lu.dtype in (numpy.float32, numpy.float64) else None
+
+    for start in range(0, size, blockSize):
+        stop = min(start + blockSize, size)
+
+        if kernel is not None:
+            #The compiled loops, see _factorPanel.
+            if not kernel(lu, perm, start, stop):
+                raise ValueError("Matrix is singular")
+        else:
+            for i in range(start, stop):
+                #Swap the largest entry left in the column onto the diagonal.
+                p = i + numpy.argmax(abs(lu[i:, i]))
+                if lu[p, i] == 0:
+                    raise ValueError("Matrix is singular")
+                if p != i:
+                    lu[[i, p]] = lu[[p, i]]
+                    perm[[i, p]] = perm[[p, i]]
+
+                #Store the multipliers below the pivot and update the rest of the panel.
+                lu[i+1:, i] /= lu[i, i]
+                lu[i+1:, i+1:stop] -= numpy.outer(lu[i+1:, i], lu[i, i+1:stop])
+
+        if stop < size:
+            #The panel's rows of U, then the trailing update in one product.
+            _solveLower(lu[start:stop, start:stop], lu[start:stop, stop:], blockSize)
+            lu[stop:, stop:] -= lu[stop:, start:stop] @ lu[start:stop, stop:]
+
+        if span is not None:
+            #The panel's elimination, its rows of U and the trailing update.
+            width, rest = stop - start, size - stop
+            recordIteration(span, start // blockSize + 1, {"column": stop},
+                            flops=width * width * (size - start - width / 3) + width * width * rest + 2 * width * rest * rest)
+
+    endSpan(span)
+    return lu, perm, norm
+
+# ------------------
+# _factorPanel
+# Description:
+#   The column by column elimination of one panel in luFactor, as loops
+#   for Acceleration.compiled.  Each column needs the one before, so this
+#   is the part of the factorization left in Python.  Does the same
+#   operations in the same order as the NumPy version in luFactor.
+# Output:
+#   nonsingular: False if a column had no pivot.
+# ------------------
+def _factorPanel(lu, perm, start, stop):
+    size = lu.shape[0]
+
+    for i in range(start, stop):
+        p = i
+        for r in range(i + 1, size):
+            if abs(lu[r, i]) > abs(lu[p, i]):
+                p = r
+        if lu[p, i] == 0:
+            return False
+        if p != i:
+            for c in range(size):
+                lu[i, c], lu[p, c] = lu[p, c], lu[i, c]
+            perm[i], perm[p] = perm[p], perm[i]
+
+        for r in range(i + 1, size):
+            lu[r, i] /= lu[i, i]
+            for c in range(i + 1, stop):
+                lu[r, c] -= lu[r, i] * lu[i, c]
+
+    return True
+
+# ------------------
+# _solveLower, _solveUpper
+# Description:
+#   Forward and backward substitution in place on x, with L from the unit
+#   lower triangle of lu and U from its upper triangle.  Rows are taken a
+#   block at a time, so everything but the small diagonal blocks is done by
+#   matrix-matrix products.
+# ------------------
+def _solveLower(lu, x, blockSize):
+    size = lu.shape[0]
+    for start in range(0, size, blockSize):
+        stop = min(start + blockSize, size)
+        x[start:stop] -= lu[start:stop, :start] @ x[:start]
+        for i in range(start + 1, stop):
+            x[i] -= lu[i, start:i] @ x[start:i]
+
+def _solveUpper(lu, x, blockSize):
+    size = lu.shape[0]
+    for stop in range(size, 0, -blockSize):
+        start = max(stop - blockSize, 0)
+        x[start:stop] -= lu[start:stop, stop:] @ x[stop:]
+        for i in range(stop-1, start-1, -1):
+            x[i] -= lu[i, i+1:stop] @ x[i+1:stop]
+            x[i] /= lu[i, i]
+
+# ------------------
+# luSolve
+# Description:
+#   Solves A x = b using the result of luFactor, in O(n^2) per column of b.
+#   b may be a vector or a matrix with one right-hand side per column.  With
+#   condition=True the 1-norm condition estimate is returned after x, for a
+#   few more O(n^2) solves.
+# ------------------
+def luSolve(factors, b, blockSize=BLOCK_SIZE, condition=False):
+    lu, perm, norm = factors
+    x = numpy.array(b, dtype=lu.dtype)[perm]
+
+    #L y = P b, then U x = y.
+    _solveLower(lu, x, blockSize)
+    _solveUpper(lu, x, blockSize)
+
+    if condition:
+        return x, conditionEstimate(factors, blockSize)
+    return x
+
+# ------------------
+# luSolveTranspose
+# Description:
+#   Solves transpose(A) x = b using the result of luFactor.  Since
+#   transpose(A) = transpose(U) transpose(L) P, this is a forward solve with
+#   transpose(U), a backward solve with transpose(L) and then undoing P.
+# ------------------
+def luSolveTranspose(factors, b):
+    lu, perm, norm = factors
+    size = lu.shape[0]
+    x = numpy.array(b, dtype=float)
+
+    for i in range(size):
+        x[i] -= lu[:i, i] @ x[:i]
+        x[i] /= lu[i, i]
+
+    for i in range(size-2, -1, -1):
+        x[i] -= lu[i+1:, i] @ x[i+1:]
+
+    result = numpy.empty_like(x)
+    result[perm] = x
+    return result
+
+# ------------------
+# conditionEstimate
+# Description:
+#   Estimates the 1-norm condition number ||A|| ||inverse(A)|| from the
+#   result of luFactor in O(n^2), using Hager's method as refined by Higham.
+#   ||inverse(A)|| is found by climbing to the column of inverse(A) with the
+#   largest 1-norm, each step one solve with A and one with transpose(A).
+#   The estimate never exceeds the true value and is almost always within
+#   a factor of 3 of it.
+# ------------------
+def conditionEstimate(factors, blockSize=BLOCK_SIZE):
+    lu, perm, norm = factors
+    size = lu.shape[0]
+    if size == 0:
+        return 0.0
+
+    x = numpy.full(size, 1 / size)
+    estimate = 0.0
+
+    with numpy.errstate(over="ignore", invalid="ignore"):
+        for k in range(5):
+            y = luSolve(factors, x, blockSize)
+            newEstimate = abs(y).sum()
+            if k > 0 and newEstimate <= estimate:
+                break
+            estimate = newEstimate
+
+            z = luSolveTranspose(factors, numpy.where(y >= 0, 1.0, -1.0))
+            j = numpy.argmax(abs(z))
+            if k > 0 and abs(z[j]) <= z @ x:
+                break
+            x = numpy.zeros(size)
+            x[j] = 1
+
+        #Higham's extra vector catches matrices the climb is blind to.
+        alternating = (-1) ** numpy.arange(size) * (1 + numpy.arange(size) / max(size - 1, 1))
+        estimate = max(estimate, 2 * abs(luSolve(factors, alternating, blockSize)).sum() / (3 * size))
+
+    return norm * estimate
+
+# ------------------
+# conditionNumber
+# Description:
+#   The exact condition number of matrix in the 1-norm or the 2-norm.  The
+#   2-norm is the ratio of the largest to the smallest singular value, and
+#   the 1-norm comes from the inverse, both O(n^3).  Use conditionEstimate
+#   when a factorization is already at hand.
+# ------------------
+def conditionNumber(matrix, norm=2):
+    matrix = numpy.asarray(matrix, dtype=float)
+
+    if norm == 2:
+        singular = numpy.linalg.svd(matrix, compute_uv=False)
+        return singular[0] / singular[-1] if singular[-1] else numpy.inf
+
+    if norm == 1:
+        try:
+            inverse = invertMatrix(matrix)
+        except ValueError:
+            return numpy.inf
+        return abs(matrix).sum(axis=0).max() * abs(inverse).sum(axis=0).max()
+
+    raise ValueError("norm must be 1 or 2")
+
+def invertMatrix(matrix, blockSize=BLOCK_SIZE, exact=False):
+    #The exact inverse, as Fractions, from fraction-free elimination.
+    if exact:
+        return exactInverse(matrix)
+
+    #Solve against every column of the identity matrix.
+    span = startSpan("invertMatrix", size=matrix.shape[0])
+    inverse = luSolve(luFactor(matrix, blockSize), numpy.identity(matrix.shape[0]), blockSize)
+    if span is not None:
+        recordIteration(span, 1, {}, flops=2 * matrix.shape[0] ** 3)
+    endSpan(span)
+    return inverse
+    
+def illConditionedValue(matrix):
+    # Find the determinant, the numerator of the inequality
+    det = numpy.linalg.det(matrix)
+    
+    # Square the matrix, sum it, and then take the squre root
+    denom = (matrix ** 2).sum() ** 0.5
+    
+    return abs(det) / denom
+
+# ------------------
+# _residual
+# Description:
+#   b - A x in double precision, or in double-double precision, which keeps
+#   about 32 digits.  For double-double every product is split exactly into
+#   a sum of two doubles (Dekker) and every sum keeps its rounding error
+#   (Knuth), a column of A at a time across all the rows.
+# ------------------
+def _residual(matrix, x, b, precision):
+    if precision == "double":
+        return b - matrix @ x
+
+    def split(a):
+        t = 134217729.0 * a
+        high = t - (t - a)
+        return high, a - high
+
+    total = numpy.array(b, dtype=float)
+    error = numpy.zeros_like(total)
+    xHigh, xLow = split(x)
+
+    for j in range(matrix.shape[1]):
+        column = -matrix[:, j].reshape((-1,) + (1,) * (x.ndim - 1))
+        cHigh, cLow = split(column)
+
+        #The product, and exactly what rounding it lost.
+        product = column * x[j]
+        error += ((cHigh * xHigh[j] - product) + cHigh * xLow[j] + cLow * xHigh[j]) + cLow * xLow[j]
+
+        #The sum, and exactly what rounding it lost.
+        newTotal = total + product
+        back = newTotal - total
+        error += (total - (newTotal - back)) + (product - back)
+        total = newTotal
+
+    return total + error
+
+# ------------------
+# refinedSolve
+# Description:
+#   Solves A x = b by mixed-precision iterative refinement.  A is factored
+#   in float32, which is faster and moves half the memory, and the answer is
+#   then corrected in float64: each step finds the residual r = b - A x in
+#   residualPrecision and solves A d = r with the float32 factors.
+#   Refinement stops once the residual is as small as float64 allows (the
+#   test LAPACK uses).  If it stalls, because A is too ill-conditioned for
+#   float32, A is factored again in float64 and refinement continues.
+# Output:
+#   x: The solution, in float64.
+#   report: A dictionary with "steps", the refinement steps taken,
+#           "backwardError", the normwise backward error
+#           ||b - A x|| / (||A|| ||x|| + ||b||) reached, "precision", the
+#           precision of the factors that finished, and "history", the
+#           backward error after each step.
+# ------------------
+def refinedSolve(matrix, b, residualPrecision="double", maxSteps=30, blockSize=BLOCK_SIZE):
+    if residualPrecision not in ("double", "double-double"):
+        raise ValueError("residualPrecision must be double or double-double")
+
+    matrix = numpy.asarray(matrix, dtype=float)
+    b = numpy.asarray(b, dtype=float)
+    size = matrix.shape[0]
+    matrixNorm = abs(matrix).sum(axis=1).max() if size else 0.0
+    tolerance = numpy.finfo(float).eps * size ** 0.5
+
+    history = []
+    steps = 0
+    span = startSpan("refinedSolve", size=size, residualPrecision=residualPrecision)
+
+    for dtype in (numpy.float32, numpy.float64):
+        try:
+            factors = luFactor(matrix, blockSize, dtype)
+        except ValueError:
+            #Singular in float32, but maybe not in float64.
+            if dtype is numpy.float64:
+                raise
+            continue
+
+        x = luSolve(factors, b, blockSize).astype(float)
+        first = len(history)
+
+        with numpy.errstate(over="ignore", invalid="ignore"):
+            while True:
+                r = _residual(matrix, x, b, residualPrecision)
+                xNorm = abs(x).max() if x.size else 0.0
+                rNorm = abs(r).max() if r.size else 0.0
+                history.append(float(rNorm / (matrixNorm * xNorm + abs(b).max())) if b.size and rNorm else 0.0)
+
+                if span is not None:
+                    recordIteration(span, steps, {"backwardError": history[-1], "precision": numpy.dtype(dtype).name},
+                                    flops=4 * size * size)
+
+                if not rNorm > tolerance * matrixNorm * xNorm:
+                    endSpan(span, precision=numpy.dtype(dtype).name)
+                    return x, {"steps": steps, "backwardError": history[-1], 
+                               "precision": numpy.dtype(dtype).name, "history": history}
+
+                #Not halving the backward error, or too many steps, means a stall.
+                if steps >= maxSteps or (len(history) > first + 1 and not history[-1] < 0.5 * history[-2]):
+                    break
+
+                x = x + luSolve(factors, r, blockSize)
+                steps += 1
+
+        maxSteps = steps + maxSteps
+
+    endSpan(span, precision="float64")
+    return x, {"steps": steps, "backwardError": history[-1], "precision": "float64", "history": history}
+
+# ------------------
+# _closedFormAdjugate
+# Description:
+#   The adjugate and determinant of a stack of 1x1 to 4x4 matrices, written
+#   out entry by entry so every operation runs across the whole batch.  The
+#   input and output are laid out (n, n, N), one contiguous array per entry.
+#   The 4x4 case shares the 2x2 minors of the top and bottom row pairs.
+# ------------------
+def _closedFormAdjugate(a):
+    n = a.shape[0]
+
+    if n == 1:
+        return numpy.ones_like(a), a[0, 0]
+
+    if n == 2:
+        adj = numpy.array([[a[1, 1], -a[0, 1]], [-a[1, 0], a[0, 0]]])
+        return adj, a[0, 0] * a[1, 1] - a[0, 1] * a[1, 0]
+
+    if n == 3:
+        #cofactor(r, c) from the 2x2 minor left after removing row r and column c.
+        cof = lambda r, c: (a[(r+1) % 3, (c+1) % 3] * a[(r+2) % 3, (c+2) % 3] - 
+                            a[(r+1) % 3, (c+2) % 3] * a[(r+2) % 3, (c+1) % 3])
+        adj = numpy.array([[cof(c, r) for c in range(3)] for r in range(3)])
+        return adj, a[0, 0] * adj[0, 0] + a[0, 1] * adj[1, 0] + a[0, 2] * adj[2, 0]
+
+    s0 = a[0, 0] * a[1, 1] - a[1, 0] * a[0, 1]
+    s1 = a[0, 0] * a[1, 2] - a[1, 0] * a[0, 2]
+    s2 = a[0, 0] * a[1, 3] - a[1, 0] * a[0, 3]
+    s3 = a[0, 1] * a[1, 2] - a[1, 1] * a[0, 2]
+    s4 = a[0, 1] * a[1, 3] - a[1, 1] * a[0, 3]
+    s5 = a[0, 2] * a[1, 3] - a[1, 2] * a[0, 3]
+    c5 = a[2, 2] * a[3, 3] - a[3, 2] * a[2, 3]
+    c4 = a[2, 1] * a[3, 3] - a[3, 1] * a[2, 3]
+    c3 = a[2, 1] * a[3, 2] - a[3, 1] * a[2, 2]
+    c2 = a[2, 0] * a[3, 3] - a[3, 0] * a[2, 3]
+    c1 = a[2, 0] * a[3, 2] - a[3, 0] * a[2, 2]
+    c0 = a[2, 0] * a[3, 1] - a[3, 0] * a[2, 1]
+
+    adj = numpy.array([
+        [a[1, 1] * c5 - a[1, 2] * c4 + a[1, 3] * c3, -a[0, 1] * c5 + a[0, 2] * c4 - a[0, 3] * c3,
+         a[3, 1] * s5 - a[3, 2] * s4 + a[3, 3] * s3, -a[2, 1] * s5 + a[2, 2] * s4 - a[2, 3] * s3],
+        [-a[1, 0] * c5 + a[1, 2] * c2 - a[1, 3] * c1, a[0, 0] * c5 - a[0, 2] * c2 + a[0, 3] * c1,
+         -a[3, 0] * s5 + a[3, 2] * s2 - a[3, 3] * s1, a[2, 0] * s5 - a[2, 2] * s2 + a[2, 3] * s1],
+        [a[1, 0] * c4 - a[1, 1] * c2 + a[1, 3] * c0, -a[0, 0] * c4 + a[0, 1] * c2 - a[0, 3] * c0,
+         a[3, 0] * s4 - a[3, 1] * s2 + a[3, 3] * s0, -a[2, 0] * s4 + a[2, 1] * s2 - a[2, 3] * s0],
+        [-a[1, 0] * c3 + a[1, 1] * c1 - a[1, 2] * c0, a[0, 0] * c3 - a[0, 1] * c1 + a[0, 2] * c0,
+         -a[3, 0] * s3 + a[3, 1] * s1 - a[3, 2] * s0, a[2, 0] * s3 - a[2, 1] * s1 + a[2, 2] * s0]
+    ])
+    return adj, s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+# ------------------
+# _batchLUFactor
+# Description:
+#   luFactor for a stack of matrices (N, n, n), one elimination step at a
+#   time across the whole batch, with each matrix choosing its own pivots.
+#   sign is the sign of each permutation, for the determinant.
+# ------------------
+def _batchLUFactor(matrices):
+    lu = numpy.array(matrices, dtype=float)
+    count, size = lu.shape[:2]
+    rows = numpy.arange(count)
+    perm = numpy.tile(numpy.arange(size), (count, 1))
+    sign = numpy.ones(count)
+
+    for i in range(size):
+        #Every matrix swaps its own largest entry onto the diagonal.
+        p = i + numpy.argmax(abs(lu[:, i:, i]), axis=1)
+        lu[rows, i], lu[rows, p] = lu[rows, p], lu[rows, i].copy()
+        perm[rows, i], perm[rows, p] = perm[rows, p], perm[rows, i]
+        sign[p != i] *= -1
+
+        lu[:, i+1:, i] /= lu[:, i, i, None]
+        lu[:, i+1:, i+1:] -= lu[:, i+1:, i, None] * lu[:, i, None, i+1:]
+
+    return lu, perm, sign
+
+# ------------------
+# _batchLUSolve
+# Description:
+#   luSolve across a batch, b is (N, n) or (N, n, k).
+# ------------------
+def _batchLUSolve(lu, perm, b):
+    size = lu.shape[1]
+    index = perm if b.ndim == 2 else perm[:, :, None]
+    x = numpy.take_along_axis(b, index, axis=1)
+
+    for i in range(1, size):
+        x[:, i] -= numpy.einsum("nj,nj...->n...", lu[:, i, :i], x[:, :i])
+
+    for i in range(size-1, -1, -1):
+        x[:, i] -= numpy.einsum("nj,nj...->n...", lu[:, i, i+1:], x[:, i+1:])
+        x[:, i] /= lu[:, i, i, None] if b.ndim == 3 else lu[:, i, i]
+
+    return x
+
+# Matrices handled together by the batch functions.  Small enough that every
+# temporary of the closed forms stays in cache.
+BATCH_CHUNK = 8192
+
+# ------------------
+# _batchInvert, _batchSolve, _batchDeterminant
+# Description:
+#   The kernels for one chunk of a batch.  Matrices up to 4x4 use the closed
+#   forms, larger ones the batched LU.
+# ------------------
+def _batchInvert(matrices):
+    size = matrices.shape[1]
+    if size <= 4:
+        adj, det = _closedFormAdjugate(numpy.ascontiguousarray(matrices.transpose(1, 2, 0)))
+        return (adj * (1 / det)).transpose(2, 0, 1)
+
+    lu, perm, sign = _batchLUFactor(matrices)
+    return _batchLUSolve(lu, perm, numpy.broadcast_to(numpy.identity(size), matrices.shape))
+
+def _batchSolve(matrices, b):
+    size = matrices.shape[1]
+    if size <= 4:
+        adj, det = _closedFormAdjugate(numpy.ascontiguousarray(matrices.transpose(1, 2, 0)))
+        bT = numpy.moveaxis(b, 0, -1)
+        #x_i = sum over j of adj_ij b_j / det, one entry at a time.
+        x = numpy.array([sum(adj[i, j] * bT[j] for j in range(size)) for i in range(size)]) * (1 / det)
+        return numpy.moveaxis(x, -1, 0)
+
+    lu, perm, sign = _batchLUFactor(matrices)
+    return _batchLUSolve(lu, perm, b)
+
+def _batchDeterminant(matrices):
+    if matrices.shape[1] <= 4:
+        return _closedFormAdjugate(numpy.ascontiguousarray(matrices.transpose(1, 2, 0)))[1]
+
+    lu, perm, sign = _batchLUFactor(matrices)
+    return sign * numpy.prod(numpy.diagonal(lu, axis1=1, axis2=2), axis=1)
+
+# ------------------
+# _closedForm3
+# Description:
+#   The 3x3 closed form as loops for Acceleration.compiled, one matrix at a
+#   time so the cofactors stay in registers and the batch is read once.
+#   Does the same operations in the same order as _closedFormAdjugate and
+#   _batchSolve.  b and x are (N, 3, k), and k = 0 only fills det.
+# ------------------
+def _closedForm3(matrices, b, x, det):
+    count = matrices.shape[0]
+
+    #256 matrices at a time, so the second pass finds them still in cache.
+    for start in range(0, count, 256):
+        stop = min(start + 256, count)
+
+        for n in range(start, stop):
+            a = matrices[n]
+            det[n] = (a[0, 0] * (a[1, 1] * a[2, 2] - a[1, 2] * a[2, 1]) +
+                      a[0, 1] * (a[1, 2] * a[2, 0] - a[1, 0] * a[2, 2]) +
+                      a[0, 2] * (a[1, 0] * a[2, 1] - a[1, 1] * a[2, 0]))
+
+        if b.shape[2] == 0:
+            continue
+
+        #An array division, so a singular matrix gives inf instead of raising.
+        scale = 1 / det[start:stop]
+
+        for n in range(start, stop):
+            a = matrices[n]
+            c00 = a[1, 1] * a[2, 2] - a[1, 2] * a[2, 1]
+            c01 = a[1, 2] * a[2, 0] - a[1, 0] * a[2, 2]
+            c02 = a[1, 0] * a[2, 1] - a[1, 1] * a[2, 0]
+            c10 = a[2, 1] * a[0, 2] - a[2, 2] * a[0, 1]
+            c11 = a[2, 2] * a[0, 0] - a[2, 0] * a[0, 2]
+            c12 = a[2, 0] * a[0, 1] - a[2, 1] * a[0, 0]
+            c20 = a[0, 1] * a[1, 2] - a[0, 2] * a[1, 1]
+            c21 = a[0, 2] * a[1, 0] - a[0, 0] * a[1, 2]
+            c22 = a[0, 0] * a[1, 1] - a[0, 1] * a[1, 0]
+            r = scale[n - start]
+
+            for k in range(b.shape[2]):
+                b0, b1, b2 = b[n, 0, k], b[n, 1, k], b[n, 2, k]
+                x[n, 0, k] = (c00 * b0 + c10 * b1 + c20 * b2) * r
+                x[n, 1, k] = (c01 * b0 + c11 * b1 + c21 * b2) * r
+                x[n, 2, k] = (c02 * b0 + c12 * b1 + c22 * b2) * r
+
+# ------------------
+# _chunked
+# Description:
+#   Runs kernel over the batch BATCH_CHUNK matrices at a time, filling one
+#   output array of outShape.
+# ------------------
+def _chunked(kernel, outShape, *arrays):
+    out = numpy.empty(outShape)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        for start in range(0, outShape[0], BATCH_CHUNK):
+            out[start:start+BATCH_CHUNK] = kernel(*(a[start:start+BATCH_CHUNK] for a in arrays))
+    return out
+
+# ------------------
+# _closedForm3Kernel
+# Description:
+#   The compiled _closedForm3 for a batch of 3x3 matrices, or None when the
+#   batch is another size or the backend is "python".  As plain Python the
+#   loops would be far slower than the NumPy closed forms.
+# ------------------
+def _closedForm3Kernel(matrices):
+    if matrices.ndim != 3 or matrices.shape[1:] != (3, 3):
+        return None
+    return compiled(_closedForm3)
+
+# ------------------
+# batchInvertMatrix, batchSolve, batchIllConditionedValue
+# Description:
+#   invertMatrix, luSolve and illConditionedValue for a stack of matrices of
+#   shape (N, n, n), vectorized across the batch instead of looping over it.
+#   Matrices up to 4x4 use closed forms from the adjugate, larger ones a
+#   batched LU with partial pivoting per matrix.  A singular matrix gives
+#   inf or nan in its own results without stopping the rest of the batch.
+#   For batchSolve, b is (N, n) or (N, n, k).
+#
+#   3x3 batches use _closedForm3 when it is compiled.  On one core with
+#   about 6.5 GB/s of memory bandwidth, a batch of a million solves 45 to
+#   50 million systems a second, inverts 20 to 28 million matrices and gives
+#   35 to 40 million ill-conditioned values, against 13 to 15, 11 to 14 and
+#   10 to 18 million for the NumPy closed forms, which make a pass over
+#   memory for every temporary.  Each is close to the time to read the
+#   batch and write the results, so faster memory, not more arithmetic,
+#   would be the next step.
+# ------------------
+def batchInvertMatrix(matrices):
+    matrices = numpy.asarray(matrices, dtype=float)
+    kernel = _closedForm3Kernel(matrices)
+    if kernel is not None:
+        inverse = numpy.empty(matrices.shape)
+        kernel(matrices, numpy.broadcast_to(numpy.identity(3), matrices.shape), inverse, numpy.empty(len(matrices)))
+        return inverse
+
+    return _chunked(_batchInvert, matrices.shape, matrices)
+
+def batchSolve(matrices, b):
+    matrices = numpy.asarray(matrices, dtype=float)
+    b = numpy.asarray(b, dtype=float)
+    kernel = _closedForm3Kernel(matrices)
+    if kernel is not None:
+        shape = (len(b), 3, 1 if b.ndim == 2 else b.shape[2])
+        x = numpy.empty(shape)
+        kernel(matrices, b.reshape(shape), x, numpy.empty(len(b)))
+        return x.reshape(b.shape)
+
+    return _chunked(_batchSolve, b.shape, matrices, b)
+
+def batchIllConditionedValue(matrices):
+    matrices = numpy.asarray(matrices, dtype=float)
+    kernel = _closedForm3Kernel(matrices)
+    if kernel is not None:
+        det = numpy.empty(len(matrices))
+        kernel(matrices, numpy.empty((len(matrices), 3, 0)), numpy.empty((len(matrices), 3, 0)), det)
+    else:
+        det = _chunked(_batchDeterminant, matrices.shape[:1], matrices)
+    return abs(det) / numpy.einsum("nij,nij->n", matrices, matrices) ** 0.5
+
+# ------------------
+# _bandFromEntries
+# Description:
+#   LAPACK band storage from the nonzero entries of an n x n matrix.  Entry
+#   A[i, j] is band[upper + i - j, j], so each column of band holds one
+#   column of A from upper rows above the diagonal to lower rows below it.
+#   extra empty rows on top leave room for fill-in from pivoting.
+# ------------------
+def _bandFromEntries(rows, cols, values, size, lower, upper, extra=0):
+    if len(rows) and ((rows - cols).max() > lower or (cols - rows).max() > upper):
+        raise ValueError("Matrix has entries outside the band")
+
+    band = numpy.zeros((extra + lower + upper + 1, size))
+    numpy.add.at(band, (extra + upper + rows - cols, cols), values)
+    return band
+
+# ------------------
+# toBanded
+# Description:
+#   A banded matrix, stored as a dictionary with the band in "band" and the
+#   number of diagonals below and above the main one in "lower" and "upper".
+#   Memory is O(n (lower + upper)) instead of O(n^2).  When lower and upper
+#   are not given they are read off the nonzeros of matrix.
+# ------------------
+def toBanded(matrix, lower=None, upper=None):
+    matrix = numpy.asarray(matrix, dtype=float)
+    rows, cols = numpy.nonzero(matrix)
+
+    if lower is None:
+        lower = max(int((rows - cols).max(initial=0)), 0)
+    if upper is None:
+        upper = max(int((cols - rows).max(initial=0)), 0)
+
+    band = _bandFromEntries(rows, cols, matrix[rows, cols], matrix.shape[0], lower, upper)
+    return {"band": band, "lower": lower, "upper": upper}
+
+# ------------------
+# bandedMatVec
+# Description:
+#   A x for a banded matrix, one diagonal at a time.
+# ------------------
+def bandedMatVec(banded, x):
+    band, lower, upper = banded["band"], banded["lower"], banded["upper"]
+    x = numpy.asarray(x, dtype=float)
+    size = band.shape[1]
+    y = numpy.zeros(x.shape)
+
+    #Diagonal k holds A[i, i + k], k > 0 above the main one.
+    for k in range(max(-lower, 1 - size), min(upper, size - 1) + 1):
+        if k >= 0:
+            diagonal = band[upper - k, k:]
+            y[:size-k] += (diagonal * x[k:].T).T
+        else:
+            diagonal = band[upper - k, :size+k]
+            y[-k:] += (diagonal * x[:size+k].T).T
+
+    return y
+
+# ------------------
+# bandedFactor
+# Description:
+#   LU factorization with partial pivoting of a banded matrix, as in LAPACK's
+#   gbtrf.  Pivoting can widen U to lower + upper diagonals above the main
+#   one, so the factors get lower extra rows of storage.  Each column costs
+#   O(lower (lower + upper)), all in one vectorized update, for O(n bw^2)
+#   time and O(n bw) memory in all.  Pass the result to bandedSolve.
+# ------------------
+def bandedFactor(banded):
+    lower, upper = banded["lower"], banded["upper"]
+    size = banded["band"].shape[1]
+    lu = numpy.vstack((numpy.zeros((lower, size)), banded["band"]))
+    pivots = numpy.arange(size)
+    diagonal = lower + upper
+
+    for j in range(size):
+        below = min(lower, size - 1 - j)
+        last = min(j + diagonal, size - 1)
+        cols = numpy.arange(j, last + 1)
+
+        #Swap the largest entry within the band onto the diagonal.
+        p = j + numpy.argmax(abs(lu[diagonal:diagonal + below + 1, j]))
+        if lu[diagonal + p - j, j] == 0:
+            raise ValueError("Matrix is singular")
+        if p != j:
+            pivots[j] = p
+            rowJ = lu[diagonal + j - cols, cols]
+            lu[diagonal + j - cols, cols] = lu[diagonal + p - cols, cols]
+            lu[diagonal + p - cols, cols] = rowJ
+
+        if below:
+            lu[diagonal + 1:diagonal + below + 1, j] /= lu[diagonal, j]
+            r = numpy.arange(j + 1, j + below + 1)[:, None]
+            c = cols[None, 1:]
+            lu[diagonal + r - c, c] -= lu[diagonal + r - j, j] * lu[diagonal + j - c, c]
+
+    return lu, pivots, lower, upper
+
+# ------------------
+# bandedSolve
+# Description:
+#   Solves A x = b with the result of bandedFactor in O(n bw) per column of
+#   b, b a vector or a matrix with one right-hand side per column.
+# ------------------
+def bandedSolve(factors, b):
+    lu, pivots, lower, upper = factors
+    size = lu.shape[1]
+    diagonal = lower + upper
+    x = numpy.array(b, dtype=float)
+
+    #Apply the row swaps and L as elimination went.
+    for j in range(size):
+        p = pivots[j]
+        if p != j:
+            x[[j, p]] = x[[p, j]]
+        below = min(lower, size - 1 - j)
+        if below:
+            x[j+1:j+1+below] -= numpy.multiply.outer(lu[diagonal + 1:diagonal + below + 1, j], x[j])
+
+    #Backward substitution with U, a column at a time.
+    for j in range(size-1, -1, -1):
+        x[j] /= lu[diagonal, j]
+        above = min(diagonal, j)
+        if above:
+            x[j-above:j] -= numpy.multiply.outer(lu[diagonal - above:diagonal, j], x[j])
+
+    return x
+
+# ------------------
+# csrMatrix, csrFromTriplets
+# Description:
+#   A sparse matrix in compressed sparse row form, stored as a dictionary.
+#   The values of row i are data[indptr[i]:indptr[i+1]], in the columns
+#   indices[indptr[i]:indptr[i+1]].  csrMatrix takes a dense array, and
+#   csrFromTriplets takes (row, column, value) lists, adding up duplicates.
+# ------------------
+def csrFromTriplets(rows, cols, values, shape):
+    rows = numpy.asarray(rows, dtype=numpy.int64)
+    cols = numpy.asarray(cols, dtype=numpy.int64)
+    values = numpy.asarray(values, dtype=float)
+
+    #Sort by row then column and add up repeated entries.
+    keys, inverse = numpy.unique(rows * shape[1] + cols, return_inverse=True)
+    data = numpy.bincount(inverse.ravel(), weights=values, minlength=len(keys))
+    rows, indices = numpy.divmod(keys, shape[1])
+
+    indptr = numpy.zeros(shape[0] + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(rows, minlength=shape[0]), out=indptr[1:])
+
+    return {"data": data, "indices": indices, "indptr": indptr, "shape": tuple(shape)}
+
+def csrMatrix(matrix):
+    matrix = numpy.asarray(matrix, dtype=float)
+    rows, cols = numpy.nonzero(matrix)
+    return csrFromTriplets(rows, cols, matrix[rows, cols], matrix.shape)
+
+# ------------------
+# csrMatVec
+# Description:
+#   A x for a CSR matrix, x a vector or a matrix.  Every product is formed in
+#   one operation, then each row's products are summed with one reduceat.
+# ------------------
+def csrMatVec(csr, x):
+    data, indices, indptr = csr["data"], csr["indices"], csr["indptr"]
+    x = numpy.asarray(x, dtype=float)
+    products = (data * x[indices].T).T
+
+    y = numpy.zeros((csr["shape"][0],) + x.shape[1:])
+    starts = indptr[:-1]
+    nonEmpty = starts < indptr[1:]
+    if nonEmpty.any():
+        y[nonEmpty] = numpy.add.reduceat(products, starts[nonEmpty], axis=0)
+    return y
+
+# ------------------
+# reverseCuthillMcKee
+# Description:
+#   An ordering of the rows and columns of a square CSR matrix that brings
+#   its nonzeros close to the diagonal.  A breadth-first search of the graph
+#   of the matrix, starting each piece from a node of least degree and
+#   visiting neighbours by increasing degree, then reversed.
+# ------------------
+def reverseCuthillMcKee(csr):
+    size = csr["shape"][0]
+    rows = numpy.repeat(numpy.arange(size), numpy.diff(csr["indptr"]))
+
+    #The graph of A + transpose(A), without the diagonal.
+    offDiagonal = rows != csr["indices"]
+    rows, cols = rows[offDiagonal], csr["indices"][offDiagonal]
+    graph = csrFromTriplets(numpy.concatenate((rows, cols)), numpy.concatenate((cols, rows)),
+                            numpy.ones(2 * len(rows)), (size, size))
+    indptr, indices = graph["indptr"], graph["indices"]
+    degree = numpy.diff(indptr)
+
+    order = []
+    visited = numpy.zeros(size, dtype=bool)
+    for start in numpy.argsort(degree, kind="stable"):
+        if visited[start]:
+            continue
+        visited[start] = True
+        #order is also the queue, head is the next node to visit.
+        head = len(order)
+        order.append(start)
+        while head < len(order):
+            node = order[head]
+            head += 1
+            neighbours = indices[indptr[node]:indptr[node+1]]
+            neighbours = neighbours[~visited[neighbours]]
+            neighbours = neighbours[numpy.argsort(degree[neighbours], kind="stable")]
+            visited[neighbours] = True
+            order.extend(neighbours.tolist())
+
+    return numpy.array(order[::-1], dtype=numpy.int64)
+
+# ------------------
+# csrFactor, csrSolve
+# Description:
+#   Factors a square CSR matrix by reordering it with reverseCuthillMcKee and
+#   then using bandedFactor on the reordered band, so the work is O(n bw^2)
+#   for the reordered bandwidth bw.  Matrices from discretizations, whose
+#   nonzeros follow a mesh, get a small bandwidth this way.  csrSolve solves
+#   A x = b with the result of csrFactor.
+# ------------------
+def csrFactor(csr):
+    size = csr["shape"][0]
+    if csr["shape"] != (size, size):
+        raise ValueError("Matrix must be square")
+
+    order = reverseCuthillMcKee(csr)
+    position = numpy.empty(size, dtype=numpy.int64)
+    position[order] = numpy.arange(size)
+
+    #Entry (i, j) moves to (position[i], position[j]).
+    rows = position[numpy.repeat(numpy.arange(size), numpy.diff(csr["indptr"]))]
+    cols = position[csr["indices"]]
+    lower = max(int((rows - cols).max(initial=0)), 0)
+    upper = max(int((cols - rows).max(initial=0)), 0)
+
+    band = _bandFromEntries(rows, cols, csr["data"], size, lower, upper)
+    return order, bandedFactor({"band": band, "lower": lower, "upper": upper})
+
+def csrSolve(factors, b):
+    order, bandedFactors = factors
+    b = numpy.asarray(b, dtype=float)
+    x = numpy.empty_like(b)
+    x[order] = bandedSolve(bandedFactors, b[order])
+    return x
+
+# ------------------
+# _integerRows
+# Description:
+#   Turns rows of integers, Fractions or floats (taken at their exact binary
+#   value) into Python integers, scaling each row by the least common
+#   multiple of its denominators.  Scaling a row of [A | b] does not change
+#   the solution, and scales the determinant of A by the same factor.
+# ------------------
+def _integerRows(rows):
+    rows = [[Fraction(value) for value in row] for row in rows]
+    scales = [functools.reduce(_lcm, (value.denominator for value in row), 1) for row in rows]
+    integers = numpy.array([[int(value * scale) for value in row] for row, scale in zip(rows, scales)], dtype=object)
+    return integers.reshape(len(rows), -1 if rows else 0), scales
+
+# ------------------
+# _lcm
+# Description:
+#   The least common multiple of two positive integers, math.lcm is only in
+#   Python 3.9 and later.
+# ------------------
+def _lcm(a, b):
+    return a * b // math.gcd(a, b)
+
+# ------------------
+# _bareiss
+# Description:
+#   Bareiss fraction-free elimination on the integer matrix [M | B], M the
+#   first size columns.  Each step is
+#       m_ij = (m_kk m_ij - m_ik m_kj) / (previous pivot),
+#   a division that is always exact, so every entry stays an integer minor
+#   of M and grows only linearly in bits with n.  Rows are swapped when a
+#   pivot is zero.  Back substitution is fraction-free too, since the last
+#   pivot times the solution is an integer by Cramer's rule.
+# Output:
+#   det: The determinant of M.
+#   y: The last pivot times the solution of M x = B, None if M is singular.
+#   pivot: The last pivot, which is det up to sign.
+# ------------------
+def _bareiss(augmented, size):
+    m = augmented.copy()
+    sign = 1
+    previous = 1
+
+    for k in range(size):
+        if m[k, k] == 0:
+            nonzero = [i for i in range(k + 1, size) if m[i, k] != 0]
+            if not nonzero:
+                return 0, None, 0
+            m[[k, nonzero[0]]] = m[[nonzero[0], k]]
+            sign = -sign
+
+        m[k+1:, k+1:] = (m[k, k] * m[k+1:, k+1:] - numpy.multiply.outer(m[k+1:, k], m[k, k+1:])) // previous
+        m[k+1:, k] = 0
+        previous = m[k, k]
+
+    pivot = previous
+    y = numpy.empty((size, m.shape[1] - size), dtype=object)
+    for i in range(size-1, -1, -1):
+        y[i] = (pivot * m[i, size:] - m[i, i+1:size] @ y[i+1:]) // m[i, i] if i < size - 1 else m[i, size:] * 1
+
+    return sign * pivot, y, pivot
+
+# ------------------
+# exactDeterminant, exactSolve, exactInverse
+# Description:
+#   Exact answers for a matrix of integers or Fractions by Bareiss
+#   elimination, returned as Fractions (in object arrays for exactSolve and
+#   exactInverse).  Useful as ground truth for the floating point routines,
+#   such as the Hilbert matrices of Problem 1.  b may be a vector or a
+#   matrix with one right-hand side per column.
+# ------------------
+def exactDeterminant(matrix):
+    integers, scales = _integerRows(matrix)
+    det = _bareiss(integers, len(integers))[0]
+    return Fraction(det, math.prod(scales))
+
+def exactSolve(matrix, b):
+    b = numpy.asarray(b, dtype=object)
+    rows = [list(row) + list(rhs) for row, rhs in zip(numpy.asarray(matrix, dtype=object), b.reshape(len(b), -1))]
+    integers, scales = _integerRows(rows)
+
+    det, y, pivot = _bareiss(integers, len(integers))
+    if y is None:
+        raise ValueError("Matrix is singular")
+
+    return numpy.array([Fraction(value, pivot) for value in y.ravel()], dtype=object).reshape(b.shape)
+
+def exactInverse(matrix):
+    size = len(matrix)
+    return exactSolve(matrix, numpy.identity(size, dtype=int).astype(object))
+
+# ------------------
+# _operator
+# Description:
+#   A function computing A x for the iterative solvers, from a dense array,
+#   a CSR or banded matrix, or a function that is already one.
+# ------------------
+def _operator(matrix):
+    if callable(matrix):
+        return matrix
+    if isinstance(matrix, dict) and "indptr" in matrix:
+        return lambda x: csrMatVec(matrix, x)
+    if isinstance(matrix, dict) and "band" in matrix:
+        return lambda x: bandedMatVec(matrix, x)
+
+    matrix = numpy.asarray(matrix, dtype=float)
+    return lambda x: matrix @ x
+
+# ------------------
+# _matVecFlops
+# Description:
+#   The floating point operations of one product A x, 0 when A is a
+#   function and there is no way to tell.
+# ------------------
+def _matVecFlops(matrix):
+    if callable(matrix):
+        return 0
+    if isinstance(matrix, dict) and "indptr" in matrix:
+        return 2 * len(matrix["data"])
+    if isinstance(matrix, dict) and "band" in matrix:
+        return 2 * matrix["band"].size
+    return 2 * numpy.size(matrix)
+
+# ------------------
+# _diagonal
+# Description:
+#   The main diagonal of a dense, CSR or banded matrix.
+# ------------------
+def _diagonal(matrix):
+    if isinstance(matrix, dict) and "indptr" in matrix:
+        rows = numpy.repeat(numpy.arange(matrix["shape"][0]), numpy.diff(matrix["indptr"]))
+        onDiagonal = rows == matrix["indices"]
+        return numpy.bincount(rows[onDiagonal], weights=matrix["data"][onDiagonal], minlength=matrix["shape"][0])
+    if isinstance(matrix, dict) and "band" in matrix:
+        return matrix["band"][matrix["upper"]].copy()
+
+    return numpy.diag(numpy.asarray(matrix, dtype=float)).copy()
+
+# ------------------
+# jacobiPreconditioner
+# Description:
+#   Divides by the diagonal of the matrix, which evens out badly scaled rows
+#   for the cost of one multiply per entry.
+# ------------------
+def jacobiPreconditioner(matrix):
+    inverse = 1 / _diagonal(matrix)
+    return lambda r: (inverse * r.T).T
+
+# ------------------
+# blockJacobiPreconditioner
+# Description:
+#   Solves with the diagonal blocks of blockSize rows each, inverted once up
+#   front as a batch.  The last block is padded with the identity.
+# ------------------
+def blockJacobiPreconditioner(matrix, blockSize):
+    if isinstance(matrix, dict) and "indptr" in matrix:
+        size = matrix["shape"][0]
+        rows = numpy.repeat(numpy.arange(size), numpy.diff(matrix["indptr"]))
+        cols = matrix["indices"]
+        inBlock = rows // blockSize == cols // blockSize
+        entries = rows[inBlock], cols[inBlock], matrix["data"][inBlock]
+    else:
+        matrix = numpy.asarray(matrix, dtype=float)
+        size = matrix.shape[0]
+        rows, cols = numpy.nonzero(matrix)
+        inBlock = rows // blockSize == cols // blockSize
+        entries = rows[inBlock], cols[inBlock], matrix[rows[inBlock], cols[inBlock]]
+
+    count = -(-size // blockSize)
+    padded = count * blockSize
+    blocks = numpy.zeros((count, blockSize, blockSize))
+    padding = numpy.arange(size, padded)
+    blocks[padding // blockSize, padding % blockSize, padding % blockSize] = 1
+
+    rows, cols, values = entries
+    numpy.add.at(blocks, (rows // blockSize, rows % blockSize, cols % blockSize), values)
+    inverses = batchInvertMatrix(blocks)
+
+    def apply(r):
+        extra = r.shape[1:]
+        padR = numpy.zeros((padded,) + extra)
+        padR[:size] = r
+        z = numpy.einsum("bij,bj...->bi...", inverses, padR.reshape((count, blockSize) + extra))
+        return z.reshape((padded,) + extra)[:size]
+
+    return apply
+
+# ------------------
+# incompleteCholesky
+# Description:
+#   The incomplete Cholesky factorization IC(0) of a symmetric positive
+#   definite CSR matrix: L L^T is close to A and L keeps exactly the
+#   nonzeros of the lower triangle of A.  shift adds shift times the
+#   diagonal before factoring, for matrices where IC(0) breaks down.
+#   Returns the preconditioner, which solves L L^T z = r.
+# ------------------
+def incompleteCholesky(csr, shift=0.0):
+    size = csr["shape"][0]
+    indptr, indices, data = csr["indptr"], csr["indices"], csr["data"]
+
+    #L a row at a time, each row a dictionary of column to value.
+    lower = []
+    for i in range(size):
+        row = {}
+        for position in range(indptr[i], indptr[i+1]):
+            j = indices[position]
+            if j <= i:
+                row[j] = data[position] * (1 + shift if j == i else 1)
+        if i not in row:
+            raise ValueError(f"IC(0) needs every diagonal entry, row {i} has none")
+
+        for k in sorted(row):
+            if k < i:
+                common = sum(value * lower[k].get(j, 0.0) for j, value in row.items() if j < k)
+                row[k] = (row[k] - common) / lower[k][k]
+            else:
+                pivot = row[k] - sum(value * value for j, value in row.items() if j < k)
+                if pivot <= 0:
+                    raise ValueError("Incomplete Cholesky broke down, try a larger shift")
+                row[k] = pivot ** 0.5
+        lower.append(row)
+
+    #L as CSR for the forward solve, and its transpose for the backward one.
+    rows = numpy.repeat(numpy.arange(size), [len(row) for row in lower])
+    cols = numpy.array([j for row in lower for j in row], dtype=numpy.int64)
+    values = numpy.array([value for row in lower for value in row.values()])
+    L = csrFromTriplets(rows, cols, values, (size, size))
+    LT = csrFromTriplets(cols, rows, values, (size, size))
+    diagonal = numpy.array([row[i] for i, row in enumerate(lower)])
+
+    def apply(r):
+        y = numpy.array(r, dtype=float)
+        for i in range(size):
+            span = slice(L["indptr"][i], L["indptr"][i+1] - 1)
+            y[i] = (y[i] - L["data"][span] @ y[L["indices"][span]]) / diagonal[i]
+        for i in range(size-1, -1, -1):
+            span = slice(LT["indptr"][i] + 1, LT["indptr"][i+1])
+            y[i] = (y[i] - LT["data"][span] @ y[LT["indices"][span]]) / diagonal[i]
+        return y
+
+    return apply
+
+# ------------------
+# conjugateGradient
+# Description:
+#   Solves A x = b for a symmetric positive definite A by the preconditioned
+#   conjugate gradient method.  Only products A x are needed, so matrix may
+#   be a function, a CSR or banded matrix or a dense array.  Stops when the
+#   residual is tol times as large as b, or after maxIterations.
+# Output:
+#   x: The solution.
+#   history: The residual norm ||b - A x|| after each iteration, starting
+#            with the initial guess.
+# ------------------
+def conjugateGradient(matrix, b, x0=None, tol=1e-10, maxIterations=None, preconditioner=None):
+    apply = _operator(matrix)
+    b = numpy.asarray(b, dtype=float)
+    x = numpy.zeros_like(b) if x0 is None else numpy.array(x0, dtype=float)
+    maxIterations = 10 * len(b) if maxIterations is None else maxIterations
+    precondition = preconditioner or (lambda r: r)
+
+    r = b - apply(x)
+    z = precondition(r)
+    p = z.copy()
+    rz = r @ z
+    history = [numpy.linalg.norm(r)]
+    target = tol * numpy.linalg.norm(b)
+    span = startSpan("conjugateGradient", size=len(b))
+
+    for iteration in range(maxIterations):
+        if history[-1] <= target:
+            break
+
+        q = apply(p)
+        alpha = rz / (p @ q)
+        x += alpha * p
+        r -= alpha * q
+        history.append(numpy.linalg.norm(r))
+
+        z = precondition(r)
+        rzNew = r @ z
+        p = z + (rzNew / rz) * p
+        rz = rzNew
+
+        if span is not None:
+            recordIteration(span, iteration + 1, {"residual": history[-1]}, evaluations=1,
+                            flops=_matVecFlops(matrix) + 10 * len(b))
+
+    endSpan(span, residual=history[-1])
+    return x, history
+
+# ------------------
+# gmres
+# Description:
+#   Solves A x = b for a general A by restarted GMRES with right
+#   preconditioning.  Each cycle builds an orthonormal Krylov basis of up to
+#   restart vectors by Arnoldi, and the least-squares problem on the
+#   Hessenberg matrix is kept solved by Givens rotations, so the residual
+#   is known at every iteration without forming x.
+# Output:
+#   x: The solution.
+#   history: The residual norm after each iteration, starting with the
+#            initial guess.
+# ------------------
+def gmres(matrix, b, x0=None, tol=1e-10, restart=30, maxIterations=None, preconditioner=None):
+    apply = _operator(matrix)
+    b = numpy.asarray(b, dtype=float)
+    x = numpy.zeros_like(b) if x0 is None else numpy.array(x0, dtype=float)
+    maxIterations = 10 * len(b) if maxIterations is None else maxIterations
+    precondition = preconditioner or (lambda r: r)
+
+    r = b - apply(x)
+    history = [numpy.linalg.norm(r)]
+    target = tol * numpy.linalg.norm(b)
+    iterations = 0
+    span = startSpan("gmres", size=len(b), restart=restart)
+
+    while history[-1] > target and iterations < maxIterations:
+        basis = numpy.zeros((restart + 1, len(b)))
+        hessenberg = numpy.zeros((restart + 1, restart))
+        cosines = numpy.zeros(restart)
+        sines = numpy.zeros(restart)
+        g = numpy.zeros(restart + 1)
+        g[0] = history[-1]
+        basis[0] = r / g[0]
+
+        for j in range(restart):
+            #Arnoldi, with modified Gram-Schmidt.
+            w = apply(precondition(basis[j]))
+            for i in range(j + 1):
+                hessenberg[i, j] = w @ basis[i]
+                w -= hessenberg[i, j] * basis[i]
+            norm = numpy.linalg.norm(w)
+            hessenberg[j + 1, j] = norm
+
+            #Apply the earlier rotations to the new column, then make a new one.
+            for i in range(j):
+                hessenberg[i, j], hessenberg[i + 1, j] = (cosines[i] * hessenberg[i, j] + sines[i] * hessenberg[i + 1, j],
+                                                          -sines[i] * hessenberg[i, j] + cosines[i] * hessenberg[i + 1, j])
+            radius = numpy.hypot(hessenberg[j, j], hessenberg[j + 1, j])
+            cosines[j], sines[j] = hessenberg[j, j] / radius, hessenberg[j + 1, j] / radius
+            hessenberg[j, j] = radius
+            hessenberg[j + 1, j] = 0
+            g[j + 1] = -sines[j] * g[j]
+            g[j] *= cosines[j]
+
+            history.append(abs(g[j + 1]))
+            iterations += 1
+
+            if span is not None:
+                recordIteration(span, iterations, {"residual": history[-1]}, evaluations=1,
+                                flops=_matVecFlops(matrix) + 4 * (j + 1) * len(b))
+
+            #A zero norm means the Krylov space holds the exact solution.
+            if abs(g[j + 1]) <= target or iterations >= maxIterations or norm == 0:
+                break
+            basis[j + 1] = w / norm
+
+        #x moves by the preconditioned combination of the basis.
+        steps = j + 1
+        y = numpy.linalg.solve(numpy.triu(hessenberg[:steps, :steps]), g[:steps])
+        x += precondition(y @ basis[:steps])
+        r = b - apply(x)
+        history[-1] = numpy.linalg.norm(r)
+
+    endSpan(span, residual=history[-1])
+    return x, history
+
+# ------------------
+# sor
+# Description:
+#   Successive over-relaxation, Gauss-Seidel for omega = 1.  Each sweep
+#   updates x one row at a time using the newest values, and a few sweeps
+#   make a cheap smoother.  Needs the entries of A, so matrix is a dense
+#   array or a CSR matrix.
+# Output:
+#   x: The solution after the last sweep.
+#   history: The residual norm after each sweep, starting with the initial
+#            guess.
+# ------------------
+def sor(matrix, b, x0=None, omega=1.0, tol=1e-10, maxIterations=100):
+    b = numpy.asarray(b, dtype=float)
+    x = numpy.zeros_like(b) if x0 is None else numpy.array(x0, dtype=float)
+    size = len(b)
+
+    if not (isinstance(matrix, dict) and "indptr" in matrix):
+        matrix = csrMatrix(matrix)
+    indptr, indices, data = matrix["indptr"], matrix["indices"], matrix["data"]
+    diagonal = _diagonal(matrix)
+
+    history = [numpy.linalg.norm(b - csrMatVec(matrix, x))]
+    target = tol * numpy.linalg.norm(b)
+    span = startSpan("sor", size=size, omega=omega)
+
+    for sweep in range(maxIterations):
+        if history[-1] <= target:
+            break
+        for i in range(size):
+            row = slice(indptr[i], indptr[i+1])
+            #The row's sum includes the diagonal, so add it back.
+            total = data[row] @ x[indices[row]] - diagonal[i] * x[i]
+            x[i] += omega * ((b[i] - total) / diagonal[i] - x[i])
+        history.append(numpy.linalg.norm(b - csrMatVec(matrix, x)))
+
+        if span is not None:
+            recordIteration(span, sweep + 1, {"residual": history[-1]}, flops=4 * len(data))
+
+    endSpan(span, residual=history[-1])
+    return x, history
@@ -0,0 +1,201 @@
+# =========================================
+# M 410
+# Group Project 4
+#
+# Authors: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description:  LU factorization, solves and inversion for matrices kept in
+#               a memory-mapped file instead of in memory.  The file holds
+#               the matrix as square tiles, each one contiguous on disk, and
+#               the factorization is left-looking: one panel of columns is
+#               in memory while the tiles to its left stream past it.  Peak
+#               memory is set by a budget that picks the tile size, so the
+#               matrix can be several times larger than RAM.
+# =========================================
+
+import numpy
+
+# The default memory budget in bytes for the panel and tiles in memory.
+MEMORY_BUDGET = 256 * 2 ** 20
+
+# ------------------
+# tileSizeForBudget
+# Description:
+#   The largest tile size for which a panel (n x tile), the temporary the
+#   panel update needs, and three tiles fit in memoryBudget bytes.
+# ------------------
+def tileSizeForBudget(size, memoryBudget=MEMORY_BUDGET):
+    words = memoryBudget // 8
+    tileSize = int((-2 * size + (4 * size * size + 12 * words) ** 0.5) / 6)
+    if tileSize < 1:
+        raise ValueError("The memory budget is too small for this matrix")
+    return min(tileSize, max(size, 1))
+
+# ------------------
+# toTiledFile
+# Description:
+#   Writes matrix, which may itself be a memmap, to fileName as a .npy of
+#   shape (blocks, blocks, tileSize, tileSize) with tile (i, j) at [i, j].
+#   The matrix is read one row of tiles at a time, and the padding past n is
+#   the identity so it never changes the factorization.
+# Output:
+#   tiled: A dictionary describing the file, for tiledFactor.
+# ------------------
+def toTiledFile(matrix, fileName, tileSize):
+    size = matrix.shape[0]
+    blocks = -(-size // tileSize)
+    tiles = numpy.lib.format.open_memmap(fileName, mode="w+", dtype=float, shape=(blocks, blocks, tileSize, tileSize))
+
+    for i in range(blocks):
+        rows = numpy.zeros((tileSize, blocks * tileSize))
+        start, stop = i * tileSize, min((i + 1) * tileSize, size)
+        rows[:stop - start, :size] = matrix[start:stop]
+        for padding in range(max(size - start, 0), tileSize):
+            rows[padding, start + padding] = 1
+        tiles[i] = rows.reshape(tileSize, blocks, tileSize).transpose(1, 0, 2)
+
+    tiles.flush()
+    return {"fileName": fileName, "size": size, "tileSize": tileSize, "perm": None}
+
+# ------------------
+# _solveUnitLower
+# Description:
+#   Solves L x = b in place for the unit lower triangle of one tile.
+# ------------------
+def _solveUnitLower(tile, b):
+    for i in range(1, len(tile)):
+        b[i] -= tile[i, :i] @ b[:i]
+    return b
+
+# ------------------
+# _solveUpper
+# Description:
+#   Solves U x = b in place for the upper triangle of one tile.
+# ------------------
+def _solveUpper(tile, b):
+    for i in range(len(tile) - 1, -1, -1):
+        b[i] -= tile[i, i+1:] @ b[i+1:]
+        b[i] /= tile[i, i]
+    return b
+
+# ------------------
+# _swapRows
+# Description:
+#   Applies the row swaps of one panel to tile column c.  Only the rows
+#   that move are read and written.
+# ------------------
+def _swapRows(tiles, c, swaps, tileSize):
+    rows = sorted({row for swap in swaps for row in swap})
+    segments = dict(zip(rows, tiles[[r // tileSize for r in rows], c, [r % tileSize for r in rows]]))
+
+    for r, p in swaps:
+        segments[r], segments[p] = segments[p], segments[r]
+
+    tiles[[r // tileSize for r in rows], c, [r % tileSize for r in rows]] = numpy.array([segments[r] for r in rows])
+
+# ------------------
+# tiledFactor
+# Description:
+#   Factors the tiled matrix in place as P A = L U with partial pivoting,
+#   a panel of tileSize columns at a time, left to right.  For each panel
+#   the tiles of L to its left are read one at a time to bring it up to
+#   date, the panel is factored in memory and written back, and its row
+#   swaps are applied to the other tile columns.  Memory use is about two
+#   panels plus a few tiles, see tileSizeForBudget.
+# Output:
+#   factors: The tiled dictionary with the row permutation added, for
+#            tiledSolve and tiledInverse.
+# ------------------
+def tiledFactor(tiled):
+    tiles = numpy.load(tiled["fileName"], mmap_mode="r+")
+    blocks, tileSize = tiles.shape[0], tiles.shape[2]
+    padded = blocks * tileSize
+    perm = numpy.arange(padded)
+
+    for k in range(blocks):
+        panel = numpy.array(tiles[:, k]).reshape(padded, tileSize)
+
+        #Left-looking: every earlier panel of L updates this one, a tile at a time.
+        for j in range(k):
+            rowsJ = slice(j * tileSize, (j + 1) * tileSize)
+            _solveUnitLower(numpy.array(tiles[j, j]), panel[rowsJ])
+            for i in range(j + 1, blocks):
+                panel[i * tileSize:(i + 1) * tileSize] -= numpy.array(tiles[i, j]) @ panel[rowsJ]
+
+        swaps = []
+        for c in range(tileSize):
+            r = k * tileSize + c
+            p = r + numpy.argmax(abs(panel[r:, c]))
+            if panel[p, c] == 0:
+                raise ValueError("Matrix is singular")
+            if p != r:
+                panel[[r, p]] = panel[[p, r]]
+                perm[[r, p]] = perm[[p, r]]
+                swaps.append((r, p))
+
+            panel[r+1:, c] /= panel[r, c]
+            panel[r+1:, c+1:] -= numpy.outer(panel[r+1:, c], panel[r, c+1:])
+
+        tiles[:, k] = panel.reshape(blocks, tileSize, tileSize)
+
+        if swaps:
+            for c in range(blocks):
+                if c != k:
+                    _swapRows(tiles, c, swaps, tileSize)
+
+    tiles.flush()
+    return dict(tiled, perm=perm)
+
+# ------------------
+# tiledSolve
+# Description:
+#   Solves A x = b with the result of tiledFactor, reading each tile of the
+#   factors once.  b may be a vector or a matrix of right-hand sides.
+# ------------------
+def tiledSolve(factors, b):
+    tiles = numpy.load(factors["fileName"], mmap_mode="r")
+    blocks, tileSize = tiles.shape[0], tiles.shape[2]
+    size = factors["size"]
+    b = numpy.asarray(b, dtype=float)
+
+    x = numpy.zeros((blocks * tileSize,) + b.shape[1:])
+    x[:size] = b
+    x = x[factors["perm"]]
+    block = lambda i: slice(i * tileSize, (i + 1) * tileSize)
+
+    #L y = P b, a row of tiles at a time.
+    for i in range(blocks):
+        for j in range(i):
+            x[block(i)] -= numpy.array(tiles[i, j]) @ x[block(j)]
+        _solveUnitLower(numpy.array(tiles[i, i]), x[block(i)])
+
+    #U x = y, from the bottom row of tiles up.
+    for i in range(blocks - 1, -1, -1):
+        for j in range(i + 1, blocks):
+            x[block(i)] -= numpy.array(tiles[i, j]) @ x[block(j)]
+        _solveUpper(numpy.array(tiles[i, i]), x[block(i)])
+
+    return x[:size]
+
+# ------------------
+# tiledInverse
+# Description:
+#   Writes the inverse of the factored matrix to outFileName, an ordinary
+#   n x n .npy, solving for tileSize columns of the identity at a time so
+#   the whole inverse is never in memory.
+# Output:
+#   inverse: A read-only memmap of the inverse.
+# ------------------
+def tiledInverse(factors, outFileName):
+    size, tileSize = factors["size"], factors["tileSize"]
+    inverse = numpy.lib.format.open_memmap(outFileName, mode="w+", dtype=float, shape=(size, size))
+
+    for start in range(0, size, tileSize):
+        stop = min(start + tileSize, size)
+        columns = numpy.zeros((size, stop - start))
+        columns[numpy.arange(start, stop), numpy.arange(stop - start)] = 1
+        inverse[:, start:stop] = tiledSolve(factors, columns)
+
+    inverse.flush()
+    del inverse
+    return numpy.load(outFileName, mmap_mode="r")
@@ -0,0 +1,28 @@
+# =========================================
+# M 410
+# Group Project 4
+#
+# Authors: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description:  Dense, batched, banded, sparse, exact and out-of-core linear
+#               solvers, iterative methods and online least-squares fits.
+#               The benchmarks are the m410-benchmark command.
+# =========================================
+
+from .._lazy import lazyExports
+
+__getattr__, __dir__ = lazyExports(__name__, {
+    ".MatrixOps": [
+        "BLOCK_SIZE", "luFactor", "luSolve", "luSolveTranspose", "conditionEstimate", "conditionNumber",
+        "invertMatrix", "illConditionedValue", "refinedSolve",
+        "BATCH_CHUNK", "batchInvertMatrix", "batchSolve", "batchIllConditionedValue",
+        "toBanded", "bandedMatVec", "bandedFactor", "bandedSolve",
+        "csrFromTriplets", "csrMatrix", "csrMatVec", "reverseCuthillMcKee", "csrFactor", "csrSolve",
+        "exactDeterminant", "exactSolve", "exactInverse",
+        "jacobiPreconditioner", "blockJacobiPreconditioner", "incompleteCholesky",
+        "conjugateGradient", "gmres", "sor"
+    ],
+    ".LeastSquares": ["makeFit", "addSamples", "removeSamples", "mergeFits", "fitCoefficients", "fitResidual",
+                      "evaluateFit"],
+    ".OutOfCore": ["MEMORY_BUDGET", "tileSizeForBudget", "toTiledFile", "tiledFactor", "tiledSolve", "tiledInverse"]
+})
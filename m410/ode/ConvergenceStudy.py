@@ -0,0 +1,210 @@
+# +---------------------------------------------------------------------------+
+#
+# Convergence Study for the First-Order ODE Methods
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  Runs a method on one initial value problem with several step
+#               sizes, finds the observed order of accuracy from the slope of
+#               the log-log error, and uses Richardson extrapolation to improve
+#               the estimate at the end of the interval.
+#
+# +---------------------------------------------------------------------------+
+
+import math
+import multiprocessing
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ..ReportWriter import reportTable
+
+
+
+# The columns of the table returned by convergenceStudy.
+STUDY_FIELDS = [
+    ("h", float),
+    ("steps", int),
+    ("reached", float),
+    ("evaluations", int),
+    ("seconds", float),
+    ("yEnd", float),
+    ("error", float),
+    ("order", float),
+    ("richardson", float),
+    ("richardsonError", float)
+]
+
+
+
+#
+#   Run One Step Size
+#   Description:
+#       Runs the method once and measures it.  This is what each worker of the
+#       process pool does, so it has to live at the top of the module.
+#   Parameters:
+#       method: One of the integrators, called with dense=True.
+#       func: A given function f(x, y) to evaluate.
+#       methodArgs: Extra arguments placed after func, such as Taylor's partials.
+#       x0, y0, start, end, h, exact: Passed straight to the method.
+#   Output:
+#       steps: The number of steps taken.
+#       reached: The last x of the run, before end when it stopped early.
+#       evaluations: The number of times func was called.
+#       seconds: The wall-clock time of the run.
+#       yEnd: The approximation at x = end, read from the dense output, or
+#             nan when the run stopped before end.
+#
+def _runStepSize(method, func, methodArgs, x0, y0, start, end, h, exact):
+    evaluations = 0
+
+    def counted(x, y):
+        nonlocal evaluations
+        evaluations += 1
+        return func(x, y)
+
+    startTime = time.perf_counter()
+    xVals, yVals, error, interp = method(counted, *methodArgs, x0, y0, start, end, h, exact, dense=True)
+    seconds = time.perf_counter() - startTime
+
+    #np.arange can overshoot end by a step, the dense output puts every run
+    #on end itself so they can be compared with exact(end).  A run that
+    #stops short of end, by more than rounding in its x values, has no
+    #value there.
+    reached = float(xVals[-1])
+    rounding = len(xVals) * np.finfo(float).eps * max(abs(start), abs(end), end - start)
+    yEnd = float(interp(end)) if reached >= end - rounding else math.nan
+    return len(xVals) - 1, reached, evaluations, seconds, yEnd
+
+
+
+# The jobs of the study that is running, for workers forked from this
+# process, so functions that cannot be pickled never have to be.
+_jobs = []
+
+
+
+#
+#   Run Job
+#   Description:
+#       _runStepSize for one of _jobs, what each forked worker does.
+#
+def _runJob(index):
+    return _runStepSize(*_jobs[index])
+
+
+
+#
+#   Is Picklable
+#   Description:
+#       Lambdas cannot be sent to worker processes.  When any of the inputs
+#       are lambdas, the workers are forked instead so they already have
+#       them, or on systems without fork the study runs in this process.
+#
+def _isPicklable(*objects):
+    try:
+        pickle.dumps(objects)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+
+#
+#   Convergence Study
+#   Description:
+#       Runs method with every step size in hValues, in parallel when the
+#       inputs can be sent to worker processes.  The observed order is the
+#       slope of log(error) against log(h), fit by least squares.  Each run
+#       after the first is also combined with the run before it by Richardson
+#       extrapolation.  A run that stops before end, such as one that blew
+#       up, has nan for its error, order and Richardson values and is left
+#       out of the fit.
+#   Parameters:
+#       method: One of the integrators, eulers, midpoint, rungeKutta, etc.
+#       func: A given function f(x, y) to evaluate.
+#       x0: Initial x value.
+#       y0: Initial y value.
+#       start: The start point of the interval.
+#       end: The ending point of the interval, where the error is measured.
+#       hValues: The step sizes to try, largest first.
+#       exact: The exact function f(x).
+#       methodArgs: Extra arguments placed after func, (funcX, funcY) for Taylor's.
+#       order: The order used for Richardson extrapolation, defaults to the
+#              observed order rounded to the nearest integer.
+#       workers: The number of processes to use, 1 runs everything here.
+#   Output:
+#       table: A structured array with one row per step size, see STUDY_FIELDS.
+#              order is the observed order between that row and the one above.
+#       observedOrder: The fitted order over all of the step sizes.
+#
+def convergenceStudy(method, func, x0, y0, start, end, hValues, exact, methodArgs=(), order=None, workers=None):
+    hValues = [float(h) for h in hValues]
+
+    if len(hValues) < 2:
+        raise ValueError("At least two step sizes are needed to find the order")
+
+    global _jobs
+    jobs = [(method, func, methodArgs, x0, y0, start, end, h, exact) for h in hValues]
+
+    if workers == 1:
+        results = [_runStepSize(*job) for job in jobs]
+    elif _isPicklable(method, func, methodArgs, exact):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_runStepSize, *zip(*jobs)))
+    elif "fork" in multiprocessing.get_all_start_methods():
+        _jobs = jobs
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as pool:
+                results = list(pool.map(_runJob, range(len(jobs))))
+        finally:
+            _jobs = []
+    else:
+        results = [_runStepSize(*job) for job in jobs]
+
+    table = np.zeros(len(hValues), dtype=STUDY_FIELDS)
+    table["h"] = hValues
+    table["steps"], table["reached"], table["evaluations"], table["seconds"], table["yEnd"] = zip(*results)
+    table["error"] = np.abs(exact(end) - table["yEnd"])
+
+    #Slope of the log-log error, runs that hit the exact answer are left out.
+    logH = np.log(table["h"])
+    logError = np.log(table["error"], where=table["error"] > 0, out=np.full(len(table), np.nan))
+    usable = np.isfinite(logError)
+
+    if usable.sum() >= 2:
+        observedOrder = np.polyfit(logH[usable], logError[usable], 1)[0]
+    else:
+        observedOrder = math.nan
+
+    table["order"][0] = math.nan
+    table["order"][1:] = np.diff(logError) / np.diff(logH)
+
+    #Richardson extrapolation, R = yFine + (yFine - yCoarse) / (r^p - 1).
+    if order is None:
+        order = round(observedOrder) if math.isfinite(observedOrder) else math.nan
+
+    ratio = table["h"][:-1] / table["h"][1:]
+    table["richardson"][0] = math.nan
+    table["richardson"][1:] = table["yEnd"][1:] + np.diff(table["yEnd"]) / (ratio ** order - 1)
+    table["richardsonError"] = np.abs(exact(end) - table["richardson"])
+
+    return table, observedOrder
+
+
+
+#
+#   Report Study
+#   Description:
+#       Writes the table from convergenceStudy with ReportWriter.reportTable
+#       and prints the observed order.  Rows that stopped early show where in
+#       the reached column, with nan for their error.
+#   Parameters:
+#       title: The heading of the report, also used to name its file.
+#       table: The table returned by convergenceStudy.
+#       observedOrder: The fitted order returned by convergenceStudy.
+#
+def reportStudy(title, table, observedOrder):
+    columns = ("h", "steps", "reached", "evaluations", "error", "order", "richardsonError")
+    reportTable(title, {name: table[name] for name in columns})
+    print(f"Observed order: {observedOrder:.4f}\n")
@@ -0,0 +1,170 @@
+# +---------------------------------------------------------------------------+
+#
+# Dense Output for the First-Order ODE Methods
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  Builds interpolating functions from the data the integrators
+#               already compute, so a trajectory can be evaluated anywhere in
+#               [x0, xN] without shrinking the step size.
+#
+# +---------------------------------------------------------------------------+
+
+import numpy as np
+
+
+
+# Continuous extension of the classic 4th order Runge-Kutta method.  Row i
+# holds the coefficients of b_i(theta) = c1 * theta + c2 * theta^2 + c3 * theta^3
+# so that y(x + theta * h) = y + h * sum(b_i(theta) * k_i).  At theta = 1 the
+# rows sum to the usual weights 1/6, 1/3, 1/3, 1/6.
+RK4_DENSE = np.array([
+    [1, -3 / 2, 2 / 3],
+    [0, 1, -2 / 3],
+    [0, 1, -2 / 3],
+    [0, -1 / 2, 2 / 3]
+])
+
+
+
+#
+#   Locate Steps
+#   Description:
+#       Finds the step each query point falls in and how far along that step
+#       it is.  Points must lie in [xVals[0], xVals[-1]].  The integrators
+#       build xVals by adding h once per step, so the last node can be off by
+#       the rounding of every one of those additions (0.1 added ten times is
+#       0.9999999999999999).  Points that far outside are moved onto the end.
+#   Parameters:
+#       xVals: The x values produced by an integrator.
+#       points: The points to evaluate at, a float or an array.
+#   Output:
+#       index: The index of the left end of the step holding each point.
+#       h: The width of each of those steps.
+#       theta: The fraction of the step covered by each point, in [0, 1].
+#
+def _locateSteps(xVals, points):
+    scale = max(abs(xVals[0]), abs(xVals[-1]), xVals[-1] - xVals[0])
+    tolerance = len(xVals) * np.finfo(float).eps * scale
+
+    if points.size and (points.min() < xVals[0] - tolerance or points.max() > xVals[-1] + tolerance):
+        raise ValueError("Point to evaluate out of range")
+    points = np.clip(points, xVals[0], xVals[-1])
+
+    #The last point belongs to the final step rather than a step of its own.
+    index = np.searchsorted(xVals, points, side="right") - 1
+    index = np.clip(index, 0, len(xVals) - 2)
+
+    h = xVals[index + 1] - xVals[index]
+    theta = (points - xVals[index]) / h
+
+    return index, h, theta
+
+
+
+#
+#   Column
+#   Description:
+#       Reshapes a per-point array so it broadcasts against y values that may
+#       be vectors (systems of ODEs) instead of scalars.
+#
+def _column(values, ndim):
+    return values.reshape(values.shape + (1,) * (ndim - 1))
+
+
+
+#
+#   Cubic Hermite Interpolant
+#   Description:
+#       Creates a piecewise cubic Hermite interpolant from the values and
+#       slopes at each step.  This is the dense output used for Euler's,
+#       Improved Euler's, Midpoint and Taylor's methods.
+#   Parameters:
+#       xVals: The x values produced by an integrator.
+#       yVals: The y values produced by an integrator.
+#       slopes: The value of func(x, y) at each (x, y) pair.
+#   Output:
+#       interp: A function that evaluates the trajectory at a float or an
+#               array of points.
+#
+def hermiteInterpolant(xVals, yVals, slopes):
+    xVals = np.asarray(xVals, dtype=float)
+    yVals = np.asarray(yVals, dtype=float)
+    slopes = np.asarray(slopes, dtype=float)
+
+    if len(xVals) < 2:
+        raise ValueError("At least one step is needed to interpolate")
+
+    def interp(points):
+        points = np.asarray(points, dtype=float)
+        index, h, theta = _locateSteps(xVals, points.ravel())
+
+        #The four cubic Hermite basis functions.
+        theta2 = theta ** 2
+        theta3 = theta ** 3
+        h00 = 2 * theta3 - 3 * theta2 + 1
+        h10 = (theta3 - 2 * theta2 + theta) * h
+        h01 = -2 * theta3 + 3 * theta2
+        h11 = (theta3 - theta2) * h
+
+        ndim = yVals.ndim
+        result = (_column(h00, ndim) * yVals[index] + _column(h10, ndim) * slopes[index] +
+                  _column(h01, ndim) * yVals[index + 1] + _column(h11, ndim) * slopes[index + 1])
+
+        return result.reshape(points.shape + yVals.shape[1:])
+
+    return interp
+
+
+
+#
+#   Runge-Kutta Interpolant
+#   Description:
+#       Creates the dense output of an explicit Runge-Kutta method from the
+#       stages it computed on each step, using the method's own continuous
+#       extension.
+#   Parameters:
+#       xVals: The x values produced by an integrator.
+#       yVals: The y values produced by an integrator.
+#       stages: The stage slopes k_i / h of every step, shape (steps, stages).
+#       denseCoef: The continuous extension, row i holds the coefficients of
+#                  theta, theta^2, ... in b_i(theta).  Defaults to RK4_DENSE.
+#       stepSizes: The h each step's stages were computed with, only needed
+#                  when a step was cut short (a terminal event) so the spacing
+#                  of xVals is not the step size.
+#   Output:
+#       interp: A function that evaluates the trajectory at a float or an
+#               array of points.
+#
+def rungeKuttaInterpolant(xVals, yVals, stages, denseCoef=RK4_DENSE, stepSizes=None):
+    xVals = np.asarray(xVals, dtype=float)
+    yVals = np.asarray(yVals, dtype=float)
+    stages = np.asarray(stages, dtype=float)
+    denseCoef = np.asarray(denseCoef, dtype=float)
+
+    if len(xVals) < 2:
+        raise ValueError("At least one step is needed to interpolate")
+
+    if len(stages) != len(xVals) - 1:
+        raise ValueError("There must be one row of stages per step")
+
+    if stepSizes is not None:
+        stepSizes = np.asarray(stepSizes, dtype=float)
+
+    def interp(points):
+        points = np.asarray(points, dtype=float)
+        index, h, theta = _locateSteps(xVals, points.ravel())
+
+        if stepSizes is not None:
+            theta = theta * h / stepSizes[index]
+            h = stepSizes[index]
+
+        #Powers theta, theta^2, ... then b_i(theta) for every point and stage.
+        powers = theta[:, None] ** np.arange(1, denseCoef.shape[1] + 1)
+        weights = powers @ denseCoef.T
+
+        #Sum over the stages, y + h * sum(b_i(theta) * k_i).
+        increment = np.einsum("ps,ps...->p...", weights, stages[index])
+        result = yVals[index] + _column(h, yVals.ndim) * increment
+
+        return result.reshape(points.shape + yVals.shape[1:])
+
+    return interp
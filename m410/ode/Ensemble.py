@@ -0,0 +1,191 @@
+# +---------------------------------------------------------------------------+
+#
+# Parameter Sweeps for Initial Value Problems
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  Solves one family of initial value problems for many
+#               parameter values and initial conditions.  Runs are integrated
+#               together in vectorized batches, the batches are spread over a
+#               process pool, and only summary statistics come back, written
+#               straight into shared memory.
+#
+# +---------------------------------------------------------------------------+
+
+import math
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+
+# The summaries kept for every run, each one the size of y.
+SUMMARIES = ["final", "min", "max", "mean"]
+
+
+
+#
+#   Parameter Grid
+#   Description:
+#       Every combination of the given parameter values, one row per run.
+#   Parameters:
+#       values: One list of values per parameter.
+#   Output:
+#       grid: An array of shape (runs, number of parameters).
+#
+def parameterGrid(*values):
+    mesh = np.meshgrid(*[np.asarray(v, dtype=float) for v in values], indexing="ij")
+    return np.stack([m.ravel() for m in mesh], axis=1)
+
+
+
+#
+#   Integrate Batch
+#   Description:
+#       Integrates a batch of runs at once with an explicit Runge-Kutta method,
+#       keeping running summaries instead of trajectories.  A run whose state
+#       stops being finite is frozen at its last finite value and its stopping
+#       x is recorded, without holding up the rest of the batch.
+#   Output:
+#       results: An array of shape (batch, len(SUMMARIES) * size + 1), the
+#                summaries then the x each run stopped at.
+#
+def _integrateBatch(tableau, func, params, y0, x0, end, h):
+    a, b, c = tableau["a"], tableau["b"], tableau["c"]
+    batch = len(params)
+    steps = max(0, math.ceil((end - x0) / h))
+
+    y = np.array(y0, dtype=float)
+    k = np.empty((len(b),) + y.shape)
+    flat = lambda values: values.reshape(batch, -1)
+
+    alive = np.ones(batch, dtype=bool)
+    stopX = np.full(batch, x0 + steps * h)
+    low = flat(y).copy()
+    high = flat(y).copy()
+    total = flat(y).copy()
+    points = np.ones(batch)
+
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        for n in range(steps):
+            x = x0 + n * h
+
+            for i in range(len(b)):
+                yi = y + h * np.tensordot(a[i, :i], k[:i], axes=1) if i else y
+                k[i] = func(x + c[i] * h, yi, params)
+
+            yn = y + h * np.tensordot(b, k, axes=1)
+
+            #Freeze the runs that blew up at their last finite value.
+            bad = alive & ~np.all(np.isfinite(flat(yn)), axis=1)
+            stopX[bad] = x
+            alive &= ~bad
+            if not alive.all():
+                yn[~alive] = y[~alive]
+
+            y = yn
+            flatY = flat(y)
+            np.minimum(low, flatY, out=low)
+            np.maximum(high, flatY, out=high)
+            total[alive] += flatY[alive]
+            points[alive] += 1
+
+    return np.hstack((flat(y), low, high, total / points[:, None], stopX[:, None]))
+
+
+
+#
+#   Run Batch in Shared Memory
+#   Description:
+#       What each worker process does, integrate one batch and write its rows
+#       of the shared result array.  Nothing but the batch's inputs is pickled.
+#
+def _runBatch(memoryName, resultShape, first, tableau, func, params, y0, x0, end, h):
+    memory = shared_memory.SharedMemory(name=memoryName)
+    try:
+        results = np.ndarray(resultShape, dtype=float, buffer=memory.buf)
+        results[first:first + len(params)] = _integrateBatch(tableau, func, params, y0, x0, end, h)
+    finally:
+        memory.close()
+
+
+
+#
+#   Ensemble Run
+#   Description:
+#       Solves y' = func(x, y, p) for every row p of params.  func is called
+#       on a whole batch at once, y with shape (batch,) + shape of one y0 and
+#       p with shape (batch, number of parameters), and must return an array
+#       shaped like y.  Batches run on a process pool when func can be sent to
+#       worker processes, otherwise in this process.
+#   Parameters:
+#       tableau: The method, one of TABLEAUX or the result of makeTableau.
+#       func: The parameterized function f(x, y, p), vectorized over the batch.
+#       params: An array with one row of parameters per run, see parameterGrid.
+#       y0: One initial y shared by all runs, or the initial y of every run,
+#           stacked along the first axis.
+#       x0: Initial x value.
+#       end: The ending point of the interval.
+#       h: The size of each sub-interval.
+#       batchSize: The number of runs integrated together.
+#       workers: The number of processes to use, 1 runs everything here.
+#       perRun: True when y0 has one initial y per run, False when it is
+#               shared.  Only needed when the first axis of y0 has one entry
+#               per run, where either could be meant.
+#   Output:
+#       summary: A dictionary of arrays with one row per run.  "final", "min",
+#                "max" and "mean" are over each run's trajectory, and "stopX" is
+#                where the run ended, before end if it stopped being finite.
+#
+def ensembleRun(tableau, func, params, y0, x0, end, h, batchSize=1024, workers=None, perRun=None):
+    params = np.asarray(params, dtype=float)
+    if params.ndim == 1:
+        params = params[:, None]
+    runs = len(params)
+
+    #One initial value for every run, or one shared by all of them.
+    y0 = np.asarray(y0, dtype=float)
+    fitsRuns = y0.ndim > 0 and y0.shape[0] == runs
+    if perRun is None:
+        if fitsRuns:
+            raise ValueError(f"y0 could be {runs} initial values or one shared system of {runs}, "
+                             "pass perRun=True or perRun=False")
+        perRun = False
+    if perRun and not fitsRuns:
+        raise ValueError(f"perRun needs one initial y per run along the first axis of y0, {runs} in all")
+    if not perRun:
+        y0 = np.broadcast_to(y0, (runs,) + y0.shape)
+    shape = y0.shape[1:]
+    size = int(np.prod(shape))
+
+    resultShape = (runs, len(SUMMARIES) * size + 1)
+    batches = [(first, min(first + batchSize, runs)) for first in range(0, runs, batchSize)]
+
+    try:
+        pickle.dumps((tableau, func))
+        parallel = workers != 1 and len(batches) > 1
+    except (pickle.PicklingError, AttributeError, TypeError):
+        parallel = False
+
+    if parallel:
+        memory = shared_memory.SharedMemory(create=True, size=int(np.prod(resultShape)) * 8)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_runBatch, memory.name, resultShape, first, tableau, func,
+                                       params[first:last], y0[first:last], x0, end, h)
+                           for first, last in batches]
+                for future in futures:
+                    future.result()
+            results = np.ndarray(resultShape, dtype=float, buffer=memory.buf).copy()
+        finally:
+            memory.close()
+            memory.unlink()
+    else:
+        results = np.vstack([_integrateBatch(tableau, func, params[first:last], y0[first:last], x0, end, h)
+                             for first, last in batches])
+
+    summary = {name: results[:, i * size:(i + 1) * size].reshape((runs,) + shape)
+               for i, name in enumerate(SUMMARIES)}
+    summary["stopX"] = results[:, -1]
+
+    return summary
@@ -0,0 +1,141 @@
+# +---------------------------------------------------------------------------+
+#
+# Events for the First-Order ODE Methods
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  An event is a function g(x, y) whose sign changes are found
+#               while integrating.  The crossing inside a step is located on
+#               the step's dense output, so no extra steps are taken.
+#
+# +---------------------------------------------------------------------------+
+
+import numpy as np
+
+
+
+#
+#   Make Event
+#   Description:
+#       Describes an event for explicitRungeKutta.
+#   Parameters:
+#       func: The event function g(x, y), an event happens where it is zero.
+#       terminal: If True, integration stops at the first event.
+#       direction: 1 only counts g going from negative to positive, -1 only
+#                  positive to negative, and 0 counts both.
+#   Output:
+#       event: A dictionary with the keys "func", "terminal" and "direction".
+#
+def makeEvent(func, terminal=False, direction=0):
+    if direction not in (-1, 0, 1):
+        raise ValueError("direction must be -1, 0 or 1")
+
+    return {"func": func, "terminal": terminal, "direction": direction}
+
+
+
+#
+#   Event Values
+#   Description:
+#       Evaluates every event function at one point.  Plain functions are
+#       accepted in place of makeEvent dictionaries and are non-terminal.
+#
+def eventValues(events, x, y):
+    return np.array([_eventFunc(event)(x, y) for event in events], dtype=float)
+
+
+
+def _eventFunc(event):
+    return event["func"] if isinstance(event, dict) else event
+
+
+
+def _eventSetting(event, key, default):
+    return event[key] if isinstance(event, dict) else default
+
+
+
+#
+#   Illinois Method
+#   Description:
+#       The method of false position with the Illinois modification, which
+#       halves the value kept at a stale end so both ends keep moving.
+#   Parameters:
+#       fn: function pointer, the function being tested
+#       xl, xu: float, a range where fn changes sign
+#       fl, fu: float, fn(xl) and fn(xu)
+#       tolerance: float, the width of the range to stop at
+#   Output:
+#       xr: float, the root
+#
+def _illinois(fn, xl, xu, fl, fu, tolerance, maxIterations=100):
+    xr = xu
+
+    for _ in range(maxIterations):
+        xr = xu - fu * (xu - xl) / (fu - fl)
+        fr = fn(xr)
+
+        if fr == 0:
+            break
+
+        #Keep the root bracketed, halve the stale end when it does not move.
+        if fr * fu < 0:
+            xl, fl = xu, fu
+        else:
+            fl /= 2
+        xu, fu = xr, fr
+
+        if abs(xu - xl) < tolerance:
+            break
+
+    return xr
+
+
+
+#
+#   Locate Events
+#   Description:
+#       Finds the events that happen inside one step.
+#   Parameters:
+#       events: The list of events.
+#       gOld: The event values at the start of the step.
+#       gNew: The event values at the end of the step.
+#       x: The x value at the start of the step.
+#       h: The size of the step.
+#       interp: The dense output of the step.
+#       shape: The shape y is given to the event functions in.
+#   Output:
+#       found: A list of (xEvent, eventIndex) pairs sorted by xEvent.
+#
+def locateEvents(events, gOld, gNew, x, h, interp, shape):
+    found = []
+
+    for index, event in enumerate(events):
+        direction = _eventSetting(event, "direction", 0)
+        start, stop = gOld[index], gNew[index]
+
+        #A root exactly at the start of the step was counted on the last step.
+        if start == 0 or start * stop > 0:
+            continue
+        if direction * (stop - start) < 0:
+            continue
+
+        if stop == 0:
+            found.append((x + h, index))
+            continue
+
+        g = _eventFunc(event)
+        #Rounding can put the guess a hair outside the step.
+        fn = lambda point: g(point, interp(min(max(point, x), x + h)).reshape(shape))
+        tolerance = 4 * np.finfo(float).eps * max(abs(x), abs(x + h), 1)
+        found.append((_illinois(fn, x, x + h, start, stop, tolerance), index))
+
+    return sorted(found)
+
+
+
+#
+#   Is Terminal
+#   Description:
+#       True if the event stops integration.
+#
+def isTerminal(event):
+    return _eventSetting(event, "terminal", False)
@@ -0,0 +1,196 @@
+# +---------------------------------------------------------------------------+
+#
+# Euler, Midpoint, Runge-Kutta and Taylor Methods
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  The classic one-step methods for initial value problems, the
+#               Runge-Kutta ones as tableaux for explicitRungeKutta.
+#
+# +---------------------------------------------------------------------------+
+
+import numpy as np
+
+from .DenseOutput import hermiteInterpolant
+from .RungeKutta import TABLEAUX, explicitRungeKutta
+from ..Cache import memoized
+from ..Instrumentation import startSpan, recordIteration, endSpan
+
+
+
+#
+#   Euler's Method
+#   Description:
+#       Implements Euler's method to approximate initial value problems.
+#   Parameters:
+#       func: A given function f(x, y) to evaluate.
+#       x0: Initial x value.
+#       y0: Initial y value.
+#       start: The start point of the interval.
+#       end: The ending point of the interval.
+#       h: The size of each sub-interval.
+#       exact: The exact function f(x).
+#       dense: If True, also returns a dense-output interpolant.
+#       events: A list of event functions g(x, y), or events from makeEvent.
+#       maxNorm: Stops integration before |y| grows past this value.
+#   Output:
+#       xVals: An array that contains the estimated x values.
+#       yVals: An array that contains the estimated y values.
+#       error: An array that contains the difference between the estimated and exact values.
+#       interp: Only returned when dense is True.  A function that evaluates the
+#               approximation at a float or an array of points in the interval.
+#       eventLog: Only returned when events is not None.  Where each event
+#                 happened and why integration stopped, see explicitRungeKutta.
+#
+def eulers(func, x0, y0, start, end, h, exact, dense=False, events=None, maxNorm=None):
+    #Euler's formula, a one stage Runge-Kutta method.
+    return explicitRungeKutta(TABLEAUX["euler"], func, x0, y0, start, end, h, exact, dense, events, maxNorm)
+
+
+
+#
+#   Improved Euler's Method
+#   Description:
+#       Implements the Improved Euler's method to approximate initial value problems.
+#   Parameters:
+#       func: A given function f(x, y) to evaluate.
+#       x0: Initial x value.
+#       y0: Initial y value.
+#       start: The start point of the interval.
+#       end: The ending point of the interval.
+#       h: The size of each sub-interval.
+#       exact: The exact function f(x).
+#       dense: If True, also returns a dense-output interpolant.
+#       events: A list of event functions g(x, y), or events from makeEvent.
+#       maxNorm: Stops integration before |y| grows past this value.
+#   Output:
+#       xVals: An array that contains the estimated x values.
+#       yVals: An array that contains the estimated y values.
+#       error: An array that contains the difference between the estimated and exact values.
+#       interp: Only returned when dense is True.  A function that evaluates the
+#               approximation at a float or an array of points in the interval.
+#       eventLog: Only returned when events is not None.  Where each event
+#                 happened and why integration stopped, see explicitRungeKutta.
+#
+def improvedEulers(func, x0, y0, start, end, h, exact, dense=False, events=None, maxNorm=None):
+    #Improved Euler's formula, Heun's two stage method.
+    return explicitRungeKutta(TABLEAUX["heun"], func, x0, y0, start, end, h, exact, dense, events, maxNorm)
+
+
+
+#
+#   Midpoint Method
+#   Description:
+#       Implements the Midpoint method to approximate initial value problems.
+#   Parameters:
+#       func: A given function f(x, y) to evaluate.
+#       x0: Initial x value.
+#       y0: Initial y value.
+#       start: The start point of the interval.
+#       end: The ending point of the interval.
+#       h: The size of each sub-interval.
+#       exact: The exact function f(x).
+#       dense: If True, also returns a dense-output interpolant.
+#       events: A list of event functions g(x, y), or events from makeEvent.
+#       maxNorm: Stops integration before |y| grows past this value.
+#   Output:
+#       xVals: An array that contains the estimated x values.
+#       yVals: An array that contains the estimated y values.
+#       error: An array that contains the difference between the estimated and exact values.
+#       interp: Only returned when dense is True.  A function that evaluates the
+#               approximation at a float or an array of points in the interval.
+#       eventLog: Only returned when events is not None.  Where each event
+#                 happened and why integration stopped, see explicitRungeKutta.
+#
+def midpoint(func, x0, y0, start, end, h, exact, dense=False, events=None, maxNorm=None):
+    #The Midpoint formula, a two stage method.
+    return explicitRungeKutta(TABLEAUX["midpoint"], func, x0, y0, start, end, h, exact, dense, events, maxNorm)
+
+
+#
+#   Runge-Kutta Method (4th Order)
+#   Description:
+#       Implements the Runge-Kutta method (4th Order) to approximate initial value problems.
+#   Parameters:
+#       func: A given function f(x, y) to evaluate.
+#       x0: Initial x value.
+#       y0: Initial y value.
+#       start: The start point of the interval.
+#       end: The ending point of the interval.
+#       h: The size of each sub-interval.
+#       exact: The exact function f(x).
+#       dense: If True, also returns a dense-output interpolant.
+#       events: A list of event functions g(x, y), or events from makeEvent.
+#       maxNorm: Stops integration before |y| grows past this value.
+#   Output:
+#       xVals: An array that contains the estimated x values.
+#       yVals: An array that contains the estimated y values.
+#       error: An array that contains the difference between the estimated and exact values.
+#       interp: Only returned when dense is True.  A function that evaluates the
+#               approximation at a float or an array of points in the interval.
+#       eventLog: Only returned when events is not None.  Where each event
+#                 happened and why integration stopped, see explicitRungeKutta.
+#
+def rungeKutta(func, x0, y0, start, end, h, exact, dense=False, events=None, maxNorm=None):
+    #The classic four stage Runge-Kutta formula.
+    return explicitRungeKutta(TABLEAUX["rk4"], func, x0, y0, start, end, h, exact, dense, events, maxNorm)
+
+    
+    
+    
+#
+#   Taylor's Method (2nd Order)
+#   Description:
+#       Implements Taylor's method (2nd Order) to approximate initial value problems.
+#   Parameters:
+#       func: A given function f(x, y) to evaluate.
+#       funcX: The partial derivative of func with respect to x.
+#       funcY: The partial derivative of func with respect to y.
+#       x0: Initial x value.
+#       y0: Initial y value.
+#       start: The start point of the interval.
+#       end: The ending point of the interval.
+#       h: The size of each sub-interval.
+#       exact: The exact function f(x).
+#       dense: If True, also returns a dense-output interpolant.
+#   Output:
+#       xVals: An array that contains the estimated x values.
+#       yVals: An array that contains the estimated y values.
+#       error: An array that contains the difference between the estimated and exact values.
+#       interp: Only returned when dense is True.  A function that evaluates the
+#               approximation at a float or an array of points in the interval.
+#
+@memoized
+def taylors(func, funcX, funcY, x0, y0, start, end, h, exact, dense=False):
+    #Initializes the arrays with the given initial parameters.
+    xVals = [x0]
+    yVals = [y0]
+    error = [exact(x0) - y0]
+    slopes = []
+    span = startSpan("taylors", h=h)
+    
+    #Iterates from the start to the end with step size h.
+    for i in np.arange(start, end, h):
+        #Fetches the rightmost values in the arrays, and stores them into x and y.
+        x = xVals[-1]
+        y = yVals[-1]
+        
+        #The formula for Taylor's Method Order 2.
+        slope = func(x, y)
+        yn = y + slope * h + (h ** 2 / 2) * (funcX(x, y) + funcY(x, y) * slope)
+        
+        #Appends the new values to the arrays.
+        xVals.append(x + h)
+        yVals.append(yn)
+        error.append(abs(exact(x + h) - yn))
+        slopes.append(slope)
+
+        if span is not None:
+            recordIteration(span, len(slopes), {"x": x + h, "y": yn}, evaluations=3)
+
+    endSpan(span)
+
+    #Arrays, like the methods built on explicitRungeKutta.
+    if dense:
+        slopes.append(func(xVals[-1], yVals[-1]))
+        return np.array(xVals), np.array(yVals), np.array(error), hermiteInterpolant(xVals, yVals, slopes)
+
+    return np.array(xVals), np.array(yVals), np.array(error)
@@ -0,0 +1,240 @@
+# +---------------------------------------------------------------------------+
+#
+# Adams-Bashforth-Moulton Predictor-Corrector Methods
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  Linear multistep methods that reuse the slopes from previous
+#               steps, so each step costs one or two evaluations of func
+#               instead of the four Runge-Kutta needs.
+#
+# +---------------------------------------------------------------------------+
+
+import numpy as np
+
+from .DenseOutput import hermiteInterpolant
+from .RungeKutta import TABLEAUX, rungeKuttaStep
+from ..Cache import memoized
+from ..Instrumentation import startSpan, recordIteration, endSpan
+
+
+
+#
+#   Divided Difference Matrix
+#   Description:
+#       Newton's divided differences, done on every unit vector at once.  Row
+#       j holds the weights that turn the values at the nodes into the jth
+#       divided difference f[t0, ..., tj].
+#   Parameters:
+#       nodes: The points the values are known at.
+#   Output:
+#       table: A square matrix of weights.
+#
+def _dividedDifferenceMatrix(nodes):
+    m = len(nodes)
+    coef = np.identity(m)
+    table = np.zeros((m, m))
+    table[0] = coef[0]
+
+    for j in range(1, m):
+        for i in range(m - j):
+            coef[i] = (coef[i + 1] - coef[i]) / (nodes[i + j] - nodes[i])
+        table[j] = coef[0]
+
+    return table
+
+
+
+#
+#   Adams Weights
+#   Description:
+#       The weights w so that sum(w_i * f_i) is the integral over [a, b] of the
+#       polynomial through (nodes_i, f_i).  The polynomial is in Newton's form,
+#       and each Newton basis polynomial is integrated exactly by Gauss-Legendre
+#       quadrature.  This works for any spacing of the nodes, so the method can
+#       change its step size.
+#   Parameters:
+#       nodes: The points the slopes are known at.
+#       a: The start of the step.
+#       b: The end of the step.
+#   Output:
+#       weights: One weight per node.
+#
+def adamsWeights(nodes, a, b):
+    nodes = np.asarray(nodes, dtype=float)
+    m = len(nodes)
+
+    gaussX, gaussW = np.polynomial.legendre.leggauss(m // 2 + 1)
+    points = (b - a) / 2 * gaussX + (a + b) / 2
+
+    #Integral of each Newton basis polynomial (x - t0)(x - t1)...(x - t_j-1).
+    basis = np.ones((m, len(points)))
+    for j in range(1, m):
+        basis[j] = basis[j - 1] * (points - nodes[j - 1])
+    integrals = basis @ gaussW * (b - a) / 2
+
+    return integrals @ _dividedDifferenceMatrix(nodes)
+
+
+
+#
+#   Cached Weights
+#   Description:
+#       Looks up weights by the shape of the stencil, so a fixed step size only
+#       computes its predictor and corrector weights once.
+#
+def _cachedWeights(cache, nodes, a, b):
+    h = b - a
+    key = tuple(np.round((nodes - a) / h, 12))
+
+    if key not in cache:
+        cache[key] = adamsWeights(nodes - a, 0, h) / h
+
+    return cache[key] * h
+
+
+
+#
+#   Adams-Bashforth-Moulton Method
+#   Description:
+#       Approximates an initial value problem with an Adams-Bashforth predictor
+#       and an Adams-Moulton corrector of the same order.  The first order - 1
+#       steps are taken with Runge-Kutta (4th Order).  After that the last
+#       order slopes are kept in a ring buffer, and each step costs one
+#       evaluation of func for the prediction plus one per correction, with
+#       the final evaluation skipped if finalEvaluate is False (PEC mode).
+#       Steps may have different sizes by passing xGrid, the weights come from
+#       divided differences of the actual step pattern.
+#   Parameters:
+#       func: A given function f(x, y) to evaluate.
+#       x0: Initial x value.
+#       y0: Initial y value, a float or an array for a system.
+#       start: The start point of the interval.
+#       end: The ending point of the interval.
+#       h: The size of each sub-interval.
+#       exact: The exact function f(x), or None when it is not known.
+#       dense: If True, also returns a cubic Hermite dense-output interpolant.
+#       order: The order of the method, 2 to 5.
+#       corrections: How many times the corrector is applied each step.
+#       finalEvaluate: Evaluate func at the corrected value (PECE) so the next
+#                      step uses it.  False reuses the predicted slope (PEC).
+#       xGrid: The x values to step through, overrides start, end and h.
+#   Output:
+#       xVals: An array that contains the estimated x values.
+#       yVals: An array that contains the estimated y values.
+#       error: An array that contains the difference between the estimated and
+#              exact values, None when exact is None.
+#       interp: Only returned when dense is True.  A function that evaluates the
+#               approximation at a float or an array of points in the interval.
+#
+@memoized
+def adamsBashforthMoulton(func, x0, y0, start, end, h, exact=None, dense=False, order=4, corrections=1,
+                          finalEvaluate=True, xGrid=None):
+    if order not in (2, 3, 4, 5):
+        raise ValueError("order must be 2, 3, 4 or 5")
+
+    if corrections < 1:
+        raise ValueError("At least one correction is needed")
+
+    if xGrid is None:
+        xGrid = x0 + h * np.arange(len(np.arange(start, end, h)) + 1)
+    xGrid = np.asarray(xGrid, dtype=float)
+
+    shape = np.shape(y0)
+    steps = len(xGrid) - 1
+    yVals = np.empty((steps + 1,) + shape)
+    yVals[0] = y0
+
+    #Every slope is kept only when the dense output needs them.
+    slopes = np.empty((steps + 1,) + shape) if dense else None
+    slopeCount = 0
+
+    #Ring buffer of the last order slopes, head is the oldest.
+    xHistory = np.empty(order)
+    fHistory = np.empty((order,) + shape)
+    head = 0
+
+    predictorCache = {}
+    correctorCache = {}
+    n = 0
+    span = startSpan("adamsBashforthMoulton", order=order, steps=steps)
+    evaluations = 1 + corrections - (not finalEvaluate)
+
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        try:
+            #Runge-Kutta gets the history started.
+            while n < min(order - 1, steps):
+                yVals[n + 1], fHistory[n] = rungeKuttaStep(TABLEAUX["rk4"], func, xGrid[n], yVals[n], xGrid[n + 1] - xGrid[n])
+                xHistory[n] = xGrid[n]
+                if dense:
+                    slopes[n] = fHistory[n]
+                    slopeCount += 1
+                n += 1
+
+                if span is not None:
+                    recordIteration(span, n, {"x": xGrid[n], "y": yVals[n]}, evaluations=4)
+
+            if n < steps:
+                xHistory[n] = xGrid[n]
+                fHistory[n] = func(xGrid[n], yVals[n])
+                if dense:
+                    slopes[n] = fHistory[n]
+                    slopeCount += 1
+
+            while n < steps:
+                x, xn = xGrid[n], xGrid[n + 1]
+                ordered = (head + np.arange(order)) % order
+                nodes = xHistory[ordered]
+                history = fHistory[ordered]
+
+                #Predict with Adams-Bashforth, extrapolating the last order slopes.
+                weights = _cachedWeights(predictorCache, nodes, x, xn)
+                yn = yVals[n] + np.tensordot(weights, history, axes=1)
+                fn = func(xn, yn)
+
+                #Correct with Adams-Moulton, which interpolates the new slope too.
+                correctorNodes = np.append(nodes[1:], xn)
+                weights = _cachedWeights(correctorCache, correctorNodes, x, xn)
+                for i in range(corrections):
+                    yn = yVals[n] + np.tensordot(weights[:-1], history[1:], axes=1) + weights[-1] * np.asarray(fn)
+                    if finalEvaluate or i < corrections - 1:
+                        fn = func(xn, yn)
+
+                if not np.all(np.isfinite(yn)) or not np.all(np.isfinite(fn)):
+                    break
+
+                yVals[n + 1] = yn
+                xHistory[head] = xn
+                fHistory[head] = fn
+                head = (head + 1) % order
+                n += 1
+
+                if dense:
+                    slopes[n] = fn
+                    slopeCount += 1
+
+                if span is not None:
+                    recordIteration(span, n, {"x": xn, "y": yn}, evaluations=evaluations)
+
+        except (ArithmeticError, ZeroDivisionError, OverflowError):
+            #The same as the Runge-Kutta methods, stop at the last good point.
+            pass
+
+    endSpan(span, reached=xGrid[n])
+
+    xVals = xGrid[:n + 1]
+    yVals = yVals[:n + 1]
+
+    if exact is None:
+        error = None
+    else:
+        #The first entry is signed, matching the Runge-Kutta methods.
+        error = np.array([abs(exact(x) - y) for x, y in zip(xVals, yVals)])
+        error[0] = exact(x0) - yVals[0]
+
+    if not dense:
+        return xVals, yVals, error
+
+    #Only a run too short to leave the Runge-Kutta start is missing a slope.
+    if slopeCount <= n:
+        slopes[n] = func(xVals[-1], yVals[-1])
+
+    return xVals, yVals, error, hermiteInterpolant(xVals, yVals, slopes[:n + 1])
@@ -0,0 +1,416 @@
+# +---------------------------------------------------------------------------+
+#
+# Explicit Runge-Kutta Methods from Butcher Tableaux
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  One stepping loop for every explicit Runge-Kutta method.  A
+#               method is only data, its Butcher tableau, so adding a method
+#               means adding a tableau rather than another copy of the loop.
+#
+# +---------------------------------------------------------------------------+
+
+import numpy as np
+
+from .DenseOutput import RK4_DENSE, hermiteInterpolant, rungeKuttaInterpolant
+from .Events import eventValues, isTerminal, locateEvents
+from ..Acceleration import compiled, isCompiled
+from ..Cache import memoized
+from ..Instrumentation import startSpan, recordIteration, endSpan
+
+
+
+#
+#   Make Tableau
+#   Description:
+#       Checks a Butcher tableau and stores it the way explicitRungeKutta
+#       expects.  Stage i is k_i = func(x + c_i * h, y + h * sum(a_ij * k_j)),
+#       and the step is y + h * sum(b_i * k_i).
+#   Parameters:
+#       a: The stage coefficients, a square matrix that must be strictly lower
+#          triangular for the method to be explicit.
+#       b: The weights of each stage.
+#       c: The nodes, where each stage is evaluated inside the step.
+#       dense: Optional continuous extension, row i holds the coefficients of
+#              theta, theta^2, ... in b_i(theta).  Methods without one use a
+#              cubic Hermite interpolant for their dense output.
+#   Output:
+#       tableau: A dictionary with the keys "a", "b", "c" and "dense".
+#
+def makeTableau(a, b, c, dense=None):
+    a = np.atleast_2d(np.asarray(a, dtype=float))
+    b = np.asarray(b, dtype=float)
+    c = np.asarray(c, dtype=float)
+    stageCount = len(b)
+
+    if a.shape != (stageCount, stageCount) or c.shape != (stageCount,):
+        raise ValueError("a must be s by s, and b and c must have length s")
+
+    if np.any(np.triu(a)):
+        raise ValueError("a must be strictly lower triangular for an explicit method")
+
+    if dense is not None:
+        dense = np.asarray(dense, dtype=float)
+        if dense.ndim != 2 or dense.shape[0] != stageCount:
+            raise ValueError("dense must have one row per stage")
+
+    return {"a": a, "b": b, "c": c, "dense": dense}
+
+
+
+TABLEAUX = {
+    "euler": makeTableau(
+        [[0]],
+        [1],
+        [0]
+    ),
+
+    #Also known as Improved Euler's method.
+    "heun": makeTableau(
+        [[0, 0],
+         [1, 0]],
+        [1 / 2, 1 / 2],
+        [0, 1]
+    ),
+
+    "midpoint": makeTableau(
+        [[0, 0],
+         [1 / 2, 0]],
+        [0, 1],
+        [0, 1 / 2]
+    ),
+
+    "rk4": makeTableau(
+        [[0, 0, 0, 0],
+         [1 / 2, 0, 0, 0],
+         [0, 1 / 2, 0, 0],
+         [0, 0, 1, 0]],
+        [1 / 6, 1 / 3, 1 / 3, 1 / 6],
+        [0, 1 / 2, 1 / 2, 1],
+        RK4_DENSE
+    ),
+
+    #Kutta's 3/8 rule.
+    "rk38": makeTableau(
+        [[0, 0, 0, 0],
+         [1 / 3, 0, 0, 0],
+         [-1 / 3, 1, 0, 0],
+         [1, -1, 1, 0]],
+        [1 / 8, 3 / 8, 3 / 8, 1 / 8],
+        [0, 1 / 3, 2 / 3, 1]
+    ),
+
+    #Strong stability preserving, 3rd order (Shu-Osher).
+    "ssprk3": makeTableau(
+        [[0, 0, 0],
+         [1, 0, 0],
+         [1 / 4, 1 / 4, 0]],
+        [1 / 6, 1 / 6, 2 / 3],
+        [0, 1, 1 / 2]
+    )
+}
+
+
+
+#
+#   Runge-Kutta Step Into
+#   Description:
+#       Takes one step on a flattened y, writing each stage into k, for
+#       drivers such as streamRungeKutta that keep their own buffers and
+#       take millions of steps.  Stops computing stages as soon as one is
+#       not finite, so a singularity costs no wasted work.  Reports a step
+#       that is not finite instead of raising, unlike rungeKuttaStep.
+#   Parameters:
+#       tableau: The method, one of TABLEAUX or the result of makeTableau.
+#       func: A given function f(x, y) to evaluate.
+#       x: The x value at the start of the step.
+#       y: The y value at the start of the step, flattened to 1-D floats.
+#       h: The size of the step.
+#       k: A buffer for the stages, (number of stages, len(y)).
+#       shape: The shape func sees y in.
+#   Output:
+#       yn: The y value at the end of the step, flattened, or None.
+#       status: "ok", "nonFinite" or "exception".
+#
+def rungeKuttaStepInto(tableau, func, x, y, h, k, shape):
+    a, b, c = tableau["a"], tableau["b"], tableau["c"]
+    try:
+        for i in range(len(b)):
+            yi = y + h * (a[i, :i] @ k[:i]) if i else y
+            k[i] = func(x + c[i] * h, yi.reshape(shape))
+            if not np.all(np.isfinite(k[i])):
+                return None, "nonFinite"
+    except (ZeroDivisionError, OverflowError):
+        #Plain Python floats raise where NumPy would return inf.
+        return None, "exception"
+
+    yn = y + h * (b @ k)
+    if not np.all(np.isfinite(yn)):
+        return None, "nonFinite"
+
+    return yn, "ok"
+
+
+
+#
+#   Runge-Kutta Steps
+#   Description:
+#       The stepping loop of explicitRungeKutta as one kernel for
+#       Acceleration.compiled, used when func is compiled by Numba too and
+#       there are no events or maxNorm.  Takes the same steps as
+#       rungeKuttaStepInto, with the stages summed by a loop instead of a dot
+#       product.  func takes x and y as a 1-D array.
+#   Parameters:
+#       stages: Every step's stages when dense, otherwise one step's worth.
+#   Output:
+#       n: The number of steps taken, all of them unless one was not finite.
+#       status: 0 for "end", 1 for "nonFinite" and 2 for "exception".
+#
+def _rungeKuttaSteps(a, b, c, func, xVals, yVals, h, stages, dense):
+    steps = len(xVals) - 1
+    stageCount = len(b)
+
+    for n in range(steps):
+        x = xVals[n]
+        y = yVals[n]
+        k = stages[n] if dense else stages[0]
+
+        for i in range(stageCount):
+            total = np.zeros_like(y)
+            for j in range(i):
+                total += a[i, j] * k[j]
+            yi = y + h * total
+            try:
+                k[i] = func(x + c[i] * h, yi)
+            except Exception:
+                return n, 2
+            if not np.all(np.isfinite(k[i])):
+                return n, 1
+
+        total = np.zeros_like(y)
+        for i in range(stageCount):
+            total += b[i] * k[i]
+        yn = y + h * total
+        if not np.all(np.isfinite(yn)):
+            return n, 1
+
+        xVals[n + 1] = x + h
+        yVals[n + 1] = yn
+
+    return steps, 0
+
+
+
+#
+#   Runge-Kutta Step
+#   Description:
+#       Takes a single step of any explicit Runge-Kutta method, for methods
+#       such as Adams-Bashforth-Moulton that need a few steps to get started.
+#   Parameters:
+#       tableau: The method, one of TABLEAUX or the result of makeTableau.
+#       func: A given function f(x, y) to evaluate.
+#       x: The x value at the start of the step.
+#       y: The y value at the start of the step, a float or an array.
+#       h: The size of the step.
+#   Output:
+#       yn: The y value at the end of the step, in the shape of y.
+#       slope: func(x, y), the first stage, which callers can reuse.
+#
+def rungeKuttaStep(tableau, func, x, y, h):
+    shape = np.shape(y)
+    k = np.empty((len(tableau["b"]), int(np.prod(shape))))
+
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        yn, status = rungeKuttaStepInto(tableau, func, x, np.ravel(y).astype(float), h, k, shape)
+
+    if status != "ok":
+        raise ArithmeticError(f"Runge-Kutta step from x = {x} is not finite")
+
+    return yn.reshape(shape), k[0].reshape(shape)
+
+
+
+#
+#   Step Interpolant
+#   Description:
+#       The dense output of a single step, used to locate events.
+#
+def _stepInterpolant(tableau, func, x, y, yn, h, k, shape):
+    xVals = [x, x + h]
+    yVals = np.array([y, yn]).reshape((2,) + shape)
+
+    if tableau["dense"] is not None:
+        return rungeKuttaInterpolant(xVals, yVals, k.reshape((1,) + k.shape[:1] + shape), tableau["dense"])
+
+    slopes = np.array([k[0], np.ravel(func(x + h, yn.reshape(shape)))]).reshape((2,) + shape)
+    return hermiteInterpolant(xVals, yVals, slopes)
+
+
+
+#
+#   Explicit Runge-Kutta Method
+#   Description:
+#       Approximates an initial value problem with any explicit Runge-Kutta
+#       method.  Each stage is evaluated exactly once per step into a
+#       preallocated buffer.  y0 may be a float or an array for a system of
+#       ODEs.  Integration stops early, keeping the points computed so far, at
+#       a terminal event, when y becomes larger than maxNorm, or when a stage
+#       is not finite (NaN, inf, or func raising ZeroDivisionError or
+#       OverflowError).
+#   Parameters:
+#       tableau: The method, one of TABLEAUX or the result of makeTableau.
+#       func: A given function f(x, y) to evaluate.
+#       x0: Initial x value.
+#       y0: Initial y value.
+#       start: The start point of the interval.
+#       end: The ending point of the interval.
+#       h: The size of each sub-interval.
+#       exact: The exact function f(x), or None when it is not known.
+#       dense: If True, also returns a dense-output interpolant.
+#       events: A list of event functions g(x, y), or events from makeEvent.
+#       maxNorm: Stops before any step where the largest |y| would pass this.
+#   Output:
+#       xVals: An array that contains the estimated x values.
+#       yVals: An array that contains the estimated y values.
+#       error: An array that contains the difference between the estimated and
+#              exact values, None when exact is None.
+#       interp: Only returned when dense is True.  A function that evaluates the
+#               approximation at a float or an array of points in the interval.
+#       eventLog: Only returned when events is not None.  A dictionary with the
+#                 keys "xEvents" and "yEvents", one array per event holding
+#                 where it happened, and "status", why integration stopped:
+#                 "end", "event", "blowUp", "nonFinite" or "exception".
+#
+@memoized
+def explicitRungeKutta(tableau, func, x0, y0, start, end, h, exact=None, dense=False, events=None, maxNorm=None):
+    a, b, c = tableau["a"], tableau["b"], tableau["c"]
+    stageCount = len(b)
+    steps = len(np.arange(start, end, h))
+
+    #The state is kept flat so every method and every system size takes the
+    #same path, func still sees y in the shape it was given.
+    shape = np.shape(y0)
+    xVals = np.empty(steps + 1)
+    yVals = np.empty((steps + 1, int(np.prod(shape))))
+    xVals[0] = x0
+    yVals[0] = np.ravel(y0)
+
+    #Dense output needs every step's stages, otherwise one buffer is reused.
+    if dense:
+        stages = np.empty((steps, stageCount, yVals.shape[1]))
+    else:
+        buffer = np.empty((stageCount, yVals.shape[1]))
+
+    if events is not None:
+        gOld = eventValues(events, x0, np.reshape(y0, shape))
+        xEvents = [[] for event in events]
+        yEvents = [[] for event in events]
+
+    status = "end"
+    n = 0
+    span = startSpan("explicitRungeKutta", stages=stageCount, steps=steps, h=h)
+
+    #A compiled func can be called from a compiled loop, for every step at once.
+    kernel = None
+    if events is None and maxNorm is None and span is None and len(shape) == 1 and isCompiled(func):
+        kernel = compiled(_rungeKuttaSteps)
+
+    if kernel is not None:
+        n, code = kernel(a, b, c, func, xVals, yVals, float(h), stages if dense else buffer[None], dense)
+        status = ("end", "nonFinite", "exception")[code]
+    else:
+        #Overflow and division by zero are checked for directly, so NumPy does
+        #not need to warn about them.
+        with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+            while n < steps:
+                x = xVals[n]
+                y = yVals[n]
+                k = stages[n] if dense else buffer
+                stepSize = h
+
+                yn, status = rungeKuttaStepInto(tableau, func, x, y, stepSize, k, shape)
+                if status != "ok":
+                    break
+
+                if maxNorm is not None and np.max(np.abs(yn)) > maxNorm:
+                    status = "blowUp"
+                    break
+
+                if events is not None:
+                    gNew = eventValues(events, x + h, yn.reshape(shape))
+                    found = []
+                    if np.any(np.sign(gOld) != np.sign(gNew)):
+                        interp = _stepInterpolant(tableau, func, x, y, yn, h, k, shape)
+                        found = locateEvents(events, gOld, gNew, x, h, interp, shape)
+
+                    for xEvent, index in found:
+                        xEvents[index].append(xEvent)
+                        yEvents[index].append(interp(xEvent))
+
+                        if isTerminal(events[index]):
+                            #End on the event itself, read from the dense output.
+                            stepSize = xEvent - x
+                            yn = np.ravel(interp(xEvent))
+                            status = "event"
+                            break
+
+                    gOld = gNew
+
+                if status not in ("ok", "event"):
+                    break
+
+                xVals[n + 1] = x + stepSize
+                yVals[n + 1] = yn
+                n += 1
+
+                if span is not None:
+                    recordIteration(span, n, {"x": x + stepSize, "y": yn, "h": stepSize}, evaluations=stageCount)
+
+                if status == "event":
+                    break
+            else:
+                status = "end"
+
+    endSpan(span, status=status)
+
+    xVals = xVals[:n + 1]
+    yVals = yVals[:n + 1].reshape((n + 1,) + shape)
+
+    if exact is None:
+        error = None
+    else:
+        #The first entry is signed, matching the original hand-written methods.
+        error = np.array([abs(exact(x) - y) for x, y in zip(xVals, yVals)])
+        error[0] = exact(x0) - yVals[0]
+
+    results = [xVals, yVals, error]
+
+    if dense:
+        #The stages of the step that failed, when one did.
+        failed = stages[n].reshape((stageCount,) + shape) if n < steps else None
+        stages = stages[:n].reshape((n, stageCount) + shape)
+
+        if tableau["dense"] is not None:
+            #A step cut short by an event still uses the full step's stages.
+            stepSizes = np.full(n, float(h))
+            results.append(rungeKuttaInterpolant(xVals, yVals, stages, tableau["dense"], stepSizes))
+        else:
+            #The first stage of every step is already the slope at its left end.
+            #After a failed step func is not called again at the last point,
+            #its first stage is used when it was computed and finite, and
+            #otherwise the slope of the step before.
+            if status in ("end", "event"):
+                last = func(xVals[-1], yVals[-1])
+            elif status != "exception" and np.all(np.isfinite(failed[0])):
+                last = failed[0]
+            else:
+                last = stages[-1, 0] if n else failed[0]
+            slopes = np.concatenate((stages[:, 0], [last]))
+            results.append(hermiteInterpolant(xVals, yVals, slopes))
+
+    if events is not None:
+        results.append({
+            "xEvents": [np.array(xs) for xs in xEvents],
+            "yEvents": [np.array(ys).reshape((len(ys),) + shape) for ys in yEvents],
+            "status": status
+        })
+
+    return tuple(results)
@@ -0,0 +1,161 @@
+# +---------------------------------------------------------------------------+
+#
+# Streaming Runge-Kutta Integration
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  Integrates in fixed-size chunks so a run of any length uses a
+#               constant amount of memory.  Chunks can be consumed as they are
+#               made or written to a memory-mapped .npy file, with a checkpoint
+#               after every chunk so an interrupted run can be resumed.
+#
+# +---------------------------------------------------------------------------+
+
+import json
+import math
+import os
+
+import numpy as np
+
+from .RungeKutta import rungeKuttaStepInto
+
+
+
+#
+#   Stream Runge-Kutta
+#   Description:
+#       A generator version of explicitRungeKutta.  Point i is at x0 + i * h,
+#       so x does not drift over long runs.  The stream ends early, after
+#       yielding the points computed so far, if a step is not finite.
+#   Parameters:
+#       tableau: The method, one of TABLEAUX or the result of makeTableau.
+#       func: A given function f(x, y) to evaluate.
+#       x0: The x value of point 0.
+#       y0: The y value at point firstIndex, a float or an array.
+#       end: The ending point of the interval.
+#       h: The size of each sub-interval.
+#       chunkSize: The number of points in each chunk.
+#       firstIndex: The index of the point y0 belongs to, used to resume.
+#   Output:
+#       Yields xChunk, yChunk, NumPy arrays of up to chunkSize points each.
+#
+def streamRungeKutta(tableau, func, x0, y0, end, h, chunkSize=65536, firstIndex=0):
+    shape = np.shape(y0)
+    size = int(np.prod(shape))
+    steps = max(0, math.ceil((end - x0) / h))
+
+    #The only buffers, reused for the whole run.
+    k = np.empty((len(tableau["b"]), size))
+    y = np.ravel(y0).astype(float)
+    nextIndex = firstIndex
+
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        while nextIndex <= steps:
+            count = min(chunkSize, steps + 1 - nextIndex)
+            xChunk = x0 + h * np.arange(nextIndex, nextIndex + count)
+            yChunk = np.empty((count, size))
+
+            for filled in range(count):
+                #Every point but the very first is one step past the last.
+                if nextIndex + filled > firstIndex:
+                    y, status = rungeKuttaStepInto(tableau, func, xChunk[filled] - h, y, h, k, shape)
+                    if status != "ok":
+                        yield xChunk[:filled], yChunk[:filled].reshape((filled,) + shape)
+                        return
+                yChunk[filled] = y
+
+            nextIndex += count
+            yield xChunk, yChunk.reshape((count,) + shape)
+
+
+
+#
+#   Write Checkpoint
+#   Description:
+#       Replaces the checkpoint in one step, so a crash never leaves half of one.
+#
+def _writeCheckpoint(checkpointName, state):
+    with open(checkpointName + ".tmp", "w") as file:
+        json.dump(state, file)
+    os.replace(checkpointName + ".tmp", checkpointName)
+
+
+
+#
+#   Integrate to File
+#   Description:
+#       Streams the integration into a memory-mapped .npy file with one row per
+#       point, x in column 0 and the flattened y after it.  A checkpoint holding
+#       the last point written is saved next to it after every chunk.
+#   Parameters:
+#       tableau: The method, one of TABLEAUX or the result of makeTableau.
+#       func: A given function f(x, y) to evaluate.
+#       x0: Initial x value.
+#       y0: Initial y value, a float or an array.
+#       end: The ending point of the interval.
+#       h: The size of each sub-interval.
+#       fileName: The .npy file to write, the checkpoint is fileName.checkpoint.
+#       chunkSize: The number of points kept in memory at once.
+#       resume: If True and a checkpoint exists, continue from it.
+#   Output:
+#       xVals, yVals: Read-only memory-mapped views of the points written.
+#
+def integrateToFile(tableau, func, x0, y0, end, h, fileName, chunkSize=65536, resume=False):
+    checkpointName = fileName + ".checkpoint"
+    shape = np.shape(y0)
+    size = int(np.prod(shape))
+    steps = max(0, math.ceil((end - x0) / h))
+
+    if resume and os.path.exists(checkpointName):
+        with open(checkpointName) as file:
+            state = json.load(file)
+
+        if (state["x0"], state["end"], state["h"], state["shape"]) != (x0, end, h, list(shape)):
+            raise ValueError("The checkpoint is for a different problem")
+
+        if state["done"]:
+            return loadStream(fileName)
+
+        output = np.lib.format.open_memmap(fileName, mode="r+")
+        written = state["points"] - 1
+        y0 = np.reshape(state["y"], shape)
+    else:
+        output = np.lib.format.open_memmap(fileName, mode="w+", dtype=float, shape=(steps + 1, 1 + size))
+        written = 0
+        state = {"x0": x0, "end": end, "h": h, "shape": list(shape)}
+
+    #The checkpointed point is produced again, it lands on the same row.
+    for xChunk, yChunk in streamRungeKutta(tableau, func, x0, y0, end, h, chunkSize, written):
+        count = len(xChunk)
+        output[written:written + count, 0] = xChunk
+        output[written:written + count, 1:] = yChunk.reshape(count, size)
+
+        if count:
+            written += count
+            state.update(points=written, y=np.ravel(yChunk[-1]).tolist(), done=False)
+
+        #The data must be on disk before the checkpoint says it is.
+        output.flush()
+        _writeCheckpoint(checkpointName, state)
+
+    state["done"] = True
+    _writeCheckpoint(checkpointName, state)
+    del output
+
+    return loadStream(fileName)
+
+
+
+#
+#   Load Stream
+#   Description:
+#       Opens a file written by integrateToFile without reading it into memory.
+#   Parameters:
+#       fileName: The .npy file written by integrateToFile.
+#   Output:
+#       xVals, yVals: Read-only memory-mapped views of the points written.
+#
+def loadStream(fileName):
+    with open(fileName + ".checkpoint") as file:
+        state = json.load(file)
+
+    data = np.load(fileName, mmap_mode="r")[:state["points"]]
+    return data[:, 0], data[:, 1:].reshape((len(data),) + tuple(state["shape"]))
@@ -0,0 +1,364 @@
+# +---------------------------------------------------------------------------+
+#
+# Taylor Series Method of Any Order
+# Group Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+# Description:  Finds the Taylor coefficients of the solution by automatic
+#               differentiation, evaluating func on truncated power series
+#               instead of numbers.  No partial derivatives are needed, and
+#               the step size can be picked from the coefficients themselves.
+#
+# +---------------------------------------------------------------------------+
+
+import math
+
+import numpy as np
+
+from .DenseOutput import rungeKuttaInterpolant
+from ..Cache import memoized
+from ..Instrumentation import startSpan, recordIteration, endSpan
+
+
+
+#
+#   Series
+#   Description:
+#       A power series c0 + c1 t + c2 t^2 + ... truncated after a fixed number
+#       of terms.  Arithmetic with numbers and other series follows the usual
+#       recurrences, so func(x, y) can be written as for floats.  Use the sin,
+#       cos, exp, log and sqrt below in place of the ones in math.
+#
+#       Each coefficient of a result is worked out only when it is asked for,
+#       from the ones before it, so a series whose later coefficients are not
+#       known yet can still be used.  coef gives all of them.
+#
+class Series:
+
+    def __init__(self, coef, rule=None):
+        self._coef = np.array(coef, dtype=float)
+        self._rule = rule
+        self._known = len(self._coef) if rule is None else 0
+
+    @property
+    def coef(self):
+        return self._upTo(len(self._coef) - 1)
+
+    #The coefficients through degree k, working out any that are missing.
+    def _upTo(self, k):
+        while self._known <= k:
+            self._coef[self._known] = self._rule(self._known)
+            self._known += 1
+        return self._coef[:k + 1]
+
+    def _term(self, k):
+        return self._upTo(k)[k]
+
+    def _derived(self, rule):
+        return Series(np.zeros(len(self._coef)), rule)
+
+    def _lift(self, other):
+        if isinstance(other, Series):
+            return other
+        terms = np.zeros(len(self._coef))
+        terms[0] = other
+        return Series(terms)
+
+    def __add__(self, other):
+        other = self._lift(other)
+        return self._derived(lambda k: self._term(k) + other._term(k))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = self._lift(other)
+        return self._derived(lambda k: self._term(k) - other._term(k))
+
+    def __rsub__(self, other):
+        return self._lift(other) - self
+
+    def __neg__(self):
+        return self._derived(lambda k: -self._term(k))
+
+    def __pos__(self):
+        return self
+
+    def __mul__(self, other):
+        if not isinstance(other, Series):
+            return self._derived(lambda k: self._term(k) * other)
+        return self._derived(lambda k: self._upTo(k) @ other._upTo(k)[::-1])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not isinstance(other, Series):
+            return self._derived(lambda k: self._term(k) / other)
+
+        #c = a / b, from a = b * c solved one term at a time.
+        def rule(k):
+            return (self._term(k) - other._upTo(k)[1:] @ c._upTo(k - 1)[::-1]) / other._term(0)
+
+        c = self._derived(rule)
+        return c
+
+    def __rtruediv__(self, other):
+        return self._lift(other) / self
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Series):
+            return exp(exponent * log(self))
+
+        #Whole powers by repeated squaring, which also works when c0 is 0.
+        if float(exponent).is_integer():
+            power = int(abs(exponent))
+            result = self._lift(1)
+            base = self
+            while power:
+                if power & 1:
+                    result = result * base
+                base = base * base
+                power >>= 1
+            return result if exponent >= 0 else 1 / result
+
+        #p = a^r, from a * p' = r * a' * p.
+        def rule(k):
+            if k == 0:
+                return self._term(0) ** exponent
+            a = self._upTo(k)
+            j = np.arange(1, k + 1)
+            return ((exponent + 1) * j - k) @ (a[j] * p._upTo(k - 1)[k - j]) / (k * a[0])
+
+        p = self._derived(rule)
+        return p
+
+    def __rpow__(self, base):
+        return exp(self * math.log(base))
+
+
+
+#
+#   Series Functions
+#   Description:
+#       exp, log, sin, cos and sqrt for both numbers and Series, using the
+#       recurrences that come from differentiating each function.
+#
+def exp(value):
+    if not isinstance(value, Series):
+        return math.exp(value)
+
+    def rule(k):
+        if k == 0:
+            return math.exp(value._term(0))
+        j = np.arange(1, k + 1)
+        return (j * value._upTo(k)[j]) @ e._upTo(k - 1)[k - j] / k
+
+    e = value._derived(rule)
+    return e
+
+
+
+def log(value):
+    if not isinstance(value, Series):
+        return math.log(value)
+
+    def rule(k):
+        a = value._upTo(k)
+        if k == 0:
+            return math.log(a[0])
+        j = np.arange(1, k)
+        return (a[k] - (j * l._upTo(k - 1)[j]) @ a[k - j] / k) / a[0]
+
+    l = value._derived(rule)
+    return l
+
+
+
+def _sinCos(value):
+    def sinRule(k):
+        if k == 0:
+            return math.sin(value._term(0))
+        j = np.arange(1, k + 1)
+        return (j * value._upTo(k)[j]) @ c._upTo(k - 1)[k - j] / k
+
+    def cosRule(k):
+        if k == 0:
+            return math.cos(value._term(0))
+        j = np.arange(1, k + 1)
+        return -(j * value._upTo(k)[j]) @ s._upTo(k - 1)[k - j] / k
+
+    s = value._derived(sinRule)
+    c = value._derived(cosRule)
+    return s, c
+
+
+
+def sin(value):
+    return _sinCos(value)[0] if isinstance(value, Series) else math.sin(value)
+
+
+
+def cos(value):
+    return _sinCos(value)[1] if isinstance(value, Series) else math.cos(value)
+
+
+
+def sqrt(value):
+    return value ** 0.5 if isinstance(value, Series) else math.sqrt(value)
+
+
+
+#
+#   Taylor Coefficients
+#   Description:
+#       The Taylor coefficients of the solution through (x, y), one degree at
+#       a time.  func is called once, on series whose later coefficients are
+#       not known yet.  Coefficient k of func(x, y) only needs y to degree k,
+#       and it is y' so it gives y to degree k + 1.  Each pass only works out
+#       the one new coefficient of every intermediate series, so the whole
+#       expansion costs O(order^2) per operation in func.
+#   Parameters:
+#       func: A given function f(x, y) to evaluate.
+#       x: The x value to expand around.
+#       y: The y value at x.
+#       order: The degree of the last coefficient.
+#   Output:
+#       coef: The coefficients y0, y1, ..., y_order.
+#
+def taylorCoefficients(func, x, y, order):
+    xSeries = Series(np.zeros(order + 1))
+    xSeries.coef[0] = x
+    if order:
+        xSeries.coef[1] = 1
+
+    ySeries = Series(np.zeros(order + 1))
+    ySeries.coef[0] = y
+
+    slope = ySeries._lift(func(xSeries, ySeries))
+    for k in range(order):
+        ySeries.coef[k + 1] = slope._term(k) / (k + 1)
+
+    return ySeries.coef
+
+
+
+#
+#   Taylor Series Method
+#   Description:
+#       Approximates an initial value problem with a Taylor series method of
+#       any order.  With tol the step size is picked from the last two
+#       coefficients (Jorba and Zou), so smooth problems take very large
+#       steps, and the order is picked from tol unless it is given.  Without
+#       tol every step is h, like the other methods.  func must be built from
+#       arithmetic and the functions in this module, for a scalar y.
+#   Parameters:
+#       func: A given function f(x, y) to evaluate.
+#       x0: Initial x value.
+#       y0: Initial y value.
+#       start: The start point of the interval.
+#       end: The ending point of the interval.
+#       h: The size of each sub-interval, or the largest step when tol is given.
+#       exact: The exact function f(x), or None when it is not known.
+#       dense: If True, also returns the dense-output interpolant, which is
+#              each step's own Taylor polynomial.
+#       order: The order of the method, defaults to about -ln(tol) / 2, or 10
+#              for fixed steps.  At least 2 with tol, and at least 1 without.
+#       tol: The local error wanted on each step, None for fixed steps.
+#       stopLog: If True, also returns why integration stopped.
+#   Output:
+#       xVals: An array that contains the estimated x values.
+#       yVals: An array that contains the estimated y values.
+#       error: An array that contains the difference between the estimated and
+#              exact values, None when exact is None.
+#       interp: Only returned when dense is True.  A function that evaluates the
+#               approximation at a float or an array of points in the interval.
+#       stopLog: Only returned when stopLog is True.  A dictionary with "status",
+#                why integration stopped, like the eventLog of
+#                explicitRungeKutta: "end", "exception" when expanding func
+#                raised (such as log of a series starting at 0), "nonFinite"
+#                when the next y is not finite (such as x**2.5 at x = 0), or
+#                "singular" when the steps shrank to nothing.
+#
+@memoized
+def taylorSeries(func, x0, y0, start, end, h, exact=None, dense=False, order=None, tol=None, stopLog=False):
+    if order is None:
+        order = 10 if tol is None else max(2, math.ceil(-math.log(tol) / 2) + 1)
+
+    #The step from tol uses the last two coefficients, so it needs two.
+    if order < (1 if tol is None else 2):
+        raise ValueError("order must be at least 2 with tol, and at least 1 without")
+
+    if tol is None:
+        steps = [h] * len(np.arange(start, end, h))
+    else:
+        steps = None
+
+    xVals = [x0]
+    yVals = [y0]
+    terms = []
+    x, y = x0, y0
+    status = "end"
+    span = startSpan("taylorSeries", order=order, tol=tol)
+
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        while (steps is not None and len(terms) < len(steps)) or (steps is None and x < end):
+            try:
+                coef = taylorCoefficients(func, x, y, order)
+            except (ZeroDivisionError, OverflowError, ValueError):
+                status = "exception"
+                break
+
+            if steps is not None:
+                step = steps[len(terms)]
+            else:
+                #The step that makes each of the last two terms about tol.
+                step = h
+                for k in (order - 1, order):
+                    if coef[k] != 0:
+                        step = min(step, (tol / abs(coef[k])) ** (1 / k))
+                step = min(step * math.exp(-0.7 / (order - 1)), end - x)
+
+                #Steps shrinking to nothing mean a singularity is just ahead.
+                if step <= 4 * np.finfo(float).eps * max(1, abs(x)):
+                    status = "singular"
+                    break
+
+            #Horner's method for the polynomial, highest term first.
+            yn = 0.0
+            for c in coef[:0:-1]:
+                yn = (yn + c) * step
+            yn += y
+
+            if not math.isfinite(yn):
+                status = "nonFinite"
+                break
+
+            x = x + step
+            y = yn
+            xVals.append(x)
+            yVals.append(y)
+            terms.append(coef[1:] * step ** np.arange(order))
+
+            if span is not None:
+                recordIteration(span, len(terms), {"x": x, "y": y, "h": step}, evaluations=order)
+
+    endSpan(span, reached=x, status=status)
+
+    xVals = np.array(xVals)
+    yVals = np.array(yVals, dtype=float)
+
+    if exact is None:
+        error = None
+    else:
+        #The first entry is signed, matching the other methods.
+        error = np.array([abs(exact(x) - y) for x, y in zip(xVals, yVals)])
+        error[0] = exact(x0) - yVals[0]
+
+    results = [xVals, yVals, error]
+
+    if dense:
+        #As stages, y + h * sum(theta^(k+1) * c_(k+1) * h^k) is the Taylor polynomial.
+        stages = np.array(terms).reshape(len(terms), order)
+        results.append(rungeKuttaInterpolant(xVals, yVals, stages, np.identity(order)))
+
+    if stopLog:
+        results.append({"status": status})
+
+    return tuple(results)
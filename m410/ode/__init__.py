@@ -0,0 +1,26 @@
+# =========================================
+# M 410
+# Group Project 3
+#
+# Authors: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description:  Methods for first-order initial value problems: one-step,
+#               Runge-Kutta, multistep and Taylor series methods, with dense
+#               output, events, streaming to disk, parameter sweeps and
+#               convergence studies.  The functions of TaylorSeries for
+#               series arithmetic (exp, sin, ...) stay in that module.
+# =========================================
+
+from .._lazy import lazyExports
+
+__getattr__, __dir__ = lazyExports(__name__, {
+    ".Methods": ["eulers", "improvedEulers", "midpoint", "rungeKutta", "taylors"],
+    ".RungeKutta": ["makeTableau", "TABLEAUX", "rungeKuttaStep", "rungeKuttaStepInto", "explicitRungeKutta"],
+    ".DenseOutput": ["RK4_DENSE", "hermiteInterpolant", "rungeKuttaInterpolant"],
+    ".Events": ["makeEvent"],
+    ".Multistep": ["adamsWeights", "adamsBashforthMoulton"],
+    ".TaylorSeries": ["Series", "taylorCoefficients", "taylorSeries"],
+    ".Streaming": ["streamRungeKutta", "integrateToFile", "loadStream"],
+    ".Ensemble": ["SUMMARIES", "parameterGrid", "ensembleRun"],
+    ".ConvergenceStudy": ["STUDY_FIELDS", "convergenceStudy", "reportStudy"]
+})
@@ -0,0 +1,14 @@
+# =========================================
+# M 410
+# Group Project 1
+#
+# Authors: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description:  Root finding and fixed-point iteration.
+# =========================================
+
+from .._lazy import lazyExports
+
+__getattr__, __dir__ = lazyExports(__name__, {
+    ".rootFinder": ["newton", "secant", "falsePosition", "fixedPointIteration"]
+})
@@ -0,0 +1,179 @@
+# +--------------------------------------------------------------------------+
+# 
+# Group Project #1 for Numerical Computing S23
+#
+# Team Members: William Franzen, Noah Harbor, Brandon Mitchell, Logan Reed
+#
+# Description: Functions are provided for three different methods of finding
+# the roots of on linear equations.  Each method records its itermediate
+# steps to aid in understanding how they work, and returns them with its
+# answer so the caller can report them.  In addition, a function to find
+# fixed points is also provided.
+#
+# +--------------------------------------------------------------------------+
+
+from ..Instrumentation import startSpan, recordIteration, endSpan
+
+# Max error allowed, lower to get more accuracy, though more steps are needed
+epsilon = 10e-6
+
+
+
+# Netwon's Method
+# Params:
+#   fn: function pointer, the function being tested
+#   der: function pointer, the derivative of fn
+#   initialGuess: float, where the user thinks the root is
+#   maxIterations: int, how many iterations to perform until the root is found
+# Return:
+#   float, the root, or None if maxIterations was reached
+#   dict, the columns "Iteration", "Error" and "Current X" of every step
+# Description:
+#   Uses the Newton-Raphson method to locate the root
+def newton(fn, der, initialGuess, maxIterations = 75):
+    
+    # Ensure error is always larger so while loop is entered
+    error = epsilon + 1
+    x = initialGuess
+    iterations = 0
+    errors = []
+    xs = []
+    span = startSpan("newton", initialGuess=initialGuess)
+    
+    while error > epsilon and iterations < maxIterations:
+        oldX = x
+        x = x - fn(x) / der(x)
+        
+        error = abs(x - oldX)
+        
+        iterations += 1
+        
+        errors.append(error)
+        xs.append(x)
+
+        if span is not None:
+            recordIteration(span, iterations, {"x": x, "error": error}, evaluations=2)
+    
+    endSpan(span, root=x, converged=error <= epsilon)
+    
+    history = {"Iteration": list(range(1, iterations + 1)), "Error": errors, "Current X": xs}
+    
+    if iterations >= maxIterations:
+        return None, history
+    
+    return x, history
+
+
+
+# Secant Method
+# Params:
+#   fn: function pointer, the function being tested
+#   xl: float, the lower bound of the range to search
+#   xu: float, the upper bound of the range to search
+# Return:
+#   float, the root
+#   dict, the columns "Iteration", "Error", "xl" and "xu" of every step
+# Description:
+#   Uses the secant method to find the root located in the range
+#   [xl, xu], runs until the error is less than epsilon
+def secant(fn, xl, xu):
+    error = epsilon + 1
+    iterations = 0
+    history = {"Iteration": [], "Error": [], "xl": [], "xu": []}
+    span = startSpan("secant", xl=xl, xu=xu)
+    
+    while error > epsilon:
+        
+        temp = fn(xu)
+        xr = xu - temp * (xu - xl) / (temp - fn(xl))
+        xl = xu
+        xu = xr
+        
+        error =  abs(xl - xu)
+        
+        iterations += 1
+        
+        for column, value in zip(history.values(), (iterations, error, xl, xu)):
+            column.append(value)
+
+        if span is not None:
+            recordIteration(span, iterations, {"x": xr, "error": error}, evaluations=2)
+
+    endSpan(span, root=xr)
+    return xr, history
+
+
+
+# False Position Method
+# Params:
+#   fn: function pointer, the function being tested
+#   xl: float, the lower bound of the range to search
+#   xu: float, the upper bound of the range to search
+# Return:
+#   float, the root
+#   dict, the columns "Iteration", "Error", "xl" and "xu" of every step
+# Description:
+#   Uses the method of false position to find the root located in the range
+#   [xl, xu], runs until the error is less than epsilon
+def falsePosition(fn, xl, xu):
+    error = epsilon + 1
+    oldxr = 0
+    iterations = 0
+    history = {"Iteration": [], "Error": [], "xl": [], "xu": []}
+    span = startSpan("falsePosition", xl=xl, xu=xu)
+    
+    while error > epsilon:      
+    
+        temp = fn(xu)
+        xr = xu - (temp * (xl - xu) / (fn(xl) - temp))
+        
+        error = abs(xr - oldxr)
+        
+        oldxr = xr
+        
+        if fn(xr) * fn(xl) < 0:
+            xu = xr
+        else:
+            xl = xr
+            
+        iterations += 1
+            
+        for column, value in zip(history.values(), (iterations, error, xl, xu)):
+            column.append(value)
+
+        if span is not None:
+            recordIteration(span, iterations, {"x": xr, "error": error}, evaluations=3)
+           
+    endSpan(span, root=xr)
+    return xr, history
+
+
+
+# Fixed-Point Iteration
+# Params:
+#   fn: function pointer, the function being tested
+#   initialGuess: float, the initial guess value
+#   iterationCount: int, the amount of times to iterate
+# Return:
+#   float, the final fixed point
+#   dict, the columns "Iteration" and "Fixed Point" of every step
+# Description:
+#   Uses fixed point iteration a set amount of times, given a function,
+#   initial guess, and iteration count, Uses a for loop to iterate
+def fixedPointIteration(fn, initialGuess, iterationCount):
+    x = initialGuess
+    points = []
+    span = startSpan("fixedPointIteration", initialGuess=initialGuess)
+
+    for i in range(0, iterationCount):
+        x = fn(x)
+        
+        points.append(x)
+
+        if span is not None:
+            recordIteration(span, i + 1, {"x": x}, evaluations=1)
+    
+    endSpan(span, fixedPoint=x)
+    
+    return x, {"Iteration": list(range(1, iterationCount + 1)), "Fixed Point": points}
+